@@ -1,62 +1,149 @@
 """
 Articles API endpoints - includes Read Later functionality
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence
 from datetime import datetime
-from app.db.database import get_db
-from app.models.models import Article, User, user_saved_articles
+from app.core.config import settings
+from app.db.database import SessionLocal, get_async_db, get_db
+from app.api.pagination import Key, decode_cursor, paginate
+from app.api.responses import fast_response
+from app.models.models import Article, user_saved_articles
 from app.schemas.schemas import Article as ArticleSchema, SaveArticleRequest, SavedArticle
-from app.api.endpoints.auth import get_current_user
+from app.api.endpoints.auth import get_current_principal, get_current_principal_async
+from app.core.principal import Principal
 
+# Save/unsave; the hot reads live on read_router (sync) or async_read_router
+# (DB_ASYNC_MODE), whichever main.py mounts
 router = APIRouter(prefix="/articles", tags=["articles"])
+read_router = APIRouter(prefix="/articles", tags=["articles"])
+async_read_router = APIRouter(prefix="/articles", tags=["articles"])
 
 
-@router.get("/saved", response_model=List[SavedArticle])
+# Only what the response needs; plain rows skip ORM identity-map bookkeeping
+ARTICLE_COLUMNS = [
+    Article.id, Article.title, Article.url, Article.source, Article.category,
+    Article.description, Article.published_date, Article.created_at, Article.metadata_json,
+]
+SAVED_ARTICLE_COLUMNS = ARTICLE_COLUMNS + [user_saved_articles.c.saved_at]
+EXPORT_BATCH_SIZE = 500
+
+
+def saved_articles_statement(user_id: int, limit: int, after: Optional[Key] = None):
+    """A user's saved articles newest first, continuing after a (saved_at, article_id) cursor key"""
+    statement = select(*SAVED_ARTICLE_COLUMNS).join(
+        user_saved_articles,
+        Article.id == user_saved_articles.c.article_id
+    ).where(
+        user_saved_articles.c.user_id == user_id
+    )
+    if after is not None:
+        statement = statement.where(
+            tuple_(user_saved_articles.c.saved_at, user_saved_articles.c.article_id) < after
+        )
+    return statement.order_by(
+        user_saved_articles.c.saved_at.desc(), user_saved_articles.c.article_id.desc()
+    ).limit(limit)
+
+
+def saved_sort_key(row: Row) -> Key:
+    return row.saved_at, row.id
+
+
+def article_statement(article_id: int, columns: Sequence = (Article,)):
+    return select(*columns).where(Article.id == article_id)
+
+
+def is_saved_statement(user_id: int, article_id: int):
+    return select(user_saved_articles.c.article_id).where(
+        user_saved_articles.c.user_id == user_id,
+        user_saved_articles.c.article_id == article_id
+    )
+
+
+def article_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Article not found"
+    )
+
+
+def saved_article_rows(rows: List[Row]) -> List[Dict]:
+    """Format saved article rows for the response"""
+    return [dict(row._mapping, is_saved=True) for row in rows]
+
+
+def export_saved_articles(user_id: int) -> Iterator[bytes]:
+    """
+    NDJSON lines for all of a user's saved articles, fetched in keyset batches
+    on a session of its own (the request's session is gone while streaming).
+    Memory stays at one batch however long the list is.
+    """
+    db = SessionLocal()
+    try:
+        after = None
+        while True:
+            rows = db.execute(saved_articles_statement(user_id, EXPORT_BATCH_SIZE, after)).all()
+            for article in saved_article_rows(rows):
+                yield (json.dumps(article, default=datetime.isoformat) + '\n').encode('utf-8')
+            if len(rows) < EXPORT_BATCH_SIZE:
+                break
+            after = saved_sort_key(rows[-1])
+    finally:
+        db.close()
+
+
+@read_router.get("/saved", response_model=List[SavedArticle])
 def get_saved_articles(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=settings.PAGE_SIZE_MAX),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    """Get all saved articles for the current user"""
-    # Get saved articles with saved_at timestamp
-    saved_articles = db.query(
-        Article,
-        user_saved_articles.c.saved_at
-    ).join(
-        user_saved_articles,
-        Article.id == user_saved_articles.c.article_id
-    ).filter(
-        user_saved_articles.c.user_id == current_user.id
-    ).order_by(
-        user_saved_articles.c.saved_at.desc()
-    ).all()
-    
-    # Format response
-    result = []
-    for article, saved_at in saved_articles:
-        article_dict = {
-            'id': article.id,
-            'title': article.title,
-            'url': article.url,
-            'source': article.source,
-            'category': article.category,
-            'description': article.description,
-            'published_date': article.published_date,
-            'created_at': article.created_at,
-            'is_saved': True,
-            'metadata_json': article.metadata_json,
-            'saved_at': saved_at
-        }
-        result.append(article_dict)
-    
-    return result
+    """
+    Get a page of the current user's saved articles, most recently saved first.
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page.
+    """
+    rows = db.execute(saved_articles_statement(current_user.id, limit + 1, decode_cursor(cursor))).all()
+    articles = saved_article_rows(paginate(rows, limit, saved_sort_key, response))
+    return fast_response(articles, response) if settings.FAST_JSON_RESPONSES else articles
+
+
+@async_read_router.get("/saved", response_model=List[SavedArticle])
+async def get_saved_articles_async(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=settings.PAGE_SIZE_MAX),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of the current user's saved articles (see get_saved_articles)"""
+    rows = (await db.execute(saved_articles_statement(current_user.id, limit + 1, decode_cursor(cursor)))).all()
+    articles = saved_article_rows(paginate(rows, limit, saved_sort_key, response))
+    return fast_response(articles, response) if settings.FAST_JSON_RESPONSES else articles
+
+
+@router.get("/saved/export")
+def export_saved(current_user: Principal = Depends(get_current_principal)):
+    """Stream every saved article as NDJSON (one JSON object per line), for bulk export"""
+    return StreamingResponse(
+        export_saved_articles(current_user.id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="saved-articles.ndjson"'}
+    )
 
 
 @router.post("/save", response_model=dict)
 def save_article(
     request: SaveArticleRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Save an article to the user's Read Later list"""
@@ -96,7 +183,7 @@ def save_article(
 @router.delete("/save/{article_id}", response_model=dict)
 def unsave_article(
     article_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Remove an article from the user's Read Later list"""
@@ -124,26 +211,53 @@ def unsave_article(
     return {"message": "Article removed from saved list", "article_id": article_id}
 
 
-@router.get("/{article_id}", response_model=ArticleSchema)
+@read_router.get("/{article_id}", response_model=ArticleSchema)
 def get_article(
     article_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get a specific article by ID"""
-    article = db.query(Article).filter(Article.id == article_id).first()
+    if settings.FAST_JSON_RESPONSES:
+        row = db.execute(article_statement(article_id, ARTICLE_COLUMNS)).first()
+        if not row:
+            raise article_not_found()
+        saved = db.execute(is_saved_statement(current_user.id, article_id)).first()
+        return fast_response(dict(row._mapping, is_saved=saved is not None))
+    
+    article = db.execute(article_statement(article_id)).scalars().first()
     
     if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found"
-        )
+        raise article_not_found()
     
     # Check if saved by user
-    saved = db.query(user_saved_articles).filter(
-        user_saved_articles.c.user_id == current_user.id,
-        user_saved_articles.c.article_id == article_id
-    ).first()
+    saved = db.execute(is_saved_statement(current_user.id, article_id)).first()
+    
+    article.is_saved = saved is not None
+    
+    return article
+
+
+@async_read_router.get("/{article_id}", response_model=ArticleSchema)
+async def get_article_async(
+    article_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific article by ID"""
+    if settings.FAST_JSON_RESPONSES:
+        row = (await db.execute(article_statement(article_id, ARTICLE_COLUMNS))).first()
+        if not row:
+            raise article_not_found()
+        saved = (await db.execute(is_saved_statement(current_user.id, article_id))).first()
+        return fast_response(dict(row._mapping, is_saved=saved is not None))
+    
+    article = (await db.execute(article_statement(article_id))).scalars().first()
+    
+    if not article:
+        raise article_not_found()
+    
+    saved = (await db.execute(is_saved_statement(current_user.id, article_id))).first()
     
     article.is_saved = saved is not None
     
@@ -3,37 +3,92 @@ Authentication API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from typing import Dict, Optional
+from app.db.database import get_async_db, get_db
 from app.models.models import User
 from app.schemas.schemas import UserCreate, User as UserSchema, Token
-from app.core.security import get_password_hash, verify_password, create_access_token, verify_token
+from starlette.concurrency import run_in_threadpool
+from app.core.security import create_access_token, decode_token, needs_rehash
+from app.core.hashing import hash_password_async, verify_password_async
+from app.core.principal import Principal, principal_cache
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """Get current authenticated user"""
-    credentials_exception = HTTPException(
+def credentials_error() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def user_statement(payload: Dict):
+    """The user a token refers to; tokens carry the user id ("uid"), older tokens only the email"""
+    if payload.get("uid") is not None:
+        return select(User).where(User.id == payload["uid"])
+    return select(User).where(User.email == payload["sub"])
+
+
+def authenticated_principal(token: str, payload: Dict, user: Optional[User]) -> Principal:
+    """Check the token's user and cache it as the principal for this token"""
+    if user is None or user.email != payload["sub"] or not user.is_active:
+        raise credentials_error()
     
-    email = verify_token(token, credentials_exception)
-    user = db.query(User).filter(User.email == email).first()
+    principal = Principal.from_user(user)
+    principal_cache.set(token, principal, payload.get("exp"))
+    return principal
+
+
+def get_current_principal(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    """
+    Get the current authenticated user as a cached Principal.
+    A cache hit needs neither JWT decoding nor a database query.
+    """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+    
+    payload = decode_token(token, credentials_error())
+    user = db.execute(user_statement(payload)).scalars().first()
+    return authenticated_principal(token, payload, user)
+
+
+async def get_current_principal_async(token: str = Depends(oauth2_scheme),
+                                      db: AsyncSession = Depends(get_async_db)) -> Principal:
+    """get_current_principal for async endpoints; a cache miss awaits the lookup instead of holding a thread"""
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+    
+    payload = decode_token(token, credentials_error())
+    user = (await db.execute(user_statement(payload))).scalars().first()
+    return authenticated_principal(token, payload, user)
+
+
+def get_current_user(principal: Principal = Depends(get_current_principal),
+                     db: Session = Depends(get_db)) -> User:
+    """Get current authenticated user as a full ORM row, for endpoints that need one"""
+    user = db.query(User).filter(User.id == principal.id).first()
     
     if user is None:
-        raise credentials_exception
+        raise credentials_error()
     return user
 
 
 @router.post("/register", response_model=UserSchema)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    """Register a new user"""
+async def register(user: UserCreate, db: Session = Depends(get_db)):
+    """
+    Register a new user.
+    Async so the bcrypt hash waits on the hashing pool, not a request thread;
+    database calls still run in the threadpool.
+    """
     # Check if user exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await run_in_threadpool(db.query(User).filter(User.email == user.email).first)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -41,39 +96,48 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await hash_password_async(user.password)
     db_user = User(
         email=user.email,
         hashed_password=hashed_password,
         full_name=user.full_name
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    
+    def save():
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+    
+    await run_in_threadpool(save)
     
     return db_user
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """Login and receive access token"""
     # Authenticate user
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await run_in_threadpool(db.query(User).filter(User.email == form_data.username).first)
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Transparently upgrade hashes made with a different bcrypt cost
+    if needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(form_data.password)
+        await run_in_threadpool(db.commit)
+    
     # Create access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data={"sub": user.email, "uid": user.id})
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.get("/me", response_model=UserSchema)
-def get_me(current_user: User = Depends(get_current_user)):
+def get_me(current_user: Principal = Depends(get_current_principal)):
     """Get current user info"""
     return current_user
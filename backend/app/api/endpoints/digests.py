@@ -1,173 +1,450 @@
 """
 Digest API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set
 from datetime import datetime, date
-from app.db.database import get_db
-from app.models.models import Digest, Article
-from app.schemas.schemas import DigestSummary, DigestWithArticles
-from app.api.endpoints.auth import get_current_user
-from app.services.curation import CurationService
+from app.core.config import settings
+from app.db.database import get_async_db, get_db
+from app.api.pagination import Key, decode_cursor, paginate
+from app.api.responses import fast_response, json_response
+from app.models.models import Digest, Article, CurationJob, user_saved_articles
+from app.schemas.schemas import DigestSummary, DigestWithArticles, DigestV2, CurationJobStatus
+from app.api.endpoints.auth import get_current_principal, get_current_principal_async
+from app.core.principal import Principal
+from app.services.jobs import enqueue_curation
+from app.services.scheduler import edition_at
+from app.services.digest_cache import V2_DEFAULT_FIELDS, V2_FIELDS, compact, get_digest_cache, personalize
 
+# Writes and job status; the hot reads live on read_router (sync) or
+# async_read_router (DB_ASYNC_MODE), whichever main.py mounts. The compact
+# v2 digest shape has its own pair, mounted under API_V2_STR.
 router = APIRouter(prefix="/digests", tags=["digests"])
+read_router = APIRouter(prefix="/digests", tags=["digests"])
+async_read_router = APIRouter(prefix="/digests", tags=["digests"])
+v2_read_router = APIRouter(prefix="/digests", tags=["digests v2"])
+async_v2_read_router = APIRouter(prefix="/digests", tags=["digests v2"])
 
 
-@router.get("/", response_model=List[DigestSummary])
-def get_digests(
-    skip: int = 0,
-    limit: int = 10,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Get list of published digests"""
-    digests = db.query(Digest).filter(
-        Digest.is_published == True
-    ).order_by(
-        Digest.date.desc()
-    ).offset(skip).limit(limit).all()
-    
-    # Add article count for each digest
-    for digest in digests:
-        digest.article_count = db.query(Article).filter(
-            Article.digest_id == digest.id
-        ).count()
-    
-    return digests
-
-
-@router.get("/latest/{edition}", response_model=DigestWithArticles)
-def get_latest_digest(
-    edition: str,
-    background_tasks: BackgroundTasks,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Get the latest digest for morning or evening edition"""
+def check_edition(edition: str) -> None:
     if edition not in ["morning", "evening"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Edition must be 'morning' or 'evening'"
         )
-    
-    digest = db.query(Digest).filter(
+
+
+def current_edition() -> str:
+    """Edition for the current time of day"""
+    return edition_at(datetime.utcnow())
+
+
+def edition_pending(edition: str, job: CurationJob) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"The '{edition}' digest is being created. Please check back in a moment.",
+        headers={"X-Curation-Job-Id": str(job.id)}
+    )
+
+
+def digest_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Digest not found"
+    )
+
+
+def latest_digest_statement(edition: str):
+    return select(Digest).where(
         Digest.edition == edition,
         Digest.is_published == True
     ).order_by(
         Digest.date.desc()
-    ).first()
-    
-    if not digest:
-        # Create a new digest in the background if none exists
-        def run_curation():
-            curation_service = CurationService(db)
-            curation_service.create_digest(edition)
-        
-        background_tasks.add_task(run_curation)
+    ).limit(1)
+
+
+def published_digest_statement(digest_id: int):
+    return select(Digest).where(
+        Digest.id == digest_id,
+        Digest.is_published == True
+    )
+
+
+# DigestSummary's columns, for the fast path's plain rows
+DIGEST_SUMMARY_COLUMNS = [Digest.id, Digest.edition, Digest.date, Digest.is_published]
+
+
+def digest_page_statement(limit: int, after: Optional[Key] = None, skip: int = 0, columns: Sequence = (Digest,)):
+    """Published digests newest first, continuing after a (date, id) cursor key"""
+    statement = select(*columns).where(Digest.is_published == True)
+    if after is not None:
+        statement = statement.where(tuple_(Digest.date, Digest.id) < after)
+    return statement.order_by(
+        Digest.date.desc(), Digest.id.desc()
+    ).offset(skip).limit(limit)
+
+
+def digest_sort_key(digest: Digest) -> Key:
+    return digest.date, digest.id
+
+
+def article_counts_statement(digest_ids: List[int]):
+    return select(Article.digest_id, func.count(Article.id)).where(
+        Article.digest_id.in_(digest_ids)
+    ).group_by(Article.digest_id)
 
+
+def saved_ids_statement(user_id: int, article_ids: List[int]):
+    return select(user_saved_articles.c.article_id).where(
+        user_saved_articles.c.user_id == user_id,
+        user_saved_articles.c.article_id.in_(article_ids)
+    )
+
+
+def article_counts(db: Session, digest_ids: List[int]) -> Dict[int, int]:
+    """Article count per digest, with one grouped query"""
+    if not digest_ids:
+        return {}
+    return dict(db.execute(article_counts_statement(digest_ids)).all())
+
+
+async def article_counts_async(db: AsyncSession, digest_ids: List[int]) -> Dict[int, int]:
+    if not digest_ids:
+        return {}
+    return dict((await db.execute(article_counts_statement(digest_ids))).all())
+
+
+def saved_article_ids(db: Session, user_id: int, article_ids: List[int]) -> Set[int]:
+    """Which of the given articles the user has saved, in one query"""
+    if not article_ids:
+        return set()
+    return set(db.execute(saved_ids_statement(user_id, article_ids)).scalars())
+
+
+async def saved_article_ids_async(db: AsyncSession, user_id: int, article_ids: List[int]) -> Set[int]:
+    if not article_ids:
+        return set()
+    return set((await db.execute(saved_ids_statement(user_id, article_ids))).scalars())
+
+
+def digest_response(db: Session, body: Dict, user: Principal) -> JSONResponse:
+    """Cached digest body with the reader's saved flags merged in (one query)"""
+    saved_ids = saved_article_ids(db, user.id, body_article_ids(body))
+    return json_response(personalize(body, saved_ids))
+
+
+async def digest_response_async(db: AsyncSession, body: Dict, user: Principal) -> JSONResponse:
+    saved_ids = await saved_article_ids_async(db, user.id, body_article_ids(body))
+    return json_response(personalize(body, saved_ids))
+
+
+def parse_fields(fields: Optional[str]) -> Sequence[str]:
+    """v2 article projection from ?fields=title,url,...; id is always included"""
+    if not fields:
+        return V2_DEFAULT_FIELDS
+    requested = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = requested - set(V2_FIELDS)
+    if unknown:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"The '{edition}' digest is being created. Please check back in a moment."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(V2_FIELDS)}"
         )
+    return tuple(field for field in V2_FIELDS if field in requested or field == 'id')
+
+
+def compact_response(body: Dict, saved_ids: Set[int], fields: Sequence[str]) -> JSONResponse:
+    return json_response(compact(body, saved_ids, fields))
+
+
+def body_article_ids(body: Dict) -> List[int]:
+    return [article['id'] for article in body['articles']]
+
+
+def latest_body(db: Session, edition: str) -> Dict:
+    """Cached body of the latest published edition; queues a build (404) if there is none"""
+    check_edition(edition)
+    
+    digest = db.execute(latest_digest_statement(edition)).scalars().first()
+    
+    if not digest:
+        # Queue a build for the worker if none exists; concurrent requests share one job
+        raise edition_pending(edition, enqueue_curation(db, edition))
     
-    # Get articles grouped by category
-    articles = db.query(Article).filter(
-        Article.digest_id == digest.id
-    ).all()
+    return get_digest_cache().get_or_render(db, digest)
+
+
+def published_body(db: Session, digest_id: int) -> Dict:
+    # Only published digests are cached, so a hit needs no digest lookup
+    cache = get_digest_cache()
+    body = cache.get(digest_id)
+    if body is None:
+        digest = db.execute(published_digest_statement(digest_id)).scalars().first()
+        
+        if not digest:
+            raise digest_not_found()
+        
+        body = cache.get_or_render(db, digest)
+    return body
+
+
+async def latest_body_async(db: AsyncSession, edition: str) -> Dict:
+    check_edition(edition)
     
-    # Check which articles are saved by the user
-    saved_article_ids = [sa.id for sa in current_user.saved_articles]
-    for article in articles:
-        article.is_saved = article.id in saved_article_ids
+    digest = (await db.execute(latest_digest_statement(edition))).scalars().first()
     
-    # Group articles by category
-    articles_by_category = {}
-    for article in articles:
-        if article.category not in articles_by_category:
-            articles_by_category[article.category] = []
-        articles_by_category[article.category].append(article)
+    if not digest:
+        # Rare path: reuse the sync job-queue code through the session's greenlet bridge
+        raise edition_pending(edition, await db.run_sync(enqueue_curation, edition))
     
-    digest.articles = articles
-    digest.articles_by_category = articles_by_category
+    cache = get_digest_cache()
+    body = cache.get(digest.id)
+    if body is None:
+        body = await db.run_sync(cache.get_or_render, digest)
+    return body
+
+
+async def published_body_async(db: AsyncSession, digest_id: int) -> Dict:
+    cache = get_digest_cache()
+    body = cache.get(digest_id)
+    if body is None:
+        digest = (await db.execute(published_digest_statement(digest_id))).scalars().first()
+        
+        if not digest:
+            raise digest_not_found()
+        
+        body = await db.run_sync(cache.get_or_render, digest)
+    return body
+
+
+def with_article_counts(digests: List[Digest], counts: Dict[int, int]) -> List[Digest]:
+    for digest in digests:
+        digest.article_count = counts.get(digest.id, 0)
+    return digests
+
+
+def digest_summaries(rows: List[Row], counts: Dict[int, int]) -> List[Dict]:
+    """DigestSummary dicts from DIGEST_SUMMARY_COLUMNS rows"""
+    return [dict(row._mapping, article_count=counts.get(row.id, 0)) for row in rows]
+
+
+@read_router.get("/", response_model=List[DigestSummary])
+def get_digests(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=settings.PAGE_SIZE_MAX),
+    skip: int = Query(0, ge=0, deprecated=True),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a page of published digests, newest first.
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page;
+    skip (OFFSET) is kept for old clients and ignored alongside a cursor.
+    """
+    after = decode_cursor(cursor)
+    skip = 0 if after else skip
+    if settings.FAST_JSON_RESPONSES:
+        rows = db.execute(digest_page_statement(limit + 1, after, skip, DIGEST_SUMMARY_COLUMNS)).all()
+        rows = paginate(rows, limit, digest_sort_key, response)
+        return fast_response(digest_summaries(rows, article_counts(db, [row.id for row in rows])), response)
     
-    return digest
+    digests = db.execute(digest_page_statement(limit + 1, after, skip)).scalars().all()
+    digests = paginate(digests, limit, digest_sort_key, response)
+    return with_article_counts(digests, article_counts(db, [digest.id for digest in digests]))
 
 
-@router.get("/today", response_model=DigestWithArticles)
+@read_router.get("/latest/{edition}", response_model=DigestWithArticles)
+def get_latest_digest(
+    edition: str,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Get the latest digest for morning or evening edition"""
+    return digest_response(db, latest_body(db, edition), current_user)
+
+
+@read_router.get("/today", response_model=DigestWithArticles)
 def get_todays_digest(
-    current_user=Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get the current digest based on time of day"""
-    current_hour = datetime.utcnow().hour
-    
-    # Determine edition based on time (EST is UTC-5)
-    est_hour = (current_hour - 5) % 24
-    edition = "morning" if est_hour < 12 else "evening"
+    return get_latest_digest(current_edition(), current_user, db)
+
+
+@read_router.get("/{digest_id}", response_model=DigestWithArticles)
+def get_digest(
+    digest_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Get a specific digest by ID"""
+    return digest_response(db, published_body(db, digest_id), current_user)
+
+
+@async_read_router.get("/", response_model=List[DigestSummary])
+async def get_digests_async(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=settings.PAGE_SIZE_MAX),
+    skip: int = Query(0, ge=0, deprecated=True),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of published digests, newest first (see get_digests)"""
+    after = decode_cursor(cursor)
+    skip = 0 if after else skip
+    if settings.FAST_JSON_RESPONSES:
+        rows = (await db.execute(digest_page_statement(limit + 1, after, skip, DIGEST_SUMMARY_COLUMNS))).all()
+        rows = paginate(rows, limit, digest_sort_key, response)
+        counts = await article_counts_async(db, [row.id for row in rows])
+        return fast_response(digest_summaries(rows, counts), response)
     
-    return get_latest_digest(edition, current_user, db)
+    digests = (await db.execute(digest_page_statement(limit + 1, after, skip))).scalars().all()
+    digests = paginate(digests, limit, digest_sort_key, response)
+    return with_article_counts(digests, await article_counts_async(db, [digest.id for digest in digests]))
+
+
+@async_read_router.get("/latest/{edition}", response_model=DigestWithArticles)
+async def get_latest_digest_async(
+    edition: str,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the latest digest for morning or evening edition"""
+    return await digest_response_async(db, await latest_body_async(db, edition), current_user)
+
+
+@async_read_router.get("/today", response_model=DigestWithArticles)
+async def get_todays_digest_async(
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the current digest based on time of day"""
+    return await get_latest_digest_async(current_edition(), current_user, db)
+
+
+@async_read_router.get("/{digest_id}", response_model=DigestWithArticles)
+async def get_digest_async(
+    digest_id: int,
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific digest by ID"""
+    return await digest_response_async(db, await published_body_async(db, digest_id), current_user)
+
+
+V2_FIELDS_DOC = f"Comma-separated article fields, from: {', '.join(V2_FIELDS)}"
+
+
+@v2_read_router.get("/latest/{edition}", response_model=DigestV2)
+def get_latest_digest_v2(
+    edition: str,
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Latest digest for an edition, in the compact v2 shape"""
+    projection = parse_fields(fields)
+    body = latest_body(db, edition)
+    return compact_response(body, saved_article_ids(db, current_user.id, body_article_ids(body)), projection)
+
+
+@v2_read_router.get("/today", response_model=DigestV2)
+def get_todays_digest_v2(
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """Current digest based on time of day, in the compact v2 shape"""
+    return get_latest_digest_v2(current_edition(), fields, current_user, db)
+
+
+@v2_read_router.get("/{digest_id}", response_model=DigestV2)
+def get_digest_v2(
+    digest_id: int,
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """A specific digest by ID, in the compact v2 shape"""
+    projection = parse_fields(fields)
+    body = published_body(db, digest_id)
+    return compact_response(body, saved_article_ids(db, current_user.id, body_article_ids(body)), projection)
+
+
+@async_v2_read_router.get("/latest/{edition}", response_model=DigestV2)
+async def get_latest_digest_v2_async(
+    edition: str,
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Latest digest for an edition, in the compact v2 shape"""
+    projection = parse_fields(fields)
+    body = await latest_body_async(db, edition)
+    return compact_response(body, await saved_article_ids_async(db, current_user.id, body_article_ids(body)), projection)
+
+
+@async_v2_read_router.get("/today", response_model=DigestV2)
+async def get_todays_digest_v2_async(
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Current digest based on time of day, in the compact v2 shape"""
+    return await get_latest_digest_v2_async(current_edition(), fields, current_user, db)
+
+
+@async_v2_read_router.get("/{digest_id}", response_model=DigestV2)
+async def get_digest_v2_async(
+    digest_id: int,
+    fields: Optional[str] = Query(None, description=V2_FIELDS_DOC),
+    current_user: Principal = Depends(get_current_principal_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """A specific digest by ID, in the compact v2 shape"""
+    projection = parse_fields(fields)
+    body = await published_body_async(db, digest_id)
+    return compact_response(body, await saved_article_ids_async(db, current_user.id, body_article_ids(body)), projection)
 
 
 @router.post("/create/{edition}", status_code=status.HTTP_202_ACCEPTED)
 def create_digest_manual(
     edition: str,
-    background_tasks: BackgroundTasks,
-    current_user=Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    """Manually trigger digest creation as a background task"""
-    if edition not in ["morning", "evening"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Edition must be 'morning' or 'evening'"
-        )
+    """Manually queue digest creation for the worker process"""
+    check_edition(edition)
     
-    def run_curation():
-        curation_service = CurationService(db)
-        curation_service.create_digest(edition)
-
-    background_tasks.add_task(run_curation)
+    job = enqueue_curation(db, edition)
     
-    return {"message": f"Digest creation for '{edition}' edition started in the background."}
+    return {
+        "message": f"Digest creation for '{edition}' edition started in the background.",
+        "job_id": job.id,
+        "status": job.status
+    }
 
 
-@router.get("/{digest_id}", response_model=DigestWithArticles)
-def get_digest(
-    digest_id: int,
-    current_user=Depends(get_current_user),
+@router.get("/jobs/{job_id}", response_model=CurationJobStatus)
+def get_curation_job(
+    job_id: int,
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    """Get a specific digest by ID"""
-    digest = db.query(Digest).filter(
-        Digest.id == digest_id,
-        Digest.is_published == True
-    ).first()
+    """Get the status of a queued digest build"""
+    job = db.query(CurationJob).filter(CurationJob.id == job_id).first()
     
-    if not digest:
+    if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Digest not found"
+            detail="Job not found"
         )
     
-    # Get articles
-    articles = db.query(Article).filter(
-        Article.digest_id == digest.id
-    ).all()
-    
-    # Check saved status
-    saved_article_ids = [sa.id for sa in current_user.saved_articles]
-    for article in articles:
-        article.is_saved = article.id in saved_article_ids
-    
-    # Group by category
-    articles_by_category = {}
-    for article in articles:
-        if article.category not in articles_by_category:
-            articles_by_category[article.category] = []
-        articles_by_category[article.category].append(article)
-    
-    digest.articles = articles
-    digest.articles_by_category = articles_by_category
-    
-    return digest
+    return job
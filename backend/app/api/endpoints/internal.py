@@ -0,0 +1,49 @@
+"""
+Internal operational endpoints - pool and queue metrics
+
+Only for operators: every endpoint needs the INTERNAL_API_TOKEN setting in an
+X-Internal-Token header, and without the setting the router answers 404.
+"""
+import secrets
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import settings
+from app.core.hashing import get_hashing_executor
+from app.db.database import engine, get_async_engine
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_internal_token or not secrets.compare_digest(x_internal_token, settings.INTERNAL_API_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid internal token"
+        )
+
+
+router = APIRouter(prefix="/internal", tags=["internal"], dependencies=[Depends(require_internal_token)])
+
+
+@router.get("/hashing")
+def hashing_stats():
+    """Password hashing pool: concurrency, queue depth, rejections and timings"""
+    return get_hashing_executor().stats()
+
+
+def pool_status(pool) -> Dict:
+    if hasattr(pool, 'status_dict'):
+        return pool.status_dict()
+    return {'pool': type(pool).__name__, 'status': pool.status()}
+
+
+@router.get("/db-pool")
+def db_pool_stats():
+    """Connection pools of this process: occupancy, checkout waits, timeouts and pings"""
+    async_engine = get_async_engine()
+    return {
+        'sync': pool_status(engine.pool),
+        'async': pool_status(async_engine.sync_engine.pool) if async_engine is not None else None,
+    }
@@ -0,0 +1,52 @@
+"""
+Keyset pagination - opaque cursors over (timestamp, id) sort keys
+
+Lists are ordered newest first by a timestamp with the row id as tie-breaker.
+A page ends with the cursor of its last row, and the next page continues
+strictly after that key, so page cost does not grow with depth the way OFFSET
+does. The next page's cursor is sent in the X-Next-Cursor header, which keeps
+the response bodies unchanged; the header is absent on the last page.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Key = Tuple[datetime, int]
+T = TypeVar('T')
+
+
+def encode_cursor(key: Key) -> str:
+    moment, row_id = key
+    raw = f"{moment.isoformat()}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Key]:
+    """The (timestamp, id) key a cursor continues after; 400 if it is not one of ours"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        moment, row_id = raw.split('|')
+        return datetime.fromisoformat(moment), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], Key], response: Response) -> List[T]:
+    """
+    Trim a limit + 1 row fetch to one page, setting the next-page cursor
+    header when the extra row shows there is more.
+    """
+    page = list(rows[:limit])
+    if len(rows) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(key(page[-1]))
+    return page
@@ -0,0 +1,65 @@
+"""
+Fast JSON responses for the read endpoints (FAST_JSON_RESPONSES)
+
+Returning ORM objects makes FastAPI validate them against response_model
+attribute by attribute, then walk the result again with jsonable_encoder
+before json.dumps. With the fast path on, read endpoints fetch plain rows,
+build the response dicts themselves and encode them in one pass, with orjson
+when it is installed. The schemas stay the contract: response_model still
+documents each endpoint, and benchmarks/bench_fast_json.py checks the fast
+output against them.
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+try:
+    import orjson  # optional dependency
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON; datetimes as ISO 8601, as jsonable_encoder writes them"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response for plain dicts and lists, skipping response_model validation"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """
+    Rows-as-dicts response. FastAPI ignores headers set on an injected
+    Response once the endpoint returns its own, so those (e.g. the next-page
+    cursor) are copied over.
+    """
+    rendered = FastJSONResponse(content=content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ('content-length', 'content-type'):
+                rendered.headers[name] = value
+    return rendered
+
+
+def json_response(content: Any) -> JSONResponse:
+    """Response for already JSON-ready content, on the fast encoder when it is enabled"""
+    if settings.FAST_JSON_RESPONSES:
+        return FastJSONResponse(content=content)
+    return JSONResponse(content=content)
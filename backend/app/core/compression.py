@@ -0,0 +1,165 @@
+"""
+Response compression negotiated from Accept-Encoding - brotli or gzip
+
+Starlette's GZipMiddleware only speaks gzip. Brotli typically shrinks JSON
+by another 15-25%, so it is preferred when the client accepts it and the
+optional brotli package is installed. Streamed responses (the NDJSON export)
+are compressed incrementally, chunk by chunk.
+"""
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # optional dependency
+except ImportError:
+    brotli = None
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Everything compressed so far, so a streamed chunk reaches the client now"""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}, e.g. 'br;q=1.0, gzip;q=0.8, *;q=0'"""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def choose_encoding(header: str, available: List[str]) -> Optional[str]:
+    """Best available coding the client accepts; ties go to our preference order"""
+    accepted = accepted_encodings(header)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses of at least minimum_size bytes"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.available = (['br'] if brotli is not None else []) + ['gzip']
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get('accept-encoding', ''), self.available)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await CompressedResponder(self, encoding, send).run(self.app, scope, receive)
+
+    def encoder(self, encoding: str):
+        if encoding == 'br':
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+
+class CompressedResponder:
+    """One response: decides on the first body message whether to compress"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def run(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.start = message
+            # Already encoded responses pass through untouched
+            self.passthrough = 'content-encoding' in Headers(raw=message['headers'])
+            return
+        if message['type'] != 'http.response.body' or self.passthrough:
+            if self.start is not None:
+                await self.send(self.start)
+                self.start = None
+            await self.send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+        if self.start is not None:
+            await self.begin(body, more_body)
+            return
+        if self.encoder is None:
+            await self.send(message)
+            return
+        data = self.encoder.compress(body) + (self.encoder.flush() if more_body else self.encoder.finish())
+        await self.send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+
+    async def begin(self, body: bytes, more_body: bool) -> None:
+        start, self.start = self.start, None
+        headers = MutableHeaders(raw=start['headers'])
+        if not more_body and len(body) < self.middleware.minimum_size:
+            # Too small to be worth it; still vary so caches key on the header
+            headers.add_vary_header('Accept-Encoding')
+            await self.send(start)
+            await self.send({'type': 'http.response.body', 'body': body, 'more_body': False})
+            return
+
+        self.encoder = self.middleware.encoder(self.encoding)
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+        if more_body:
+            del headers['Content-Length']
+            data = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            data = self.encoder.compress(body) + self.encoder.finish()
+            headers['Content-Length'] = str(len(data))
+        await self.send(start)
+        await self.send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
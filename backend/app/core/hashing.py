@@ -0,0 +1,111 @@
+"""
+Password hashing executor - keeps bcrypt off the request threadpool
+
+bcrypt is deliberately slow. Running it in Starlette's shared threadpool lets
+a burst of logins starve every other sync endpoint, so hashing gets its own
+small pool with a bounded queue. When the queue is full new work is rejected
+(HashingOverloaded -> 503) instead of piling up behind the burst.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class HashingOverloaded(Exception):
+    """Raised when the hashing queue is full"""
+
+
+class HashingExecutor:
+    """Bounded thread pool for CPU-heavy password hashing, with queue-depth metrics"""
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_queue_seen = 0
+        self.total_wait = 0.0
+        self.total_run = 0.0
+
+    async def run(self, fn: Callable, *args):
+        """Run fn(*args) on the hashing pool without blocking the event loop"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HashingOverloaded()
+
+        with self._lock:
+            self.queued += 1
+            self.max_queue_seen = max(self.max_queue_seen, self.queued)
+        submitted = time.perf_counter()
+        future = self._executor.submit(self._call, submitted, fn, *args)
+        # Free the slot when the hash finishes, not when the caller stops waiting:
+        # a cancelled request leaves its job on the pool until it completes
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future) -> None:
+        if future.cancelled():  # Dropped from the queue before it started
+            with self._lock:
+                self.queued -= 1
+        self._slots.release()
+
+    def _call(self, submitted: float, fn: Callable, *args):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.total_wait += started - submitted
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+                self.total_run += time.perf_counter() - started
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'active': self.active,
+                'queued': self.queued,
+                'max_queue_seen': self.max_queue_seen,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_wait_ms': 1000 * self.total_wait / self.completed if self.completed else 0.0,
+                'avg_run_ms': 1000 * self.total_run / self.completed if self.completed else 0.0,
+                'bcrypt_rounds': settings.BCRYPT_ROUNDS,
+            }
+
+
+_hashing_executor: Optional[HashingExecutor] = None
+_hashing_executor_lock = threading.Lock()
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """Process-wide hashing pool"""
+    global _hashing_executor
+    with _hashing_executor_lock:
+        if _hashing_executor is None:
+            _hashing_executor = HashingExecutor(settings.HASHING_MAX_WORKERS, settings.HASHING_MAX_QUEUE)
+        return _hashing_executor
+
+
+async def hash_password_async(password: str) -> str:
+    return await get_hashing_executor().run(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await get_hashing_executor().run(verify_password, plain_password, hashed_password)
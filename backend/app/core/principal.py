@@ -0,0 +1,120 @@
+"""
+Authenticated principal cache - skips the per-request user lookup
+
+A Principal is a small, detached snapshot of the fields endpoints need from
+a User. Principals are cached per access token for a short TTL (never past
+the token's own expiry) and dropped as soon as the user row changes in this
+process; other processes pick the change up when the TTL runs out.
+"""
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models.models import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user, as seen by endpoints"""
+    id: int
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user: User) -> 'Principal':
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+
+def token_key(token: str) -> str:
+    """Cache key for a token, so raw credentials are not kept in memory"""
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class PrincipalCache:
+    """Bounded TTL cache of token -> Principal with per-user invalidation"""
+
+    def __init__(self, ttl: float = 60, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Principal]] = {}
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Principal]:
+        key = token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                self._remove(key, principal.id)
+                return None
+            return principal
+
+    def set(self, token: str, principal: Principal, token_exp: Optional[float] = None) -> None:
+        """Cache a principal; token_exp (unix time) caps the entry's lifetime"""
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        key = token_key(token)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._evict_expired()
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                    self._by_user.clear()
+            self._entries[key] = (time.monotonic() + ttl, principal)
+            self._by_user.setdefault(principal.id, set()).add(key)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Forget every cached token of a user"""
+        with self._lock:
+            for key in self._by_user.pop(user_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def _remove(self, key: str, user_id: int) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key, (expires_at, principal) in list(self._entries.items()):
+            if expires_at < now:
+                self._remove(key, principal.id)
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_TTL)
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_principal(mapper, connection, target: User) -> None:
+    """Deactivated, edited or deleted users lose their cached principal immediately"""
+    principal_cache.invalidate_user(target.id)
@@ -8,23 +8,36 @@ import bcrypt
 from app.core.config import settings
 
 
+def password_bytes(password: str) -> bytes:
+    """Encode a password, truncated to 72 bytes for bcrypt compatibility"""
+    return password.encode('utf-8')[:72]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    return bcrypt.checkpw(password_bytes(plain_password), hashed_password.encode('utf-8'))
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    # Truncate password to 72 bytes for bcrypt compatibility
-    password_bytes = password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-    
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    """Hash a password with the configured bcrypt cost"""
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(password_bytes(password), salt)
     return hashed.decode('utf-8')
 
 
+def hash_cost(hashed_password: str) -> Optional[int]:
+    """bcrypt cost factor of a stored hash ("$2b$12$...")"""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash was made with a different cost than configured"""
+    return hash_cost(hashed_password) != settings.BCRYPT_ROUNDS
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -38,13 +51,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def verify_token(token: str, credentials_exception) -> str:
-    """Verify a JWT token and return the email"""
+def decode_token(token: str, credentials_exception) -> dict:
+    """Verify a JWT token and return its claims; "sub" (email) is required"""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        return email
     except JWTError:
         raise credentials_exception
+    if payload.get("sub") is None:
+        raise credentials_exception
+    return payload
+
+
+def verify_token(token: str, credentials_exception) -> str:
+    """Verify a JWT token and return the email"""
+    return decode_token(token, credentials_exception)["sub"]
@@ -1,13 +1,27 @@
 """
 Database session management
 """
+import threading
+from typing import AsyncIterator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
+from app.db.pool import engine_options, instrument
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+instrument(engine.pool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sync dialect -> asyncio driver used when DB_ASYNC_MODE is on
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgres': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
 
 def get_db() -> Session:
     """
@@ -17,4 +31,60 @@ def get_db() -> Session:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with its driver swapped for the asyncio equivalent"""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    query = dict(parsed.query)
+    if drivername == 'postgresql+asyncpg' and 'sslmode' in query:
+        # asyncpg spells libpq's sslmode as ssl
+        query['ssl'] = query.pop('sslmode')
+    return str(parsed.set(drivername=drivername, query=query))
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[sessionmaker] = None
+_async_lock = threading.Lock()
+
+
+def get_async_session_factory() -> sessionmaker:
+    """
+    Lazily built asyncio engine and session factory, so sync-only
+    deployments never need the async driver installed.
+    """
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        if _async_session_factory is None:
+            url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+            _async_engine = create_async_engine(url, **engine_options(url, is_async=True))
+            instrument(_async_engine.sync_engine.pool)
+            # Loaded rows stay readable after commit; lazy loads are not possible on AsyncSession
+            _async_session_factory = sessionmaker(
+                _async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+            )
+        return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get an asyncio database session
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+def get_async_engine() -> Optional[AsyncEngine]:
+    """The asyncio engine, or None if async mode has not been used in this process"""
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Close the asyncio engine's pooled connections, if it was ever created"""
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        async_engine, _async_engine, _async_session_factory = _async_engine, None, None
+    if async_engine is not None:
+        await async_engine.dispose()
@@ -0,0 +1,50 @@
+"""
+Database readiness probe - reachability without blocking the caller
+
+The check (SELECT 1) runs on a single dedicated thread and its result is
+reused for a short interval. Callers wait at most `timeout`; a check still
+hanging past that (an unreachable host) is awaited again by the next call
+rather than piling up threads.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+class DatabaseProbe:
+    def __init__(self, bind: Engine, timeout: float = 2.0, interval: float = 1.0):
+        self.bind = bind
+        self.timeout = timeout
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-probe')
+        self._pending: Optional[asyncio.Future] = None
+        self._result: Optional[Dict] = None
+        self._checked_at = 0.0
+
+    def _check(self) -> Dict:
+        started = time.perf_counter()
+        try:
+            with self.bind.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            return {'reachable': False, 'error': str(e).strip().splitlines()[0]}
+        return {'reachable': True, 'latency_ms': round((time.perf_counter() - started) * 1000, 1)}
+
+    async def status(self) -> Dict:
+        if self._result is not None and time.monotonic() - self._checked_at < self.interval:
+            return self._result
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().run_in_executor(self._executor, self._check)
+        pending = self._pending
+        try:
+            result = await asyncio.wait_for(asyncio.shield(pending), self.timeout)
+        except asyncio.TimeoutError:
+            return {'reachable': False, 'error': f"no answer within {self.timeout:g}s"}
+        if self._pending is pending:
+            self._pending = None
+            self._result, self._checked_at = result, time.monotonic()
+        return result
@@ -0,0 +1,165 @@
+"""
+Connection pool configuration and instrumentation
+
+Pool sizing comes from settings so it can be tuned per process: every
+uvicorn worker (and the worker/ingest processes) holds its own pool, so the
+database sees up to (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections per process.
+The instrumented pools record how long checkouts wait, how often they time
+out and how pre-pings fare; GET /internal/db-pool exposes the numbers to
+operators holding INTERNAL_API_TOKEN.
+"""
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+
+PRE_PING_STRATEGIES = ('always', 'idle', 'never')
+
+
+class PoolStats:
+    """Counters for one pool, shared across pool re-creation (engine.dispose())"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.connects = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.invalidations = 0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'avg_wait_ms': 1000 * self.total_wait / self.checkouts if self.checkouts else 0.0,
+                'max_wait_ms': 1000 * self.max_wait,
+                'connects': self.connects,
+                'pings': self.pings,
+                'ping_failures': self.ping_failures,
+                'invalidations': self.invalidations,
+            }
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout from the pool queue, including ones that time out"""
+
+    def __init__(self, *args, stats: PoolStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats or PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.increment('timeouts')
+            raise
+        self.stats.record_checkout(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def status_dict(self) -> Dict:
+        return {
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'checked_in': self.checkedin(),
+            'overflow': max(self.overflow(), 0),
+            'max_overflow': self._max_overflow,
+            'timeout': self._timeout,
+            'recycle': self._recycle,
+            **self.stats.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict:
+    """
+    create_engine keyword arguments for a database URL. SQLite keeps
+    SQLAlchemy's default pools, which have no size to tune.
+    """
+    if make_url(url).get_backend_name() == 'sqlite':
+        return {}
+    strategy = settings.DB_POOL_PRE_PING
+    if strategy not in PRE_PING_STRATEGIES:
+        raise ValueError(f"DB_POOL_PRE_PING must be one of {', '.join(PRE_PING_STRATEGIES)}, not {strategy!r}")
+    return {
+        'poolclass': InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': strategy == 'always',
+    }
+
+
+def instrument(pool: Pool) -> None:
+    """
+    Count connects and invalidations, and implement the 'idle' pre-ping
+    strategy: only connections that sat unused longer than
+    DB_POOL_PING_IDLE_SECONDS are pinged on checkout.
+    """
+    if not isinstance(pool, InstrumentedPoolMixin):
+        return
+    stats = pool.stats
+    ping_idle = settings.DB_POOL_PRE_PING == 'idle'
+
+    @event.listens_for(pool, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        stats.increment('connects')
+        connection_record.info['checked_in_at'] = time.monotonic()
+
+    @event.listens_for(pool, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        connection_record.info['checked_in_at'] = time.monotonic()
+
+    @event.listens_for(pool, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment('invalidations')
+
+    if not ping_idle:
+        return
+
+    @event.listens_for(pool, 'checkout')
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        idle = time.monotonic() - connection_record.info.get('checked_in_at', 0.0)
+        if idle < settings.DB_POOL_PING_IDLE_SECONDS:
+            return
+        stats.increment('pings')
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute('SELECT 1')
+            cursor.close()
+        except Exception as e:
+            stats.increment('ping_failures')
+            # The pool discards this connection and retries the checkout with a new one
+            raise exc.DisconnectionError(f"Pre-ping failed: {e}")
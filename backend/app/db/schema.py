@@ -0,0 +1,113 @@
+"""
+Schema setup - an explicit startup step instead of an import side effect
+
+Production applies migrations in the release phase (see the Procfile). Web
+workers can also bring the schema up to date when they start
+(DB_SCHEMA_SETUP). The step runs on a background thread and startup waits at
+most DB_STARTUP_TIMEOUT seconds for it, so a slow or unreachable database
+delays boot by a bounded amount; /ready reports the outcome.
+
+    python -m app.db.schema [migrate|create_all]
+"""
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.database import engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SCHEMA_LOCK_KEY = 0x44494746  # "DIGF"; one migrating process at a time
+
+
+def migrate(bind: Engine) -> None:
+    """alembic upgrade head on this engine; concurrent workers take turns on PostgreSQL"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, 'alembic.ini'))
+    config.set_main_option('script_location', os.path.join(BACKEND_DIR, 'migrations'))
+    with bind.connect() as connection:
+        locked = connection.dialect.name == 'postgresql'
+        if locked:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {'key': SCHEMA_LOCK_KEY})
+        try:
+            config.attributes['connection'] = connection
+            command.upgrade(config, 'head')
+        finally:
+            if locked:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': SCHEMA_LOCK_KEY})
+
+
+def create_all(bind: Engine) -> None:
+    """Tables and indexes straight from the models, without migration history"""
+    from app.models.models import Base
+
+    Base.metadata.create_all(bind=bind)
+
+
+SETUP_MODES = {'migrate': migrate, 'create_all': create_all}
+
+
+def setup_schema(bind: Engine = engine, mode: str = settings.DB_SCHEMA_SETUP) -> None:
+    if mode == 'none':
+        return
+    if mode not in SETUP_MODES:
+        raise ValueError(f"Unknown DB_SCHEMA_SETUP '{mode}'; use migrate, create_all or none")
+    SETUP_MODES[mode](bind)
+
+
+class SchemaSetup:
+    """setup_schema on a background thread; callers wait as long as they choose"""
+
+    def __init__(self, bind: Engine = engine, mode: str = settings.DB_SCHEMA_SETUP):
+        self.bind = bind
+        self.mode = mode
+        self.state = 'skipped' if mode == 'none' else 'pending'
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.state in ('ready', 'skipped')
+
+    def start(self) -> None:
+        """Run (or retry a failed run) unless it is done or already running"""
+        with self._lock:
+            if self.ready or self.state == 'running':
+                return
+            self.state, self.error = 'running', None
+            self._thread = threading.Thread(target=self._run, name='schema-setup', daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: float) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.ready
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            setup_schema(self.bind, self.mode)
+        except Exception as e:
+            self.state, self.error = 'failed', str(e).strip().splitlines()[0]
+            print(f"⚠️  Database schema setup ({self.mode}) failed: {self.error}")
+        else:
+            self.state = 'ready'
+            print(f"✅ Database schema ready ({self.mode})")
+        self.seconds = round(time.perf_counter() - started, 3)
+
+    def status(self) -> Dict:
+        return {'mode': self.mode, 'state': self.state, 'error': self.error, 'seconds': self.seconds}
+
+
+if __name__ == '__main__':
+    setup_schema(mode=sys.argv[1] if len(sys.argv) > 1 else 'migrate')
+    print("✅ Database schema ready")
@@ -1,20 +1,17 @@
 """
 Main FastAPI application
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.db.database import engine
-from app.models.models import Base
-from app.api.endpoints import auth, digests, articles
-
-# Create database tables (with error handling)
-try:
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database connected successfully")
-except Exception as e:
-    print(f"⚠️  Database connection failed: {e}")
-    print("API will run without database functionality")
+from app.db.database import dispose_async_engine, engine
+from app.db.health import DatabaseProbe
+from app.db.schema import SchemaSetup
+from app.api.endpoints import auth, digests, articles, internal
+from app.core.hashing import HashingOverloaded
+from app.core.compression import CompressionMiddleware
+from app.services.scheduler import EditionScheduler
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -32,10 +29,67 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
-# Include routers
+# Compress larger responses with brotli or gzip, as the client accepts
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
+# Include routers; the hot read endpoints come in a sync and an asyncio flavour
+read_routers = (
+    [digests.async_read_router, articles.async_read_router] if settings.DB_ASYNC_MODE
+    else [digests.read_router, articles.read_router]
+)
 app.include_router(auth.router, prefix=settings.API_V1_STR)
+for read_router in read_routers:
+    app.include_router(read_router, prefix=settings.API_V1_STR)
+app.include_router(
+    digests.async_v2_read_router if settings.DB_ASYNC_MODE else digests.v2_read_router,
+    prefix=settings.API_V2_STR
+)
 app.include_router(digests.router, prefix=settings.API_V1_STR)
 app.include_router(articles.router, prefix=settings.API_V1_STR)
+app.include_router(internal.router)
+
+@app.exception_handler(HashingOverloaded)
+def hashing_overloaded_handler(request: Request, exc: HashingOverloaded):
+    """Shed login/registration load instead of queueing it behind a burst"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-in requests, please retry shortly"},
+        headers={"Retry-After": "1"}
+    )
+
+# Nothing touches the database at import; schema setup is a bounded startup step
+schema_setup = SchemaSetup()
+database_probe = DatabaseProbe(engine, timeout=settings.READINESS_TIMEOUT)
+
+# Pre-build editions ahead of their publish hour; only the lock holder actually builds
+edition_scheduler = EditionScheduler() if settings.SCHEDULER_ENABLED else None
+
+@app.on_event("startup")
+def prepare_database():
+    schema_setup.start()
+    if not schema_setup.wait(settings.DB_STARTUP_TIMEOUT):
+        if schema_setup.state == 'running':
+            print(f"⚠️  Database schema setup still running after {settings.DB_STARTUP_TIMEOUT:g}s")
+        print("API will start anyway; /ready reports when the database is usable")
+
+@app.on_event("startup")
+def start_scheduler():
+    if edition_scheduler:
+        edition_scheduler.start()
+
+@app.on_event("shutdown")
+def stop_scheduler():
+    if edition_scheduler:
+        edition_scheduler.stop()
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    await dispose_async_engine()
 
 @app.get("/")
 def root():
@@ -43,8 +97,22 @@ def root():
 
 @app.get("/health")
 def health_check():
+    """Liveness: the process is serving; says nothing about the database"""
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: database reachable and schema set up; waits at most READINESS_TIMEOUT"""
+    database = await database_probe.status()
+    if database['reachable']:
+        # Retry a setup that failed while the database was down
+        schema_setup.start()
+    ready = database['reachable'] and schema_setup.ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not ready", "database": database, "schema": schema_setup.status()}
+    )
+
 @app.options("/{rest_of_path:path}")
 async def preflight_handler(rest_of_path: str):
     """Handle preflight requests"""
@@ -1,7 +1,7 @@
 """
 Database models for The Daily Digest
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Table, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Date, Text, Boolean, ForeignKey, Table, JSON, Float, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -12,9 +12,11 @@ Base = declarative_base()
 user_saved_articles = Table(
     'user_saved_articles',
     Base.metadata,
-    Column('user_id', Integer, ForeignKey('users.id')),
-    Column('article_id', Integer, ForeignKey('articles.id')),
-    Column('saved_at', DateTime, default=datetime.utcnow)
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
+    Column('article_id', Integer, ForeignKey('articles.id'), primary_key=True),
+    Column('saved_at', DateTime, nullable=False, default=datetime.utcnow),
+    # Saved list: a user's rows in (saved_at, article_id) keyset order
+    Index('ix_user_saved_articles_user_saved_at_article', 'user_id', 'saved_at', 'article_id'),
 )
 
 
@@ -44,6 +46,13 @@ class Digest(Base):
     
     # Relationships
     articles = relationship("Article", back_populates="digest")
+    
+    __table_args__ = (
+        # Latest edition: WHERE edition = ? AND is_published ORDER BY date DESC
+        Index('ix_digests_edition_published_date', 'edition', 'is_published', date.desc()),
+        # Digest list: WHERE is_published ORDER BY date DESC, id DESC (keyset pages)
+        Index('ix_digests_published_date_id', 'is_published', date.desc(), id.desc()),
+    )
 
 
 class Article(Base):
@@ -65,3 +74,82 @@ class Article(Base):
     # Relationships
     digest = relationship("Digest", back_populates="articles")
     saved_by_users = relationship("User", secondary=user_saved_articles, back_populates="saved_articles")
+    
+    __table_args__ = (
+        # A digest's articles in id order, and per-digest counts from the index alone
+        Index('ix_articles_digest_id_id', 'digest_id', 'id'),
+    )
+
+
+class FeedState(Base):
+    __tablename__ = "feed_states"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, nullable=False, unique=True)
+    etag = Column(String)
+    last_modified = Column(String)
+    body_hash = Column(String)  # sha256 of the last feed body we parsed
+    last_fetched_at = Column(DateTime)
+    last_status = Column(Integer)  # HTTP status of the last fetch, NULL on network error
+    last_error = Column(Text)
+    
+    # Articles parsed from the last changed body, reused on 304 / identical body
+    entries_json = Column(JSON, default=[])
+
+
+
+class Candidate(Base):
+    """Normalized, scored article waiting in the pool for the next edition"""
+    __tablename__ = "candidates"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    canonical_url = Column(String, nullable=False, unique=True)
+    url = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    categories = Column(JSON, default=[])  # Feed categories the article appeared in
+    description = Column(Text)
+    published_date = Column(DateTime, index=True)
+    author = Column(String)
+    image_url = Column(String)
+    guid = Column(String)
+    quality_score = Column(Float, default=0)
+    first_seen_at = Column(DateTime, default=datetime.utcnow)
+    last_seen_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class SeenItem(Base):
+    """Canonical URL hash or title fingerprint of an article already published"""
+    __tablename__ = "seen_items"
+    
+    key = Column(String, primary_key=True)
+    kind = Column(String, nullable=False)  # "url" or "title"
+    first_seen_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class CurationJob(Base):
+    """Queued digest build, claimed by a worker process"""
+    __tablename__ = "curation_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    edition = Column(String, nullable=False)  # "morning" or "evening"
+    run_date = Column(Date, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # pending, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    run_after = Column(DateTime, default=datetime.utcnow)  # Retry backoff: not claimable before this
+    error = Column(Text)
+    digest_id = Column(Integer, ForeignKey('digests.id'))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)  # Touched by the worker while the build runs
+    finished_at = Column(DateTime)
+    
+    __table_args__ = (
+        # Single flight: at most one pending/running build per edition and date
+        Index(
+            'uq_curation_jobs_active', 'edition', 'run_date', unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+            sqlite_where=text("status IN ('pending', 'running')"),
+        ),
+        Index('ix_curation_jobs_claim', 'status', 'run_after'),
+    )
@@ -2,7 +2,7 @@
 Pydantic schemas for The Daily Digest
 """
 from pydantic import BaseModel, EmailStr
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
 
 
@@ -97,6 +97,34 @@ class DigestWithArticles(DigestBase):
         orm_mode = True
 
 
+class DigestV2(DigestBase):
+    """Compact digest: articles listed once, projected to `fields`"""
+    version: int = 2
+    id: int
+    is_published: bool
+    fields: List[str]
+    articles: List[Dict[str, Any]]
+    categories: Dict[str, List[int]]  # Category -> positions in articles, in display order
+    saved_article_ids: List[int]
+
+
+# Curation job schemas
+class CurationJobStatus(BaseModel):
+    id: int
+    edition: str
+    run_date: date
+    status: str
+    attempts: int
+    error: Optional[str] = None
+    digest_id: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        orm_mode = True
+
+
 # Saved article schemas
 class SaveArticleRequest(BaseModel):
     article_id: int
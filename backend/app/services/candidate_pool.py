@@ -0,0 +1,47 @@
+"""
+Candidate pool reads - the fast selection side of continuous ingestion
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import Candidate
+from app.services.entries import NormalizedEntry
+
+
+def load_candidate_pool(db: Session, max_age_hours: int) -> Optional[List[NormalizedEntry]]:
+    """
+    Normalized entries for every fresh candidate, one per feed category it appeared in.
+    Returns None when the pool is empty or the ingester has stopped refreshing it.
+    """
+    now = datetime.utcnow()
+    latest = db.query(Candidate.last_seen_at).order_by(Candidate.last_seen_at.desc()).first()
+    max_staleness = timedelta(seconds=settings.INGEST_INTERVAL_SECONDS * 3)
+    if latest is None or now - latest[0] > max_staleness:
+        return None
+
+    # Undated entries are kept, as on the crawl path (CurationService.filter_recent)
+    candidates = db.query(Candidate).filter(or_(
+        Candidate.published_date.is_(None),
+        Candidate.published_date >= now - timedelta(hours=max_age_hours),
+    )).order_by(Candidate.id).all()
+
+    articles = []
+    for candidate in candidates:
+        for category in candidate.categories or []:
+            articles.append(NormalizedEntry(
+                title=candidate.title,
+                url=candidate.url,
+                source=candidate.source,
+                category=category,
+                description=candidate.description or '',
+                published_date=candidate.published_date,
+                author=candidate.author or '',
+                image_url=candidate.image_url or '',
+                guid=candidate.guid or '',
+                quality_score=candidate.quality_score or 0.0,
+            ))
+    return articles
@@ -0,0 +1,64 @@
+"""
+Category routing - inverted index from feed categories to PRD categories
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.services.entries import NormalizedEntry
+from app.services.news_sources import CATEGORY_MAPPINGS, NEWS_SOURCES
+
+Fingerprint = Tuple
+
+
+def mappings_fingerprint(mappings: Dict[str, Iterable[str]], sources: Dict[str, Dict]) -> Fingerprint:
+    """Cheap snapshot of the routing configuration, used to detect edits"""
+    return (
+        tuple((prd_category, tuple(categories)) for prd_category, categories in mappings.items()),
+        tuple(sorted({category for config in sources.values() for category in config['categories']})),
+    )
+
+
+class CategoryRouter:
+    """
+    Maps each feed category (e.g. "europe") to the PRD categories it feeds,
+    so articles are routed into per-category buckets in one pass.
+    """
+
+    def __init__(self, mappings: Dict[str, Iterable[str]], sources: Dict[str, Dict]):
+        self.fingerprint = mappings_fingerprint(mappings, sources)
+        self.prd_categories = list(mappings)
+
+        routes: Dict[str, List[str]] = {
+            category: [] for config in sources.values() for category in config['categories']
+        }
+        for prd_category, categories in mappings.items():
+            for category in categories:
+                targets = routes.setdefault(category, [])
+                if prd_category not in targets:
+                    targets.append(prd_category)
+        self.routes: Dict[str, Tuple[str, ...]] = {
+            category: tuple(targets) for category, targets in routes.items()
+        }
+
+    def route(self, articles: Iterable[NormalizedEntry]) -> Dict[str, List[NormalizedEntry]]:
+        """Bucket articles by PRD category, keeping input order within each bucket"""
+        buckets: Dict[str, List[NormalizedEntry]] = {category: [] for category in self.prd_categories}
+        routes = self.routes
+        for article in articles:
+            for prd_category in routes.get(article.category, ()):
+                buckets[prd_category].append(article)
+        return buckets
+
+
+_router: Optional[CategoryRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_category_router() -> CategoryRouter:
+    """Process-wide router, rebuilt only when NEWS_SOURCES or CATEGORY_MAPPINGS change"""
+    global _router
+    fingerprint = mappings_fingerprint(CATEGORY_MAPPINGS, NEWS_SOURCES)
+    with _router_lock:
+        if _router is None or _router.fingerprint != fingerprint:
+            _router = CategoryRouter(CATEGORY_MAPPINGS, NEWS_SOURCES)
+        return _router
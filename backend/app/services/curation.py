@@ -2,211 +2,251 @@
 News curation service - fetches and processes articles from RSS feeds
 """
 import feedparser
-import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, FrozenSet, Iterable
 from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
-from app.models.models import Article, Digest
-from app.services.news_sources import NEWS_SOURCES, CATEGORY_MAPPINGS
+from app.models.models import Digest
+from app.services.news_sources import NEWS_SOURCES, CATEGORY_KEYWORDS
+from app.services.feed_fetcher import FeedFetcher, FeedRequest, FeedResponse, get_feed_fetcher
+from app.services.feed_cache import FeedCache
+from app.services.html_text import html_to_text
+from app.services.dedup import NearDuplicateIndex
+from app.services.keyword_matcher import PAYWALL_TAG, exclude_tag, get_keyword_matcher
+from app.services.candidate_pool import load_candidate_pool
+from app.services.seen_index import article_keys, get_seen_index
+from app.services.entries import NormalizedEntry, entry_date, raw_author, raw_description, raw_image
+from app.services.publishing import save_digest_articles
+from app.services.ranking import RankingEngine
+from app.services.category_router import get_category_router
+from app.services.digest_cache import get_digest_cache
+from app.core.config import settings
 import hashlib
 import re
-from difflib import SequenceMatcher
+
+
+class NothingToPublish(Exception):
+    """Raised when a build finds no unpublished articles; the job fails and retries later"""
 
 
 class CurationService:
     """Service for curating news articles from configured sources"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, fetcher: Optional[FeedFetcher] = None):
         self.db = db
+        self.fetcher = fetcher or get_feed_fetcher()
+        self.keyword_matcher = get_keyword_matcher()
+        self.seen_index = get_seen_index()
+        self.ranker = RankingEngine()
         self.articles_per_category = 15  # Increased for better selection
         self.max_age_hours = 48  # Extended to 48 hours for more content
         self.min_description_length = 50  # Minimum description length
-        self.similarity_threshold = 0.7  # For duplicate detection
+        self.similarity_threshold = 0.6  # Shingle Jaccard similarity for duplicate detection
     
     def create_digest(self, edition: str = "morning") -> Digest:
-        """Create a new digest and populate it with curated articles"""
-        # Create new digest
+        """Create a new digest, populate it with curated articles and publish it in one transaction"""
+        # Assemble from the ingested candidate pool, crawling only when it is unavailable
+        all_articles = None
+        if settings.CANDIDATE_POOL_ENABLED:
+            all_articles = load_candidate_pool(self.db, self.max_age_hours)
+        if all_articles:
+            all_articles = self.drop_seen(all_articles)
+        else:
+            all_articles = self.fetch_all_articles()
+        curated_articles = self.curate_articles(all_articles)
+        if not any(curated_articles.values()):
+            # Everything on offer was already published; an empty edition would be cached and served
+            raise NothingToPublish(f"No unpublished articles for the {edition} digest")
+        
+        # Nothing is visible until the commit, so the digest can be written as published
         digest = Digest(
             edition=edition,
             date=datetime.utcnow(),
-            is_published=False
+            is_published=True
         )
         self.db.add(digest)
-        self.db.commit()
+        self.db.flush()
         
-        # Fetch and curate articles
-        all_articles = self.fetch_all_articles()
-        curated_articles = self.curate_articles(all_articles)
-        
-        # Save articles to database
-        for category, articles in curated_articles.items():
-            for article_data in articles:
-                article = Article(
-                    title=article_data['title'],
-                    url=article_data['url'],
-                    source=article_data['source'],
-                    category=category,
-                    description=article_data.get('description'),
-                    published_date=article_data.get('published_date'),
-                    digest_id=digest.id,
-                    metadata_json={
-                        'author': article_data.get('author'),
-                        'image_url': article_data.get('image_url'),
-                        'quality_score': article_data.get('quality_score', 0)
-                    }
-                )
-                self.db.add(article)
-        
-        # Mark digest as published
-        digest.is_published = True
+        # Save articles to database and remember them so later editions skip them
+        stats = self.save_articles(digest, curated_articles)
+        self.seen_index.record_articles(
+            self.db,
+            [article for articles in curated_articles.values() for article in articles]
+        )
         self.db.commit()
         
+        # Render the body now so the first readers hit a warm cache (shared tier only)
+        get_digest_cache().warm_shared(self.db, digest)
+        
+        print(f"Published {edition} digest {digest.id}: {stats}")
         return digest
     
-    def fetch_all_articles(self) -> List[Dict]:
-        """Fetch articles from all configured RSS feeds"""
-        all_articles = []
+    def save_articles(self, digest: Digest,
+                      curated_articles: Dict[str, List[NormalizedEntry]]) -> Dict[str, int]:
+        """Bulk insert curated articles under the given digest, skipping already-stored URLs"""
+        return save_digest_articles(self.db, digest.id, curated_articles)
+    
+    def fetch_all_articles(self) -> List[NormalizedEntry]:
+        """Fetch articles from all configured RSS feeds concurrently"""
+        feed_requests = [
+            FeedRequest(feed_url, source_name, category)
+            for source_name, source_config in NEWS_SOURCES.items()
+            for category, feed_url in source_config['categories'].items()
+        ]
+        feed_cache = FeedCache(self.db)
+        feed_cache.load(req.url for req in feed_requests)
+        for feed_request in feed_requests:
+            feed_request.headers = feed_cache.conditional_headers(feed_request.url)
         
-        for source_name, source_config in NEWS_SOURCES.items():
-            for category, feed_url in source_config['categories'].items():
-                try:
-                    articles = self.fetch_rss_feed(
-                        feed_url, 
-                        source_name, 
-                        category
-                    )
-                    all_articles.extend(articles)
-                except Exception as e:
-                    print(f"Error fetching {source_name} - {category}: {e}")
-                    continue
+        responses = self.fetcher.fetch_many(feed_requests)
         
+        # Merge in configuration order so curation output is stable
+        all_articles = []
+        for feed_request, response in zip(feed_requests, responses):
+            all_articles.extend(self.process_response(feed_cache, feed_request, response))
+        
+        self.db.commit()
         return all_articles
     
-    def fetch_rss_feed(self, feed_url: str, source: str, category: str) -> List[Dict]:
+    def fetch_rss_feed(self, feed_url: str, source: str, category: str) -> List[NormalizedEntry]:
         """Fetch and parse a single RSS feed"""
+        feed_cache = FeedCache(self.db)
+        feed_cache.load([feed_url])
+        feed_request = FeedRequest(
+            feed_url, source, category,
+            headers=feed_cache.conditional_headers(feed_url)
+        )
+        
+        response = self.fetcher.fetch(feed_url, feed_request.headers)
+        articles = self.process_response(feed_cache, feed_request, response)
+        
+        self.db.commit()
+        return articles
+    
+    def process_response(self, feed_cache: FeedCache, feed_request: FeedRequest,
+                         response: FeedResponse) -> List[NormalizedEntry]:
+        """Turn a fetch response into articles, reusing cached entries for unchanged feeds"""
+        if not response.ok:
+            print(f"Error fetching {feed_request.source} - {feed_request.category}: {response.error}")
+            feed_cache.record_failure(response)
+            return []
+        
+        cached = feed_cache.unchanged_articles(response)
+        if cached is not None:
+            return self.drop_seen(self.filter_recent(cached))
+        
+        articles = self.parse_feed(response, feed_request.source, feed_request.category)
+        feed_cache.store(response, articles)
+        return articles
+    
+    def filter_recent(self, articles: List[NormalizedEntry]) -> List[NormalizedEntry]:
+        """Drop cached articles that have aged past the cutoff since they were parsed"""
+        cutoff_time = datetime.utcnow() - timedelta(hours=self.max_age_hours)
+        return [
+            article for article in articles
+            if not article.published_date or article.published_date >= cutoff_time
+        ]
+    
+    def known_keys(self, keys: Iterable[str]) -> Set[str]:
+        """Seen-index keys that belong to already-published articles"""
+        if self.db is None:
+            return set()
+        return self.seen_index.known_keys(self.db, keys)
+    
+    def drop_seen(self, articles: List[NormalizedEntry]) -> List[NormalizedEntry]:
+        """Remove articles that have already been published in an earlier edition"""
+        keyed = [(article, article_keys(article.url, article.title)) for article in articles]
+        known = self.known_keys(key for _, keys in keyed for key in keys)
+        if not known:
+            return articles
+        return [article for article, keys in keyed if not known.intersection(keys)]
+    
+    def parse_feed(self, response: FeedResponse, source: str, category: str) -> List[NormalizedEntry]:
+        """Parse a fetched feed body into normalized entries"""
         articles = []
         
         try:
-            # Add timeout and user agent
             feed = feedparser.parse(
-                feed_url,
-                agent='The Daily Digest News Aggregator/1.0',
-                timeout=10
+                response.body,
+                response_headers={
+                    'content-location': response.url,
+                    'content-type': response.headers.get('content-type', ''),
+                }
             )
             
             cutoff_time = datetime.utcnow() - timedelta(hours=self.max_age_hours)
             
+            recent_entries = []
             for entry in feed.entries[:30]:  # Increased to 30 for better selection
-                # Parse published date
-                published_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    published_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    published_date = datetime(*entry.updated_parsed[:6])
-                else:
-                    # If no date, assume it's recent
-                    published_date = datetime.utcnow()
+                # If no date, assume it's recent
+                published_date = entry_date(entry) or datetime.utcnow()
                 
                 # Skip very old articles
-                if published_date and published_date < cutoff_time:
+                if published_date < cutoff_time:
                     continue
                 
-                # Check for paywall indicators
-                if self.is_likely_paywalled(entry):
+                title = self.clean_title(entry.get('title', ''))
+                keys = article_keys(entry.get('link', ''), title)
+                recent_entries.append((entry, published_date, title, keys))
+            
+            # Drop already-published stories before paying for cleaning and scoring
+            known = self.known_keys(key for _, _, _, keys in recent_entries for key in keys)
+            
+            for entry, published_date, title, keys in recent_entries:
+                if known.intersection(keys):
                     continue
                 
-                # Clean and extract description
-                description = self.extract_best_description(entry)
+                article = self.normalize_entry(entry, source, category, title, published_date)
                 
-                article = {
-                    'title': self.clean_title(entry.get('title', '')),
-                    'url': entry.get('link', ''),
-                    'source': source,
-                    'category': category,
-                    'description': description,
-                    'published_date': published_date,
-                    'author': self.extract_author(entry),
-                    'guid': entry.get('id', entry.get('link', '')),
-                    'quality_score': self.calculate_quality_score(entry, description)
-                }
-                
-                # Extract image if available
-                article['image_url'] = self.extract_image(entry)
+                # Check for paywall indicators
+                if self.is_likely_paywalled(article):
+                    continue
                 
                 # Only add if meets quality threshold
-                if article['quality_score'] > 0.3:
+                article.quality_score = self.calculate_quality_score(article)
+                if article.quality_score > 0.3:
                     articles.append(article)
                 
         except Exception as e:
-            print(f"Error parsing feed {feed_url}: {e}")
+            print(f"Error parsing feed {response.url}: {e}")
         
         return articles
     
+    def normalize_entry(self, entry, source: str, category: str, title: str,
+                        published_date: datetime) -> NormalizedEntry:
+        """Read every field curation needs from a raw feedparser entry, once"""
+        url = entry.get('link', '')
+        summary = entry.get('summary', '')
+        description = self.extract_best_description(entry)
+        return NormalizedEntry(
+            title=title,
+            url=url,
+            source=source,
+            category=category,
+            description=description,
+            published_date=published_date,
+            has_published_date=bool(entry.get('published_parsed')),
+            author=raw_author(entry),
+            image_url=raw_image(entry),
+            guid=entry.get('id', url),
+            truncated=bool(summary) and len(summary) < 100 and summary.endswith('...'),
+            # One keyword scan yields both paywall and category tags
+            tags=self.keyword_matcher.scan(f"{title} {description}"),
+        )
+    
     def extract_best_description(self, entry) -> str:
         """Extract the best available description from an entry"""
-        # Try multiple fields for description
-        description = ''
-        
-        # Try summary first
-        if hasattr(entry, 'summary') and entry.summary:
-            description = entry.summary
-        # Try content if available
-        elif hasattr(entry, 'content') and entry.content:
-            if isinstance(entry.content, list) and len(entry.content) > 0:
-                description = entry.content[0].get('value', '')
-            else:
-                description = str(entry.content)
-        # Try description field
-        elif hasattr(entry, 'description') and entry.description:
-            description = entry.description
-        
         # Clean HTML and truncate if too long
-        description = self.clean_html(description)
+        description = self.clean_html(raw_description(entry), limit=500)
         if len(description) > 500:
             description = description[:497] + '...'
         
         return description
     
-    def extract_author(self, entry) -> str:
-        """Extract author information from entry"""
-        if hasattr(entry, 'author') and entry.author:
-            return entry.author
-        elif hasattr(entry, 'author_detail') and hasattr(entry.author_detail, 'name'):
-            return entry.author_detail.name
-        elif hasattr(entry, 'dc_creator'):
-            return entry.dc_creator
-        return ''
-    
-    def extract_image(self, entry) -> str:
-        """Extract image URL from entry"""
-        # Try media content
-        if hasattr(entry, 'media_content') and entry.media_content:
-            for media in entry.media_content:
-                if 'image' in media.get('type', '').lower():
-                    return media.get('url', '')
-        
-        # Try media thumbnail
-        if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-            return entry.media_thumbnail[0].get('url', '')
-        
-        # Try enclosures
-        if hasattr(entry, 'enclosures') and entry.enclosures:
-            for enclosure in entry.enclosures:
-                if 'image' in enclosure.get('type', '').lower():
-                    return enclosure.get('href', '')
-        
-        # Try links
-        if hasattr(entry, 'links'):
-            for link in entry.links:
-                if link.get('rel') == 'enclosure' and 'image' in link.get('type', '').lower():
-                    return link.get('href', '')
-        
-        return ''
-    
-    def calculate_quality_score(self, entry, description: str) -> float:
+    def calculate_quality_score(self, article: NormalizedEntry) -> float:
         """Calculate a quality score for the article"""
         score = 0.0
+        description = article.description
         
         # Has substantial description
         if len(description) > self.min_description_length:
@@ -215,20 +255,19 @@ class CurationService:
             score += 0.2
         
         # Has author
-        if self.extract_author(entry):
+        if article.author:
             score += 0.2
         
         # Has image
-        if self.extract_image(entry):
+        if article.image_url:
             score += 0.1
         
         # Has proper date
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        if article.has_published_date:
             score += 0.1
         
         # Title quality
-        title = entry.get('title', '')
-        if len(title) > 20 and len(title) < 200:
+        if len(article.title) > 20 and len(article.title) < 200:
             score += 0.1
         
         return min(score, 1.0)
@@ -242,157 +281,124 @@ class CurationService:
         title = re.sub(r'\s*-\s*[A-Z][a-z]+\s*\d{4}$', '', title)  # Remove "- Month Year"
         return title.strip()
     
-    def curate_articles(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
+    def curate_articles(self, articles: List[NormalizedEntry],
+                        now: Optional[datetime] = None) -> Dict[str, List[NormalizedEntry]]:
         """
         Curate articles by category based on PRD requirements
         Returns dict with categories as keys and article lists as values
         """
         curated = {}
         
-        for prd_category, search_categories in CATEGORY_MAPPINGS.items():
-            category_articles = []
-            
-            for article in articles:
-                # Check if article matches this category
-                if article['category'] in search_categories:
-                    # Apply additional filters for specific categories
-                    if self.matches_category_filter(article, prd_category):
-                        category_articles.append(article)
+        # One reference time, duplicate index and score vector for the whole run
+        now = now or datetime.utcnow()
+        clusters = self.cluster_duplicates(articles)
+        scores = self.ranker.score(articles, clusters, now)
+        position = {id(article): i for i, article in enumerate(articles)}
+        
+        # Route every article to the PRD categories its feed category serves, in one pass
+        buckets = get_category_router().route(articles)
+        
+        for prd_category, routed_articles in buckets.items():
+            # Apply additional filters for specific categories
+            category_articles = [
+                article for article in routed_articles
+                if self.matches_category_filter(article, prd_category)
+            ]
             
             # Remove duplicates and near-duplicates
-            unique_articles = self.remove_duplicates(category_articles)
+            unique_articles = self.remove_duplicates(category_articles, clusters)
             
-            # Sort by quality score and recency
-            unique_articles.sort(
-                key=lambda x: (
-                    x.get('quality_score', 0) * 0.7 +  # 70% weight on quality
-                    (1.0 if x.get('published_date') and 
-                     (datetime.utcnow() - x['published_date']).total_seconds() < 3600 * 6 
-                     else 0.3) * 0.3  # 30% weight on recency (last 6 hours)
-                ),
-                reverse=True
+            # Take top N articles by score
+            top = self.ranker.top_k(
+                scores, [position[id(article)] for article in unique_articles], self.articles_per_category
             )
-            
-            # Take top N articles
-            curated[prd_category] = unique_articles[:self.articles_per_category]
+            curated[prd_category] = [articles[i] for i in top]
         
         return curated
     
-    def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """Remove duplicate and near-duplicate articles"""
+    def cluster_duplicates(self, articles: List[NormalizedEntry]) -> Dict[int, int]:
+        """Map each article (by id) to its near-duplicate cluster"""
+        index = NearDuplicateIndex(threshold=self.similarity_threshold)
+        clusters = {}
+        for article in articles:
+            if id(article) not in clusters:
+                clusters[id(article)] = index.add(article.title, article.description or '')
+        return clusters
+    
+    def remove_duplicates(self, articles: List[NormalizedEntry],
+                          clusters: Optional[Dict[int, int]] = None) -> List[NormalizedEntry]:
+        """
+        Remove duplicate and near-duplicate articles, keeping the first of each cluster.
+        Pass clusters from cluster_duplicates to reuse one index across categories.
+        """
         if not articles:
             return []
+        if clusters is None:
+            clusters = self.cluster_duplicates(articles)
         
         unique = []
-        seen_titles = set()
+        seen_clusters = set()
         seen_urls = set()
         
         for article in articles:
             # Skip if exact URL match
-            if article['url'] in seen_urls:
+            if article.url in seen_urls:
                 continue
             
-            # Check for similar titles
-            is_duplicate = False
-            article_title_lower = article['title'].lower()
-            
-            for seen_title in seen_titles:
-                similarity = SequenceMatcher(None, article_title_lower, seen_title).ratio()
-                if similarity > self.similarity_threshold:
-                    is_duplicate = True
-                    break
+            # Skip if a near-duplicate was already kept
+            cluster = clusters[id(article)]
+            if cluster in seen_clusters:
+                continue
             
-            if not is_duplicate:
-                unique.append(article)
-                seen_titles.add(article_title_lower)
-                seen_urls.add(article['url'])
+            unique.append(article)
+            seen_clusters.add(cluster)
+            seen_urls.add(article.url)
         
         return unique
     
-    def matches_category_filter(self, article: Dict, category: str) -> bool:
+    def matches_category_filter(self, article: NormalizedEntry, category: str) -> bool:
         """Apply category-specific filters"""
-        title_lower = article['title'].lower()
-        desc_lower = (article.get('description') or '').lower()
-        combined = title_lower + ' ' + desc_lower
-        
-        # Country-specific filters
-        if category == "Portugal":
-            keywords = ['portugal', 'portuguese', 'lisbon', 'porto', 'madeira', 'azores']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "Spain":
-            keywords = ['spain', 'spanish', 'madrid', 'barcelona', 'valencia', 'seville', 'españa']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "Germany":
-            keywords = ['germany', 'german', 'berlin', 'munich', 'frankfurt', 'hamburg', 'deutsch']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "Japan":
-            keywords = ['japan', 'japanese', 'tokyo', 'osaka', 'kyoto', 'nippon']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "US to Europe Expat":
-            keywords = ['expat', 'expatriate', 'immigration', 'visa', 'residency', 'moving to',
-                       'relocat', 'american in', 'us citizen', 'tax', 'remote work']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "Apple & Productivity AI":
-            keywords = ['apple', 'mac', 'iphone', 'ipad', 'ios', 'macos', 'app store',
-                       'productivity', 'notion', 'ai tool', 'chatgpt', 'claude', 'copilot',
-                       'automation', 'workflow', 'artificial intelligence']
-            return any(kw in combined for kw in keywords)
-        
-        # Sports require more specific matching
-        elif category == "Soccer":
-            keywords = ['soccer', 'football', 'premier league', 'la liga', 'bundesliga', 
-                       'champions league', 'world cup', 'uefa', 'fifa']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "US Football":
-            keywords = ['nfl', 'football', 'touchdown', 'quarterback', 'super bowl',
-                       'draft', 'yards', 'patriots', 'cowboys', 'chiefs', 'bills']
-            # Exclude soccer/international football
-            exclude = ['soccer', 'premier', 'uefa', 'fifa']
-            return any(kw in combined for kw in keywords) and not any(ex in combined for ex in exclude)
-        
-        elif category == "US Basketball":
-            keywords = ['nba', 'basketball', 'lakers', 'celtics', 'warriors', 'lebron',
-                       'three-pointer', 'dunk', 'playoffs', 'finals']
-            return any(kw in combined for kw in keywords)
-        
-        elif category == "US Baseball":
-            keywords = ['mlb', 'baseball', 'yankees', 'dodgers', 'world series', 
-                       'home run', 'pitcher', 'batting', 'innings']
-            return any(kw in combined for kw in keywords)
+        rule = CATEGORY_KEYWORDS.get(category)
         
         # Default categories don't need additional filtering
-        return True
+        if rule is None:
+            return True
+        
+        tags = self.article_tags(article)
+        return category in tags and exclude_tag(category) not in tags
     
-    def is_likely_paywalled(self, entry) -> bool:
+    def article_tags(self, article: NormalizedEntry) -> FrozenSet[str]:
+        """Keyword tags for an article, scanning its text only if not already tagged"""
+        if article.tags is None:
+            article.tags = self.keyword_matcher.scan(f"{article.title} {article.description or ''}")
+        return article.tags
+    
+    def is_likely_paywalled(self, article: NormalizedEntry) -> bool:
         """Check if an article is likely behind a paywall"""
-        indicators = [
-            'subscriber', 'subscription', 'paywall', 'premium',
-            'exclusive', 'members only', 'sign up to read',
-            'limited access', 'register to continue'
-        ]
-        
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-        
         # Check for paywall indicators
-        for indicator in indicators:
-            if indicator in title or indicator in summary:
-                return True
+        if PAYWALL_TAG in self.article_tags(article):
+            return True
         
         # Check for truncated content (often indicates paywall)
-        if summary and len(summary) < 100 and summary.endswith('...'):
-            return True
+        return article.truncated
+    
+    def clean_html(self, text: str, limit: Optional[int] = None) -> str:
+        """
+        Remove HTML tags and clean text.
+        With a limit, stripping stops once more than `limit` characters are produced.
+        """
+        if not text:
+            return ""
+        
+        cleaned = html_to_text(text, limit)
+        if cleaned is not None:
+            return cleaned
         
-        return False
+        # Malformed markup - fall back to a full BeautifulSoup parse
+        return self.clean_html_soup(text)
     
-    def clean_html(self, text: str) -> str:
-        """Remove HTML tags and clean text"""
+    def clean_html_soup(self, text: str) -> str:
+        """Remove HTML tags and clean text using a full BeautifulSoup tree"""
         if not text:
             return ""
         
@@ -0,0 +1,269 @@
+"""
+Rendered digest cache - serialized, user-independent digest bodies
+
+A published digest never changes, so its article list and category grouping
+are rendered once and cached; requests only merge in the reader's saved
+flags. Lookups go through a bounded in-process LRU tier and, optionally, a
+shared Redis tier (DIGEST_CACHE_BACKEND). Digests are published by the worker
+process, so publish-time warming only reaches readers through the shared tier.
+
+There is no explicit invalidation: every build publishes a new digest (and
+cache key) rather than rewriting an old one, so entries only ever go out of
+use. They age out by TTL - DIGEST_CACHE_LOCAL_TTL for web processes' LRU
+entries, DIGEST_CACHE_REDIS_TTL in Redis - or by LRU eviction.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import Article, Digest
+from app.schemas.schemas import Article as ArticleSchema
+
+
+def digest_key(digest_id: int) -> str:
+    return f"digest:{digest_id}:body"
+
+
+def digest_articles_statement(digest_id: int):
+    return select(Article).where(Article.digest_id == digest_id).order_by(Article.id)
+
+
+def render_digest(db: Session, digest: Digest) -> Dict:
+    """
+    JSON-ready digest body without per-user state. Articles appear once;
+    categories hold indices into the article list.
+    """
+    articles = db.execute(digest_articles_statement(digest.id)).scalars().all()
+
+    categories: Dict[str, List[int]] = {}
+    for position, article in enumerate(articles):
+        categories.setdefault(article.category, []).append(position)
+
+    return {
+        'id': digest.id,
+        'edition': digest.edition,
+        'date': jsonable_encoder(digest.date),
+        'is_published': digest.is_published,
+        'articles': [jsonable_encoder(ArticleSchema.from_orm(article)) for article in articles],
+        'categories': categories,
+    }
+
+
+def personalize(body: Dict, saved_ids: Set[int]) -> Dict:
+    """Response for one reader: the cached body plus their saved flags"""
+    articles = [dict(article, is_saved=article['id'] in saved_ids) for article in body['articles']]
+    return {
+        'id': body['id'],
+        'edition': body['edition'],
+        'date': body['date'],
+        'is_published': body['is_published'],
+        'articles': articles,
+        'articles_by_category': {
+            category: [articles[position] for position in positions]
+            for category, positions in body['categories'].items()
+        },
+    }
+
+
+# v2 article fields; metadata_json is opt-in via projection
+V2_FIELDS = ('id', 'title', 'url', 'source', 'category', 'description', 'published_date', 'created_at',
+             'metadata_json')
+V2_DEFAULT_FIELDS = V2_FIELDS[:-1]
+
+
+def compact(body: Dict, saved_ids: Set[int], fields: Sequence[str] = V2_DEFAULT_FIELDS) -> Dict:
+    """
+    v2 response for one reader: each article once, categories as index lists
+    into the article list, and saved articles as an id list instead of a flag
+    copied into every article.
+    """
+    return {
+        'version': 2,
+        'id': body['id'],
+        'edition': body['edition'],
+        'date': body['date'],
+        'is_published': body['is_published'],
+        'fields': list(fields),
+        'articles': [{field: article[field] for field in fields} for article in body['articles']],
+        'categories': body['categories'],
+        'saved_article_ids': [article['id'] for article in body['articles'] if article['id'] in saved_ids],
+    }
+
+
+class LRUBackend:
+    """Bounded, thread-safe in-process tier; entries also expire after ttl seconds"""
+    shared = False
+
+    def __init__(self, max_entries: int = 64, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Shared tier; bodies are stored as JSON with a TTL"""
+    shared = True
+
+    def __init__(self, url: str, ttl: int = 86400):
+        import redis  # optional dependency, only needed for this tier
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[Dict]:
+        data = self.client.get(key)
+        return json.loads(data) if data is not None else None
+
+    def set(self, key: str, value: Dict) -> None:
+        self.client.set(key, json.dumps(value, separators=(',', ':')), ex=self.ttl)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=digest_key('*')))
+        if keys:
+            self.client.delete(*keys)
+
+
+class FakeBackend:
+    """
+    Redis stand-in for tests and local development: values round-trip
+    through JSON like they do in Redis, but live in a dict.
+    """
+    shared = True
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+
+    def get(self, key: str) -> Optional[Dict]:
+        data = self.data.get(key)
+        return json.loads(data) if data is not None else None
+
+    def set(self, key: str, value: Dict) -> None:
+        self.data[key] = json.dumps(value)
+
+    def clear(self) -> None:
+        self.data.clear()
+
+
+class DigestCache:
+    """
+    Read-through cache over ordered tiers (fastest first). A hit in a lower
+    tier is copied into the tiers above it. Tier errors are logged and treated
+    as misses so a Redis outage only costs a re-render.
+    """
+
+    def __init__(self, tiers: Iterable):
+        self.tiers = list(tiers)
+
+    def get(self, digest_id: int) -> Optional[Dict]:
+        key = digest_key(digest_id)
+        for level, tier in enumerate(self.tiers):
+            try:
+                body = tier.get(key)
+            except Exception as e:
+                print(f"Digest cache read failed ({type(tier).__name__}): {e}")
+                continue
+            if body is not None:
+                for upper in self.tiers[:level]:
+                    self._safe(upper.set, key, body)
+                return body
+        return None
+
+    def set(self, digest_id: int, body: Dict) -> None:
+        key = digest_key(digest_id)
+        for tier in self.tiers:
+            self._safe(tier.set, key, body)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            self._safe(tier.clear)
+
+    def get_or_render(self, db: Session, digest: Digest) -> Dict:
+        """Cached body of a published digest, rendering and caching it on a miss"""
+        body = self.get(digest.id)
+        if body is None:
+            body = render_digest(db, digest)
+            self.set(digest.id, body)
+        return body
+
+    def warm_shared(self, db: Session, digest: Digest) -> bool:
+        """
+        Put a fresh render of the body in the shared tiers; called by the
+        worker when it publishes a digest. The worker's own in-process tier
+        serves no readers, so it is skipped, as is the render when there is no
+        shared tier. Returns whether anything was warmed.
+        """
+        shared = [tier for tier in self.tiers if tier.shared]
+        if not shared:
+            return False
+        key = digest_key(digest.id)
+        body = render_digest(db, digest)
+        for tier in shared:
+            self._safe(tier.set, key, body)
+        return True
+
+    @staticmethod
+    def _safe(operation, *args) -> None:
+        try:
+            operation(*args)
+        except Exception as e:
+            print(f"Digest cache write failed: {e}")
+
+
+def build_digest_cache(backend: str) -> DigestCache:
+    """Tiers for a DIGEST_CACHE_BACKEND value: none, memory, fake or redis"""
+    if backend == 'none':
+        return DigestCache([])
+
+    tiers = [LRUBackend(settings.DIGEST_CACHE_MAX_ENTRIES, settings.DIGEST_CACHE_LOCAL_TTL)]
+    if backend == 'fake':
+        tiers.append(FakeBackend())
+    elif backend == 'redis':
+        try:
+            tiers.append(RedisBackend(settings.REDIS_URL, settings.DIGEST_CACHE_REDIS_TTL))
+        except ImportError:
+            print("⚠️  redis package not installed, digest cache is in-process only")
+    return DigestCache(tiers)
+
+
+_digest_cache: Optional[DigestCache] = None
+_digest_cache_lock = threading.Lock()
+
+
+def get_digest_cache() -> DigestCache:
+    """Process-wide digest cache"""
+    global _digest_cache
+    with _digest_cache_lock:
+        if _digest_cache is None:
+            _digest_cache = build_digest_cache(settings.DIGEST_CACHE_BACKEND)
+        return _digest_cache
@@ -0,0 +1,106 @@
+"""
+Normalized feed entries - the compact record carried through curation
+
+feedparser entries are large FeedParserDict trees with attribute fallbacks.
+Each entry is read once into a NormalizedEntry and the parsed feed is then
+dropped, so scoring, filtering, caching and persistence only ever touch
+these slotted records.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional
+
+
+@dataclass(slots=True)
+class NormalizedEntry:
+    """One candidate article"""
+    title: str
+    url: str
+    source: str
+    category: str
+    description: str = ''
+    published_date: Optional[datetime] = None
+    has_published_date: bool = False  # a real publish date, not updated/assumed
+    author: str = ''
+    image_url: str = ''
+    guid: str = ''
+    truncated: bool = False  # short summary ending in '...', typical of paywalls
+    quality_score: float = 0.0
+    tags: Optional[FrozenSet[str]] = None
+
+    def to_json(self) -> Dict:
+        """JSON-safe dict for storage"""
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        if self.published_date is not None:
+            data['published_date'] = self.published_date.isoformat()
+        if self.tags is not None:
+            data['tags'] = sorted(self.tags)
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'NormalizedEntry':
+        """Restore an entry stored by to_json, ignoring unknown keys"""
+        values = {name: data[name] for name in _FIELD_NAMES if name in data}
+        values.setdefault('title', '')
+        values.setdefault('url', '')
+        values.setdefault('source', '')
+        values.setdefault('category', '')
+        if values.get('published_date'):
+            values['published_date'] = datetime.fromisoformat(values['published_date'])
+        if values.get('tags') is not None:
+            values['tags'] = frozenset(values['tags'])
+        return cls(**values)
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(NormalizedEntry))
+
+
+def entry_date(entry) -> Optional[datetime]:
+    """Publish (or failing that, update) time of a raw feedparser entry"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return datetime(*parsed[:6]) if parsed else None
+
+
+def raw_description(entry) -> str:
+    """Best available description markup of a raw entry: summary, content, then description"""
+    summary = entry.get('summary')
+    if summary:
+        return summary
+    content = entry.get('content')
+    if content:
+        if isinstance(content, list):
+            return content[0].get('value', '')
+        return str(content)
+    return entry.get('description') or ''
+
+
+def raw_author(entry) -> str:
+    """Author of a raw entry"""
+    author = entry.get('author')
+    if author:
+        return author
+    detail = entry.get('author_detail')
+    if detail and detail.get('name'):
+        return detail['name']
+    return entry.get('dc_creator') or ''
+
+
+def raw_image(entry) -> str:
+    """Image URL of a raw entry from media content, thumbnails, enclosures or links"""
+    for media in entry.get('media_content') or ():
+        if 'image' in media.get('type', '').lower():
+            return media.get('url', '')
+
+    thumbnails = entry.get('media_thumbnail')
+    if thumbnails:
+        return thumbnails[0].get('url', '')
+
+    for enclosure in entry.get('enclosures') or ():
+        if 'image' in enclosure.get('type', '').lower():
+            return enclosure.get('href', '')
+
+    for link in entry.get('links') or ():
+        if link.get('rel') == 'enclosure' and 'image' in link.get('type', '').lower():
+            return link.get('href', '')
+
+    return ''
@@ -0,0 +1,111 @@
+"""
+Conditional-GET feed cache - persisted per-feed ETag / Last-Modified / body hash state
+"""
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.models import FeedState
+from app.services.entries import NormalizedEntry
+from app.services.feed_fetcher import FeedResponse
+
+
+def hash_body(body: bytes) -> str:
+    """Stable fingerprint of a feed body"""
+    return hashlib.sha256(body).hexdigest()
+
+
+def serialize_articles(articles: List[NormalizedEntry]) -> List[Dict]:
+    """Make parsed articles JSON-safe for storage"""
+    return [article.to_json() for article in articles]
+
+
+def deserialize_articles(entries: Optional[List[Dict]]) -> List[NormalizedEntry]:
+    """Restore articles stored by serialize_articles"""
+    return [NormalizedEntry.from_json(data) for data in entries or []]
+
+
+class FeedCache:
+    """
+    Loads and updates FeedState rows for a curation run.
+
+    All state is loaded up front in one query and written back by the caller's
+    thread, so fetch workers never touch the database session.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.states: Dict[str, FeedState] = {}
+
+    def load(self, urls: Iterable[str]) -> None:
+        """Load persisted state for the given feed URLs"""
+        urls = list(urls)
+        if not urls:
+            return
+        for state in self.db.query(FeedState).filter(FeedState.url.in_(urls)).all():
+            self.states[state.url] = state
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validators to send with the next request for this feed"""
+        state = self.states.get(url)
+        headers = {}
+        if state is None:
+            return headers
+        if state.etag:
+            headers['If-None-Match'] = state.etag
+        if state.last_modified:
+            headers['If-Modified-Since'] = state.last_modified
+        return headers
+
+    def unchanged_articles(self, response: FeedResponse) -> Optional[List[NormalizedEntry]]:
+        """
+        Previously parsed articles if the feed has not changed, otherwise None.
+        A feed is unchanged on 304 Not Modified or when the body hash matches.
+        """
+        state = self.states.get(response.url)
+        if state is None or state.entries_json is None:
+            return None
+
+        unchanged = (
+            response.status == 304
+            or (state.body_hash is not None and state.body_hash == hash_body(response.body))
+        )
+        if not unchanged:
+            return None
+
+        if response.status != 304:
+            # Same body under new validators (e.g. a rotated ETag): keep them current
+            # or every later request sends stale ones and never gets a 304
+            state.etag = response.headers.get('etag')
+            state.last_modified = response.headers.get('last-modified')
+        self._touch(state, response)
+        return deserialize_articles(state.entries_json)
+
+    def store(self, response: FeedResponse, articles: List[NormalizedEntry]) -> None:
+        """Record a changed feed body and the articles parsed from it"""
+        state = self._get_or_create(response.url)
+        state.etag = response.headers.get('etag')
+        state.last_modified = response.headers.get('last-modified')
+        state.body_hash = hash_body(response.body)
+        state.entries_json = serialize_articles(articles)
+        self._touch(state, response)
+
+    def record_failure(self, response: FeedResponse) -> None:
+        """Record a failed fetch without discarding the cached entries"""
+        state = self._get_or_create(response.url)
+        self._touch(state, response)
+
+    def _touch(self, state: FeedState, response: FeedResponse) -> None:
+        state.last_fetched_at = datetime.utcnow()
+        state.last_status = response.status
+        state.last_error = response.error
+
+    def _get_or_create(self, url: str) -> FeedState:
+        state = self.states.get(url)
+        if state is None:
+            state = FeedState(url=url)
+            self.db.add(state)
+            self.states[url] = state
+        return state
@@ -0,0 +1,180 @@
+"""
+Concurrent RSS feed fetching - bounded worker pool with per-host limits and keep-alive pooling
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+
+USER_AGENT = 'The Daily Digest News Aggregator/1.0'
+
+
+class FeedRequest:
+    """A single feed to be fetched"""
+
+    def __init__(self, url: str, source: str, category: str, headers: Optional[Dict[str, str]] = None):
+        self.url = url
+        self.source = source
+        self.category = category
+        self.headers = headers or {}
+
+
+class FeedResponse:
+    """Outcome of fetching a single feed"""
+
+    def __init__(self, url: str, status: Optional[int] = None, body: bytes = b'',
+                 headers: Optional[Dict[str, str]] = None, error: Optional[str] = None,
+                 elapsed: float = 0.0):
+        self.url = url
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FeedFetcher:
+    """
+    Fetches feeds concurrently over a shared keep-alive session.
+
+    A global worker cap bounds total concurrency, a per-host semaphore keeps us
+    polite towards sources with several feeds, and an overall deadline bounds
+    the whole fetch phase so one hanging feed cannot stall a digest build.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        self.max_workers = max_workers or settings.FEED_FETCH_MAX_WORKERS
+        self.per_host_limit = per_host_limit or settings.FEED_FETCH_PER_HOST
+        self.timeout = timeout or settings.FEED_FETCH_TIMEOUT
+        self.deadline = deadline or settings.FEED_FETCH_DEADLINE
+        self.session = session or self._build_session()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        """Create a session whose connection pools are sized to the concurrency caps"""
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.per_host_limit,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None,
+              expires_at: Optional[float] = None) -> FeedResponse:
+        """Fetch a single feed, honouring the per-host limit and an optional absolute deadline"""
+        started = time.monotonic()
+        slot = self._host_slot(url)
+
+        wait_budget = None if expires_at is None else max(expires_at - started, 0)
+        if not slot.acquire(timeout=wait_budget):
+            return FeedResponse(url, error='deadline exceeded waiting for host slot')
+
+        try:
+            timeout = self.timeout
+            if expires_at is not None:
+                timeout = min(timeout, max(expires_at - time.monotonic(), 0.1))
+
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            if response.status_code >= 400:
+                return FeedResponse(
+                    url,
+                    status=response.status_code,
+                    error=f"HTTP {response.status_code}",
+                    elapsed=time.monotonic() - started,
+                )
+
+            return FeedResponse(
+                url,
+                status=response.status_code,
+                body=response.content,
+                headers={k.lower(): v for k, v in response.headers.items()},
+                elapsed=time.monotonic() - started,
+            )
+        except requests.RequestException as e:
+            return FeedResponse(url, error=str(e), elapsed=time.monotonic() - started)
+        finally:
+            slot.release()
+
+    def fetch_many(self, feed_requests: List[FeedRequest]) -> List[FeedResponse]:
+        """
+        Fetch all feeds concurrently.
+        Responses are returned in the same order as the requests, so callers
+        merge results deterministically regardless of completion order.
+        """
+        if not feed_requests:
+            return []
+
+        expires_at = time.monotonic() + self.deadline
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(feed_requests)),
+            thread_name_prefix='feed-fetch',
+        )
+        try:
+            futures = [
+                executor.submit(self.fetch, req.url, req.headers, expires_at)
+                for req in feed_requests
+            ]
+            wait(futures, timeout=self.deadline)
+
+            responses = []
+            for req, future in zip(feed_requests, futures):
+                if future.done():
+                    error = future.exception()
+                    if error is not None:
+                        responses.append(FeedResponse(req.url, error=str(error)))
+                    else:
+                        responses.append(future.result())
+                else:
+                    future.cancel()
+                    responses.append(FeedResponse(req.url, error='deadline exceeded'))
+            return responses
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_default_fetcher: Optional[FeedFetcher] = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_feed_fetcher() -> FeedFetcher:
+    """Process-wide fetcher so keep-alive connections are reused across curation runs"""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            session = None
+            if settings.FEED_REPLAY_DIR:
+                # Serve recorded fixtures instead of hitting the network
+                from app.services.feed_fixtures import build_replay_session
+                session = build_replay_session(settings.FEED_REPLAY_DIR)
+            _default_fetcher = FeedFetcher(session=session)
+        return _default_fetcher
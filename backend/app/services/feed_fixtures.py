@@ -0,0 +1,140 @@
+"""
+Offline feed fixtures - record raw feed bodies and replay them through the fetcher
+
+Record a snapshot of every configured feed:
+    python -m app.services.feed_fixtures record fixtures/feeds
+
+Replay it by setting FEED_REPLAY_DIR=fixtures/feeds, or by passing
+FeedFetcher(session=build_replay_session(path)) to CurationService.
+"""
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.services.feed_fetcher import FeedFetcher, FeedRequest, USER_AGENT
+from app.services.news_sources import NEWS_SOURCES
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def fixture_filename(url: str) -> str:
+    """File name a feed URL is stored under"""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16] + '.xml'
+
+
+def load_manifest(fixture_dir: str) -> Dict[str, Dict]:
+    """Load the url -> fixture metadata manifest"""
+    path = os.path.join(fixture_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_fixtures(fixture_dir: str, fetcher: Optional[FeedFetcher] = None) -> Dict[str, Dict]:
+    """Fetch every NEWS_SOURCES feed once and snapshot the raw bodies"""
+    fetcher = fetcher or FeedFetcher()
+    os.makedirs(fixture_dir, exist_ok=True)
+
+    feed_requests = [
+        FeedRequest(feed_url, source_name, category)
+        for source_name, source_config in NEWS_SOURCES.items()
+        for category, feed_url in source_config['categories'].items()
+    ]
+    responses = fetcher.fetch_many(feed_requests)
+
+    manifest = load_manifest(fixture_dir)
+    for feed_request, response in zip(feed_requests, responses):
+        if not response.ok:
+            print(f"Skipping {feed_request.source} - {feed_request.category}: {response.error}")
+            continue
+
+        filename = fixture_filename(response.url)
+        with open(os.path.join(fixture_dir, filename), 'wb') as f:
+            f.write(response.body)
+
+        manifest[response.url] = {
+            'file': filename,
+            'source': feed_request.source,
+            'category': feed_request.category,
+            'content_type': response.headers.get('content-type', 'application/xml'),
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'recorded_at': datetime.utcnow().isoformat(),
+        }
+
+    with open(os.path.join(fixture_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    requests transport adapter serving recorded feed bodies from disk.
+    Unknown URLs get a 404, and recorded validators are honoured so the
+    conditional-GET path can be exercised offline too.
+    """
+
+    def __init__(self, fixture_dir: str):
+        super().__init__()
+        self.fixture_dir = fixture_dir
+        self.manifest = load_manifest(fixture_dir)
+
+    def send(self, request, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict()
+
+        entry = self.manifest.get(request.url)
+        if entry is None:
+            response.status_code = 404
+            response._content = b''
+            return response
+
+        etag = entry.get('etag')
+        if etag and request.headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+            response.headers['ETag'] = etag
+            return response
+
+        with open(os.path.join(self.fixture_dir, entry['file']), 'rb') as f:
+            response._content = f.read()
+        response.status_code = 200
+        response.headers['Content-Type'] = entry.get('content_type', 'application/xml')
+        if etag:
+            response.headers['ETag'] = etag
+        if entry.get('last_modified'):
+            response.headers['Last-Modified'] = entry['last_modified']
+        return response
+
+    def close(self):
+        pass
+
+
+def build_replay_session(fixture_dir: str) -> requests.Session:
+    """Session that answers every http(s) request from the fixture directory"""
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter = ReplayAdapter(fixture_dir)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] != 'record':
+        print("usage: python -m app.services.feed_fixtures record <fixture_dir>")
+        sys.exit(2)
+
+    recorded = record_fixtures(sys.argv[2])
+    print(f"Recorded {len(recorded)} feeds into {sys.argv[2]}")
@@ -0,0 +1,92 @@
+"""
+Streaming HTML-to-text stripper built on the stdlib html.parser
+"""
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+SKIPPED_TAGS = {'script', 'style'}
+
+# Markup that survived parsing means html.parser gave up on part of the input
+_LEFTOVER_MARKUP = re.compile(r'<(?:[a-zA-Z][a-zA-Z0-9]*[\s/>]|/[a-zA-Z]|!--)')
+
+# Only ASCII whitespace collapses; &nbsp; stays \xa0 inside text, as with BeautifulSoup
+_ASCII_SPACE = ' \t\n\r\f\v'
+_ASCII_SPACE_RUN = re.compile(f'[{_ASCII_SPACE}]+')
+
+
+class _LimitReached(Exception):
+    pass
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text with whitespace collapsed as it streams"""
+
+    def __init__(self, limit: Optional[int]):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.parts: List[str] = []
+        self.length = 0
+        self.skip_depth = 0
+        self.pending_space = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def unknown_decl(self, data):
+        if data.startswith('CDATA['):
+            self.handle_data(data[len('CDATA['):])
+
+    def handle_data(self, data):
+        if self.skip_depth or not data:
+            return
+
+        if data[0] in _ASCII_SPACE:
+            self.pending_space = True
+        words = [word for word in _ASCII_SPACE_RUN.split(data) if word]
+        if not words:
+            return
+
+        if self.pending_space and self.length:
+            self.parts.append(' ')
+            self.length += 1
+        chunk = ' '.join(words)
+        self.parts.append(chunk)
+        self.length += len(chunk)
+        self.pending_space = data[-1] in _ASCII_SPACE
+
+        if self.limit is not None and self.length > self.limit:
+            raise _LimitReached()
+
+
+def html_to_text(text: str, limit: Optional[int] = None) -> Optional[str]:
+    """
+    Strip tags, drop script/style contents, decode entities and collapse whitespace.
+    Non-breaking spaces inside the text are kept, matching the BeautifulSoup path.
+
+    Parsing stops as soon as more than `limit` characters of text have been
+    produced, so callers truncating to `limit` never pay for the rest of the
+    document. Returns None when the markup is too malformed for html.parser,
+    letting the caller fall back to a full tree parser.
+    """
+    if not text:
+        return ''
+
+    extractor = _TextExtractor(limit)
+    try:
+        extractor.feed(text)
+        extractor.close()
+    except _LimitReached:
+        pass
+    except Exception:
+        return None
+
+    result = ''.join(extractor.parts).strip()
+    if _LEFTOVER_MARKUP.search(result):
+        return None
+    return result
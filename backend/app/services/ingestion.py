@@ -0,0 +1,113 @@
+"""
+Continuous ingestion - polls feeds and upserts scored candidates into the pool
+
+Run as its own process:
+    python -m app.services.ingestion
+"""
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.models import Candidate
+from app.services.curation import CurationService
+from app.services.entries import NormalizedEntry
+from app.services.urls import canonicalize_url
+
+
+class IngestionService:
+    """Keeps the candidate pool fresh so editions are assembled, not fetched"""
+
+    def __init__(self, db: Session, curation: Optional[CurationService] = None):
+        self.db = db
+        self.curation = curation or CurationService(db)
+
+    def ingest_once(self) -> Dict[str, int]:
+        """Fetch every feed once and upsert the resulting candidates"""
+        articles = self.curation.fetch_all_articles()
+        stats = self.upsert_candidates(articles)
+        stats['pruned'] = self.prune_candidates()
+        self.db.commit()
+        return stats
+
+    def upsert_candidates(self, articles: List[NormalizedEntry]) -> Dict[str, int]:
+        """Insert new candidates and refresh existing ones, keyed by canonical URL"""
+        now = datetime.utcnow()
+
+        by_key: Dict[str, NormalizedEntry] = {}
+        feed_categories: Dict[str, List[str]] = {}
+        for article in articles:
+            key = canonicalize_url(article.url)
+            if not key:
+                continue
+            by_key.setdefault(key, article)
+            categories = feed_categories.setdefault(key, [])
+            if article.category not in categories:
+                categories.append(article.category)
+
+        if not by_key:
+            return {'inserted': 0, 'updated': 0}
+
+        existing = {
+            candidate.canonical_url: candidate
+            for candidate in self.db.query(Candidate).filter(
+                Candidate.canonical_url.in_(list(by_key))
+            ).all()
+        }
+
+        inserted = updated = 0
+        for key, article in by_key.items():
+            candidate = existing.get(key)
+            if candidate is None:
+                candidate = Candidate(canonical_url=key, first_seen_at=now, categories=[])
+                self.db.add(candidate)
+                inserted += 1
+            else:
+                updated += 1
+
+            candidate.url = article.url
+            candidate.title = article.title
+            candidate.source = article.source
+            candidate.categories = sorted(set(candidate.categories or []) | set(feed_categories[key]))
+            candidate.description = article.description
+            candidate.published_date = article.published_date
+            candidate.author = article.author
+            candidate.image_url = article.image_url
+            candidate.guid = article.guid
+            candidate.quality_score = article.quality_score
+            candidate.last_seen_at = now
+
+        return {'inserted': inserted, 'updated': updated}
+
+    def prune_candidates(self) -> int:
+        """Drop candidates too old to ever be selected again, and expired seen-index entries"""
+        cutoff = datetime.utcnow() - timedelta(hours=self.curation.max_age_hours)
+        self.curation.seen_index.prune(self.db)
+        return self.db.query(Candidate).filter(
+            Candidate.published_date < cutoff
+        ).delete(synchronize_session=False)
+
+
+def run_forever(interval: Optional[int] = None) -> None:
+    """Poll feeds on a fixed interval until the process is stopped"""
+    interval = interval or settings.INGEST_INTERVAL_SECONDS
+    while True:
+        started = time.monotonic()
+        db = SessionLocal()
+        try:
+            stats = IngestionService(db).ingest_once()
+            print(f"Ingestion run finished in {time.monotonic() - started:.1f}s: {stats}")
+        except Exception as e:
+            db.rollback()
+            print(f"Ingestion run failed: {e}")
+        finally:
+            db.close()
+
+        time.sleep(max(interval - (time.monotonic() - started), 0))
+
+
+if __name__ == '__main__':
+    run_forever()
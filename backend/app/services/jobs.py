@@ -0,0 +1,132 @@
+"""
+Curation job queue - digest builds run by worker processes, not web workers
+
+Jobs live in the curation_jobs table. Workers claim them with
+SELECT ... FOR UPDATE SKIP LOCKED, so any number of workers can poll the same
+table without double-claiming. A partial unique index keeps at most one
+pending or running build per edition and date (single flight). A running
+job's worker keeps its heartbeat_at current; only a job whose heartbeat has
+stopped is treated as abandoned.
+
+run_date keys single flight and the retry; it does not pick the content.
+Builds assemble whatever the candidate pool and feeds hold when they run
+(feeds only serve current items), so a retried job publishes the current
+news for its edition rather than a reconstruction of its original date.
+"""
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import CurationJob
+
+ACTIVE_STATUSES = ('pending', 'running')
+
+
+def active_job(db: Session, edition: str, run_date: date) -> Optional[CurationJob]:
+    """The pending or running build for an edition and date, if any"""
+    return db.query(CurationJob).filter(
+        CurationJob.edition == edition,
+        CurationJob.run_date == run_date,
+        CurationJob.status.in_(ACTIVE_STATUSES),
+    ).first()
+
+
+def enqueue_curation(db: Session, edition: str, run_date: Optional[date] = None) -> CurationJob:
+    """
+    Queue a digest build, or return the one already queued for this edition and date.
+    Concurrent callers race on the unique index; the losers get the winner's job.
+    run_date defaults to today in edition time, as the scheduler queues it.
+    """
+    from app.services.scheduler import edition_date  # the scheduler imports this module
+
+    run_date = run_date or edition_date()
+    job = active_job(db, edition, run_date)
+    if job is not None:
+        return job
+
+    job = CurationJob(edition=edition, run_date=run_date, status='pending', run_after=datetime.utcnow())
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        job = active_job(db, edition, run_date)
+        if job is None:  # finished between the insert and the lookup
+            return enqueue_curation(db, edition, run_date)
+    return job
+
+
+def claim_next_job(db: Session) -> Optional[CurationJob]:
+    """Lock and mark the oldest runnable job as running, skipping rows other workers hold"""
+    now = datetime.utcnow()
+    job = db.query(CurationJob).filter(
+        CurationJob.status == 'pending',
+        CurationJob.run_after <= now,
+    ).order_by(CurationJob.run_after, CurationJob.id).with_for_update(skip_locked=True).first()
+    if job is None:
+        db.rollback()
+        return None
+
+    job.status = 'running'
+    job.attempts += 1
+    job.started_at = now
+    job.heartbeat_at = now
+    db.commit()
+    return job
+
+
+def heartbeat(db: Session, job_id: int) -> bool:
+    """Mark a running job as still alive; False once it is no longer running"""
+    touched = db.query(CurationJob).filter(
+        CurationJob.id == job_id,
+        CurationJob.status == 'running',
+    ).update({CurationJob.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return touched > 0
+
+
+def finish_job(db: Session, job: CurationJob, digest_id: int) -> None:
+    job.status = 'succeeded'
+    job.digest_id = digest_id
+    job.error = None
+    job.finished_at = datetime.utcnow()
+    db.commit()
+
+
+def record_failure(job: CurationJob, error: str) -> None:
+    """Re-queue a failed attempt with exponential backoff while attempts remain, else mark it failed"""
+    job.error = error
+    if job.attempts < settings.CURATION_MAX_ATTEMPTS:
+        delay = settings.CURATION_RETRY_BACKOFF_SECONDS * (2 ** (job.attempts - 1))
+        job.status = 'pending'
+        job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+    else:
+        job.status = 'failed'
+        job.finished_at = datetime.utcnow()
+
+
+def fail_job(db: Session, job: CurationJob, error: str) -> None:
+    record_failure(job, error)
+    db.commit()
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """
+    Handle jobs whose worker died mid-build (crash, OOM kill) as failed
+    attempts, so a build that keeps killing workers stops at the retry cap.
+    A job counts as abandoned once its heartbeat is older than
+    JOB_TIMEOUT_SECONDS; slow builds with a live worker are left alone.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_TIMEOUT_SECONDS)
+    stale = db.query(CurationJob).filter(
+        CurationJob.status == 'running',
+        func.coalesce(CurationJob.heartbeat_at, CurationJob.started_at) < cutoff,
+    ).with_for_update(skip_locked=True).all()
+    for job in stale:
+        record_failure(job, f"Worker stopped responding (no heartbeat for {settings.JOB_TIMEOUT_SECONDS}s)")
+    db.commit()
+    return len(stale)
@@ -0,0 +1,73 @@
+"""
+Single-pass multi-keyword matcher for category filters and paywall detection
+"""
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Set
+
+from app.services.news_sources import CATEGORY_KEYWORDS, PAYWALL_INDICATORS
+
+PAYWALL_TAG = 'paywall'
+
+
+def exclude_tag(category: str) -> str:
+    """Tag emitted when one of a category's exclude keywords matches"""
+    return f"exclude:{category}"
+
+
+class KeywordMatcher:
+    """
+    Matches every keyword of a rule table in one scan of the text.
+
+    The keywords are compiled into a single alternation inside a lookahead, so
+    the regex engine tries every start position once and reports the longest
+    keyword starting there. Shorter keywords that are substrings of a matched
+    one are folded in through a precomputed closure, which keeps the result
+    identical to checking `keyword in text` for every keyword.
+    """
+
+    def __init__(self, rules: Dict[str, Iterable[str]]):
+        keyword_tags: Dict[str, Set[str]] = {}
+        for tag, keywords in rules.items():
+            for keyword in keywords:
+                keyword_tags.setdefault(keyword.lower(), set()).add(tag)
+
+        self._tags_for: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset(
+                tag
+                for other, tags in keyword_tags.items() if other in keyword
+                for tag in tags
+            )
+            for keyword in keyword_tags
+        }
+
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(keyword_tags, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))") if keyword_tags else None
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Every tag whose keywords occur in text"""
+        if not text or self._pattern is None:
+            return frozenset()
+
+        tags: Set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            tags.update(self._tags_for[match.group(1)])
+        return frozenset(tags)
+
+
+def build_rules() -> Dict[str, Iterable[str]]:
+    """Flatten the keyword tables from news_sources into tag -> keywords"""
+    rules: Dict[str, Iterable[str]] = {PAYWALL_TAG: PAYWALL_INDICATORS}
+    for category, rule in CATEGORY_KEYWORDS.items():
+        rules[category] = rule.get('include', [])
+        if rule.get('exclude'):
+            rules[exclude_tag(category)] = rule['exclude']
+    return rules
+
+
+@lru_cache(maxsize=1)
+def get_keyword_matcher() -> KeywordMatcher:
+    """Matcher compiled once per process from the configured keyword tables"""
+    return KeywordMatcher(build_rules())
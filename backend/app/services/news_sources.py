@@ -8,6 +8,7 @@ NEWS_SOURCES = {
         "name": "BBC News",
         "base_url": "https://www.bbc.com",
         "specialization": "Global news leader with comprehensive international coverage",
+        "weight": 1.0,  # Relative editorial weight used in ranking
         "categories": {
             "international": "http://feeds.bbci.co.uk/news/world/rss.xml",
             "technology": "http://feeds.bbci.co.uk/news/technology/rss.xml",
@@ -18,6 +19,7 @@ NEWS_SOURCES = {
         "name": "Reuters",
         "base_url": "https://www.reuters.com",
         "specialization": "Breaking news and financial markets",
+        "weight": 1.0,
         "categories": {
             "international": "https://www.reutersagency.com/feed/?best-topics=international",
             "technology": "https://www.reutersagency.com/feed/?best-topics=tech",
@@ -28,6 +30,7 @@ NEWS_SOURCES = {
         "name": "Associated Press",
         "base_url": "https://apnews.com",
         "specialization": "Fact-based, unbiased reporting",
+        "weight": 1.0,
         "categories": {
             "international": "https://apnews.com/apf-intlnews/feed",
             "technology": "https://apnews.com/apf-technology/feed",
@@ -39,6 +42,7 @@ NEWS_SOURCES = {
         "name": "France 24",
         "base_url": "https://www.france24.com",
         "specialization": "European and international perspective",
+        "weight": 1.0,
         "categories": {
             "international": "https://www.france24.com/en/rss",
             "europe": "https://www.france24.com/en/europe/rss",
@@ -49,6 +53,7 @@ NEWS_SOURCES = {
         "name": "DW",
         "base_url": "https://www.dw.com",
         "specialization": "German and European news",
+        "weight": 1.0,
         "categories": {
             "international": "https://rss.dw.com/rdf/rss-en-all",
             "europe": "https://rss.dw.com/rdf/rss-en-eu",
@@ -59,6 +64,7 @@ NEWS_SOURCES = {
         "name": "elDiario.es",
         "base_url": "https://www.eldiario.es",
         "specialization": "Spanish independent journalism",
+        "weight": 1.0,
         "categories": {
             "spain": "https://www.eldiario.es/rss/",
             "international": "https://www.eldiario.es/internacional/rss",
@@ -69,6 +75,7 @@ NEWS_SOURCES = {
         "name": "Ars Technica",
         "base_url": "https://arstechnica.com",
         "specialization": "In-depth tech news, Apple, AI",
+        "weight": 1.0,
         "categories": {
             "apple": "http://feeds.arstechnica.com/arstechnica/apple",
             "ai": "https://arstechnica.com/ai/feed/",
@@ -79,6 +86,7 @@ NEWS_SOURCES = {
         "name": "9to5Mac",
         "base_url": "https://9to5mac.com",
         "specialization": "Dedicated Apple and Mac news",
+        "weight": 1.0,
         "categories": {
             "apple": "https://9to5mac.com/feed/",
         }
@@ -98,3 +106,56 @@ CATEGORY_MAPPINGS = {
     "US Sports": ["sports"],  # Will filter for US Football, Basketball, Baseball
     "Expat/Immigration": ["europe", "international"]  # Will filter for expat content
 }
+
+
+# Keyword rules for PRD category filters - an article must mention one of the
+# include keywords and none of the exclude keywords (case-insensitive substrings)
+CATEGORY_KEYWORDS = {
+    "Portugal": {
+        "include": ['portugal', 'portuguese', 'lisbon', 'porto', 'madeira', 'azores'],
+    },
+    "Spain": {
+        "include": ['spain', 'spanish', 'madrid', 'barcelona', 'valencia', 'seville', 'españa'],
+    },
+    "Germany": {
+        "include": ['germany', 'german', 'berlin', 'munich', 'frankfurt', 'hamburg', 'deutsch'],
+    },
+    "Japan": {
+        "include": ['japan', 'japanese', 'tokyo', 'osaka', 'kyoto', 'nippon'],
+    },
+    "US to Europe Expat": {
+        "include": ['expat', 'expatriate', 'immigration', 'visa', 'residency', 'moving to',
+                    'relocat', 'american in', 'us citizen', 'tax', 'remote work'],
+    },
+    "Apple & Productivity AI": {
+        "include": ['apple', 'mac', 'iphone', 'ipad', 'ios', 'macos', 'app store',
+                    'productivity', 'notion', 'ai tool', 'chatgpt', 'claude', 'copilot',
+                    'automation', 'workflow', 'artificial intelligence'],
+    },
+    # Sports require more specific matching
+    "Soccer": {
+        "include": ['soccer', 'football', 'premier league', 'la liga', 'bundesliga',
+                    'champions league', 'world cup', 'uefa', 'fifa'],
+    },
+    "US Football": {
+        "include": ['nfl', 'football', 'touchdown', 'quarterback', 'super bowl',
+                    'draft', 'yards', 'patriots', 'cowboys', 'chiefs', 'bills'],
+        # Exclude soccer/international football
+        "exclude": ['soccer', 'premier', 'uefa', 'fifa'],
+    },
+    "US Basketball": {
+        "include": ['nba', 'basketball', 'lakers', 'celtics', 'warriors', 'lebron',
+                    'three-pointer', 'dunk', 'playoffs', 'finals'],
+    },
+    "US Baseball": {
+        "include": ['mlb', 'baseball', 'yankees', 'dodgers', 'world series',
+                    'home run', 'pitcher', 'batting', 'innings'],
+    },
+}
+
+# Phrases in a title or summary that suggest the article is behind a paywall
+PAYWALL_INDICATORS = [
+    'subscriber', 'subscription', 'paywall', 'premium',
+    'exclusive', 'members only', 'sign up to read',
+    'limited access', 'register to continue'
+]
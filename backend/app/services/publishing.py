@@ -0,0 +1,76 @@
+"""
+Digest publishing - bulk persistence of a digest's articles
+"""
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.models import Article
+from app.services.entries import NormalizedEntry
+
+articles_table = Article.__table__
+
+
+def article_rows(digest_id: int, curated_articles: Dict[str, List[NormalizedEntry]]) -> List[Dict]:
+    """Insert rows for a digest's articles, dropping URLs repeated across categories"""
+    now = datetime.utcnow()
+    rows = []
+    seen_urls = set()
+    for category, articles in curated_articles.items():
+        for entry in articles:
+            if entry.url in seen_urls:
+                continue
+            seen_urls.add(entry.url)
+            rows.append({
+                'title': entry.title,
+                'url': entry.url,
+                'source': entry.source,
+                'category': category,
+                'description': entry.description,
+                'published_date': entry.published_date,
+                'digest_id': digest_id,
+                'created_at': now,
+                'metadata_json': {
+                    'author': entry.author,
+                    'image_url': entry.image_url,
+                    'quality_score': entry.quality_score
+                },
+            })
+    return rows
+
+
+def insert_articles(db: Session, rows: List[Dict]) -> int:
+    """
+    Insert article rows in one statement, skipping URLs that are already stored.
+    Returns the number of rows actually inserted.
+    """
+    if not rows:
+        return 0
+
+    if db.get_bind().dialect.name == 'postgresql':
+        # Multi-row INSERT ... ON CONFLICT (url) DO NOTHING; RETURNING lists only new rows
+        stmt = pg_insert(articles_table).values(rows).on_conflict_do_nothing(
+            index_elements=['url']
+        ).returning(articles_table.c.id)
+        return len(db.execute(stmt).fetchall())
+
+    # Other dialects: filter known URLs with one query, then a single executemany
+    existing = {
+        url for (url,) in db.query(Article.url).filter(
+            Article.url.in_([row['url'] for row in rows])
+        ).all()
+    }
+    new_rows = [row for row in rows if row['url'] not in existing]
+    if new_rows:
+        db.execute(articles_table.insert(), new_rows)
+    return len(new_rows)
+
+
+def save_digest_articles(db: Session, digest_id: int,
+                         curated_articles: Dict[str, List[NormalizedEntry]]) -> Dict[str, int]:
+    """Bulk insert a digest's articles, reporting inserted and skipped counts"""
+    total = sum(len(articles) for articles in curated_articles.values())
+    inserted = insert_articles(db, article_rows(digest_id, curated_articles))
+    return {'inserted': inserted, 'skipped': total - inserted}
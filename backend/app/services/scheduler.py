@@ -0,0 +1,205 @@
+"""
+Edition scheduler - queues each digest edition ahead of its publish hour
+
+Each edition's build is queued CURATION_LEAD_MINUTES before
+MORNING_CURATION_HOUR / EVENING_CURATION_HOUR (edition time, i.e.
+EDITION_UTC_OFFSET_HOURS) and run by the worker
+process, which retries it with exponential backoff on failure.
+Every web worker may start the scheduler; a PostgreSQL advisory lock elects
+a single leader so an edition is only queued once.
+
+Runs inside the API process (SCHEDULER_ENABLED) or on its own:
+    python -m app.services.scheduler
+"""
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.models.models import CurationJob, Digest
+from app.services.jobs import enqueue_curation
+
+# Arbitrary application-wide key for pg_try_advisory_lock
+SCHEDULER_LOCK_KEY = 0x44494745  # "DIGE"
+
+
+def edition_offset() -> timedelta:
+    """Offset from UTC of the clock the publish hours are given in"""
+    return timedelta(hours=settings.EDITION_UTC_OFFSET_HOURS)
+
+
+def edition_date(now: Optional[datetime] = None) -> date:
+    """
+    Edition-time calendar date of `now` (naive UTC, default the current time).
+    Every caller keys curation jobs by it, so scheduled and on-demand builds
+    of the same edition share one single-flight job.
+    """
+    return ((now or datetime.utcnow()) + edition_offset()).date()
+
+
+def edition_at(now: datetime) -> str:
+    """
+    Edition readers get at `now` (naive UTC): morning from its publish hour
+    until the evening one, evening otherwise. Matches the schedule below, so
+    /today switches over only once the new edition has been pre-built.
+    """
+    hour = (now + edition_offset()).hour
+    if settings.MORNING_CURATION_HOUR <= hour < settings.EVENING_CURATION_HOUR:
+        return 'morning'
+    return 'evening'
+
+
+class LeaderLock:
+    """
+    Session-level PostgreSQL advisory lock held on a dedicated connection.
+    Other dialects have no cross-process lock, so the caller is always leader.
+    """
+
+    def __init__(self, bind: Engine, key: int = SCHEDULER_LOCK_KEY):
+        self.bind = bind
+        self.key = key
+        self.connection: Optional[Connection] = None
+
+    def acquire(self) -> bool:
+        """Try to become (or confirm still being) the leader without blocking"""
+        if self.bind.dialect.name != 'postgresql':
+            return True
+
+        if self.connection is not None:
+            try:
+                self.connection.execute(text("SELECT 1"))
+                return True
+            except Exception:
+                # Connection lost, and the lock with it
+                self.release()
+
+        connection = self.bind.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {'key': self.key}
+            ).scalar()
+        except Exception:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self.connection = connection
+        return True
+
+    def release(self) -> None:
+        if self.connection is None:
+            return
+        try:
+            self.connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': self.key})
+        except Exception:
+            pass
+        finally:
+            self.connection.close()
+            self.connection = None
+
+
+class EditionScheduler:
+    """Queues each edition once per day inside its lead window"""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 lock: Optional[LeaderLock] = None,
+                 now: Callable[[], datetime] = datetime.utcnow):
+        self.session_factory = session_factory
+        self.lock = lock or LeaderLock(engine)
+        self.now = now
+        self.publish_hours: Dict[str, int] = {
+            'morning': settings.MORNING_CURATION_HOUR,
+            'evening': settings.EVENING_CURATION_HOUR,
+        }
+        self.lead = timedelta(minutes=settings.CURATION_LEAD_MINUTES)
+        self.poll_seconds = 60
+        self._stop = threading.Event()
+
+    def publish_time(self, edition: str, day: datetime) -> datetime:
+        """Publish time (naive UTC) of the edition on the edition-time day containing `day`"""
+        local = (day + edition_offset()).replace(hour=self.publish_hours[edition], minute=0, second=0, microsecond=0)
+        return local - edition_offset()
+
+    def due_editions(self, now: datetime) -> List[Tuple[str, datetime]]:
+        """
+        (edition, build_at) pairs whose build window is open: from `lead` before
+        the publish hour until the next occurrence of that edition.
+        """
+        due = []
+        for edition in self.publish_hours:
+            for day in (now - timedelta(days=1), now):
+                build_at = self.publish_time(edition, day) - self.lead
+                if build_at <= now < build_at + timedelta(days=1):
+                    due.append((edition, build_at))
+        return due
+
+    def next_build_at(self, now: datetime) -> datetime:
+        """Earliest upcoming build time of any edition"""
+        upcoming = []
+        for edition in self.publish_hours:
+            build_at = self.publish_time(edition, now) - self.lead
+            upcoming.append(build_at if build_at > now else build_at + timedelta(days=1))
+        return min(upcoming)
+
+    def is_scheduled(self, db: Session, edition: str, build_at: datetime) -> bool:
+        """Whether this window already has a published digest or a queued/attempted build"""
+        built = db.query(Digest.id).filter(
+            Digest.edition == edition,
+            Digest.is_published == True,
+            Digest.date >= build_at,
+        ).first()
+        if built is not None:
+            return True
+        return db.query(CurationJob.id).filter(
+            CurationJob.edition == edition,
+            CurationJob.created_at >= build_at,
+        ).first() is not None
+
+    def run_pending(self) -> None:
+        """Queue every due edition not yet built or queued, if this process is leader"""
+        if not self.lock.acquire():
+            return
+
+        now = self.now()
+        db = self.session_factory()
+        try:
+            for edition, build_at in self.due_editions(now):
+                if self.is_scheduled(db, edition, build_at):
+                    continue
+                publish_at = build_at + self.lead
+                job = enqueue_curation(db, edition, edition_date(publish_at))
+                print(f"Queued {edition} digest build as job {job.id} (publishes at {publish_at:%H:%M} UTC)")
+        finally:
+            db.close()
+
+    def run_forever(self) -> None:
+        """Check for due editions until stopped, sleeping until the next build time"""
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"Scheduler check failed: {e}")
+            now = self.now()
+            wait = (self.next_build_at(now) - now).total_seconds()
+            # Wake up periodically so a lost leader lock is picked up by another process
+            self._stop.wait(min(max(wait, 1), self.poll_seconds))
+        self.lock.release()
+
+    def start(self) -> threading.Thread:
+        """Run the scheduler on a daemon thread"""
+        thread = threading.Thread(target=self.run_forever, name='edition-scheduler', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+if __name__ == '__main__':
+    EditionScheduler().run_forever()
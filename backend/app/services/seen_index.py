@@ -0,0 +1,181 @@
+"""
+Seen-article index - skips already-published stories at the ingestion edge
+
+Published articles are recorded as canonical-URL hashes and title fingerprints
+in the seen_items table. A process-wide Bloom filter fronts the table so the
+common case (a new article) is answered in memory; only Bloom hits are
+confirmed against the database, in one batched query. Several processes may
+publish, so each check first pulls in keys recorded since the last one, and
+recording ignores keys another process has already stored.
+"""
+import hashlib
+import math
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.models import SeenItem
+from app.services.entries import NormalizedEntry
+from app.services.urls import canonicalize_url
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+# Refreshes re-read this far back, for rows committed after later-stamped ones
+REFRESH_OVERLAP = timedelta(minutes=10)
+INSERT_BATCH = 300  # rows per multi-row INSERT (3 parameters each)
+
+
+def url_key(url: str) -> Optional[str]:
+    """Hash of the canonical form of an article URL"""
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return None
+    return 'u:' + hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def title_key(title: str) -> Optional[str]:
+    """Fingerprint of a title that ignores case, punctuation and spacing"""
+    words = _WORD.findall(title.lower())
+    if len(words) < 4:  # too short to identify a story on its own
+        return None
+    return 't:' + hashlib.blake2b(' '.join(words).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def article_keys(url: str, title: str) -> List[str]:
+    """Every seen-index key identifying an article"""
+    return [key for key in (url_key(url), title_key(title)) if key]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenIndex:
+    """Bloom-fronted view of the seen_items table"""
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity or settings.SEEN_INDEX_CAPACITY
+        self.bloom = BloomFilter(self.capacity)
+        self.loaded_until: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def refresh(self, db: Session) -> None:
+        """
+        Stream stored keys into the Bloom filter: all of them the first time,
+        then only those recorded since (by any process), via the
+        first_seen_at index.
+        """
+        with self._lock:
+            query = db.query(SeenItem.key, SeenItem.first_seen_at)
+            if self.loaded_until is not None:
+                query = query.filter(SeenItem.first_seen_at >= self.loaded_until - REFRESH_OVERLAP)
+            latest = self.loaded_until
+            for key, first_seen_at in query.yield_per(10000):
+                self.bloom.add(key)
+                if first_seen_at is not None and (latest is None or first_seen_at > latest):
+                    latest = first_seen_at
+            self.loaded_until = latest
+
+    def known_keys(self, db: Session, keys: Iterable[str]) -> Set[str]:
+        """The subset of keys that belong to already-published articles"""
+        self.refresh(db)
+        maybe = list({key for key in keys if key in self.bloom})
+        if not maybe:
+            return set()
+        return {
+            key for (key,) in db.query(SeenItem.key).filter(SeenItem.key.in_(maybe)).all()
+        }
+
+    def record(self, db: Session, items: Iterable[Tuple[str, str]]) -> int:
+        """
+        Insert (key, kind) pairs for newly published articles in the session's
+        transaction, skipping keys that are already stored - possibly by
+        another process this filter has not caught up with yet. Returns the
+        number of rows inserted.
+        """
+        pending = {}
+        for key, kind in items:
+            pending.setdefault(key, kind)
+        if not pending:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [{'key': key, 'kind': kind, 'first_seen_at': now} for key, kind in pending.items()]
+        dialect = db.get_bind().dialect.name
+        if dialect in ('postgresql', 'sqlite'):
+            # INSERT ... ON CONFLICT (key) DO NOTHING
+            insert = pg_insert if dialect == 'postgresql' else sqlite_insert
+            added = 0
+            for start in range(0, len(rows), INSERT_BATCH):
+                stmt = insert(SeenItem.__table__).values(rows[start:start + INSERT_BATCH])
+                added += db.execute(stmt.on_conflict_do_nothing(index_elements=['key'])).rowcount
+        else:
+            existing = self.known_keys(db, pending)
+            rows = [row for row in rows if row['key'] not in existing]
+            if rows:
+                db.execute(SeenItem.__table__.insert(), rows)
+            added = len(rows)
+
+        for key in pending:
+            self.bloom.add(key)
+        return added
+
+    def record_articles(self, db: Session, articles: Iterable[NormalizedEntry]) -> int:
+        """Record the URL and title keys of published articles"""
+        items = []
+        for article in articles:
+            key = url_key(article.url)
+            if key:
+                items.append((key, 'url'))
+            key = title_key(article.title)
+            if key:
+                items.append((key, 'title'))
+        return self.record(db, items)
+
+    def prune(self, db: Session, retention_days: Optional[int] = None) -> int:
+        """
+        Forget items older than the retention window. Their Bloom bits stay set
+        until the next process restart, which only costs a confirming query.
+        """
+        retention_days = retention_days or settings.SEEN_INDEX_RETENTION_DAYS
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        return db.query(SeenItem).filter(
+            SeenItem.first_seen_at < cutoff
+        ).delete(synchronize_session=False)
+
+
+_seen_index: Optional[SeenIndex] = None
+_seen_index_lock = threading.Lock()
+
+
+def get_seen_index() -> SeenIndex:
+    """Process-wide seen index so the Bloom filter is built once"""
+    global _seen_index
+    with _seen_index_lock:
+        if _seen_index is None:
+            _seen_index = SeenIndex()
+        return _seen_index
@@ -0,0 +1,51 @@
+"""
+URL normalization helpers
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'xtor', 'ns_mchannel', 'ns_source', 'ns_campaign',
+    'ns_linkname', 'ns_fee', 'at_medium', 'at_campaign', 'rss', 'ref_src',
+}
+TRACKING_PREFIXES = ('utm_', 'at_custom')
+
+DEFAULT_PORTS = {':80', ':443'}
+
+
+def is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so the same story maps to one key.
+    Scheme differences, www., default ports, tracking parameters, parameter
+    order, fragments and trailing slashes are all ignored.
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for port in DEFAULT_PORTS:
+        if host.endswith(port):
+            host = host[:-len(port)]
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(name)
+    )
+
+    return urlunsplit((
+        'https' if parts.scheme.lower() in ('http', 'https') else parts.scheme.lower(),
+        host,
+        parts.path.rstrip('/'),
+        urlencode(query),
+        '',  # fragments never identify a different article
+    ))
@@ -0,0 +1,96 @@
+"""
+Curation worker - runs queued digest builds outside the web process
+
+    python -m app.worker
+"""
+import threading
+import time
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services.curation import CurationService
+from app.services.jobs import claim_next_job, fail_job, finish_job, heartbeat, requeue_stale_jobs
+
+
+class Heartbeat:
+    """
+    Keeps a running job's heartbeat_at current from a background thread, on
+    its own session, so a long build is not mistaken for a dead worker.
+    """
+
+    def __init__(self, job_id: int, interval: float = settings.JOB_HEARTBEAT_SECONDS):
+        self.job_id = job_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'job-heartbeat-{job_id}', daemon=True)
+
+    def __enter__(self) -> 'Heartbeat':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            db = SessionLocal()
+            try:
+                if not heartbeat(db, self.job_id):
+                    return
+            except Exception as e:
+                db.rollback()
+                print(f"Heartbeat for curation job {self.job_id} failed: {e}")
+            finally:
+                db.close()
+
+
+def run_next_job() -> bool:
+    """Claim and run one job; False when the queue is empty"""
+    db = SessionLocal()
+    try:
+        job = claim_next_job(db)
+        if job is None:
+            return False
+
+        print(f"Running curation job {job.id}: {job.edition} {job.run_date} (attempt {job.attempts})")
+        try:
+            # Builds use the news available now; job.run_date only keys the job (see app.services.jobs)
+            with Heartbeat(job.id):
+                digest = CurationService(db).create_digest(job.edition)
+        except Exception as e:
+            db.rollback()
+            print(f"Curation job {job.id} failed: {e}")
+            fail_job(db, job, str(e))
+        else:
+            finish_job(db, job, digest.id)
+        return True
+    finally:
+        db.close()
+
+
+def run_forever() -> None:
+    """Poll the job queue until the process is stopped"""
+    while True:
+        db = SessionLocal()
+        try:
+            requeued = requeue_stale_jobs(db)
+            if requeued:
+                print(f"Recovered {requeued} stale curation job(s) (re-queued, or failed at the retry cap)")
+        except Exception as e:
+            db.rollback()
+            print(f"Checking for stale jobs failed: {e}")
+        finally:
+            db.close()
+
+        try:
+            while run_next_job():
+                pass
+        except Exception as e:
+            print(f"Curation worker error: {e}")
+
+        time.sleep(settings.JOB_POLL_SECONDS)
+
+
+if __name__ == '__main__':
+    run_forever()
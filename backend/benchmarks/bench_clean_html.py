@@ -0,0 +1,51 @@
+"""
+Micro-benchmark: streaming html.parser stripper vs the BeautifulSoup path in clean_html
+
+Run from the backend directory:
+    python -m benchmarks.bench_clean_html --entries 5000
+"""
+import argparse
+import random
+import time
+
+from app.services.curation import CurationService
+from benchmarks.synthetic import make_description, make_title
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    descriptions = [make_description(rng, make_title(rng)) for _ in range(args.entries)]
+    service = CurationService(db=None)
+
+    # Full-content feeds ship whole article bodies in the description
+    long_descriptions = [d * 20 for d in descriptions[:max(args.entries // 10, 1)]]
+
+    for label, corpus in (('summaries', descriptions), ('full bodies', long_descriptions)):
+        soup = best_of(args.repeat, lambda: [service.clean_html_soup(d) for d in corpus])
+        fast = best_of(args.repeat, lambda: [service.clean_html(d) for d in corpus])
+        limited = best_of(args.repeat, lambda: [service.clean_html(d, limit=500) for d in corpus])
+        mismatches = sum(1 for d in corpus if service.clean_html(d) != service.clean_html_soup(d))
+
+        print(f"{label}: {len(corpus)} entries")
+        print(f"  BeautifulSoup:        {soup:.3f}s  ({len(corpus) / soup:,.0f}/s)")
+        print(f"  html.parser:          {fast:.3f}s  ({len(corpus) / fast:,.0f}/s)  {soup / fast:.1f}x")
+        print(f"  html.parser, limit:   {limited:.3f}s  ({len(corpus) / limited:,.0f}/s)  {soup / limited:.1f}x")
+        print(f"  output mismatches:    {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Offline curation benchmark - times each pipeline stage at 1x/10x/100x feed volume
+
+Run from the backend directory:
+    python -m benchmarks.bench_curation                      # synthetic feeds
+    python -m benchmarks.bench_curation --fixtures fixtures/feeds
+    python -m benchmarks.bench_curation --scales 1,10 --json results.json
+
+1x is one real curation run (every configured feed, 30 entries each). No
+network access is needed; recorded fixtures are served by ReplayAdapter.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import feedparser
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.models import Base, Digest
+from app.services.curation import CurationService
+from app.services.entries import entry_date
+from app.services.feed_fetcher import FeedFetcher, FeedRequest, FeedResponse
+from app.services.feed_fixtures import build_replay_session
+from app.services.news_sources import NEWS_SOURCES
+from benchmarks.synthetic import feed_slots, synthetic_corpus
+
+
+def new_session():
+    """Fresh in-memory database so every run starts from an empty schema"""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def fixture_corpus(fixture_dir: str, scale: int) -> List[Tuple[str, str, str, bytes]]:
+    """Replay recorded feeds through the fetcher and repeat them `scale` times"""
+    fetcher = FeedFetcher(session=build_replay_session(fixture_dir))
+    feed_requests = [
+        FeedRequest(feed_url, source_name, category)
+        for source_name, source_config in NEWS_SOURCES.items()
+        for category, feed_url in source_config['categories'].items()
+    ]
+    recorded = [
+        (req.url, req.source, req.category, response.body)
+        for req, response in zip(feed_requests, fetcher.fetch_many(feed_requests))
+        if response.ok
+    ]
+    return [
+        (f"{url}#copy-{copy}", source, category, body)
+        for copy in range(scale)
+        for url, source, category, body in recorded
+    ]
+
+
+def measure(name: str, items: int, fn: Callable, track_memory: bool) -> Dict:
+    """
+    Run one stage, returning its timing, throughput and peak traced memory.
+    Memory comes from a second, traced run so tracemalloc overhead does not skew timings.
+    """
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if track_memory:
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'stage': name,
+        'items': items,
+        'seconds': elapsed,
+        'per_second': items / elapsed if elapsed else float('inf'),
+        'peak_mib': peak / (1024 * 1024),
+        'result': result,
+    }
+
+
+def run_scale(corpus: List[Tuple[str, str, str, bytes]], track_memory: bool) -> List[Dict]:
+    db = new_session()
+    service = CurationService(db)
+    service.max_age_hours = 24 * 365 * 10  # recorded fixtures may be old
+    results = []
+
+    parsed = measure(
+        'parse', len(corpus),
+        lambda: [feedparser.parse(body) for _, _, _, body in corpus],
+        track_memory,
+    )
+    results.append(parsed)
+    entries = [entry for feed in parsed['result'] for entry in feed.entries[:30]]
+
+    raw_descriptions = [entry.get('summary', '') for entry in entries]
+    cleaned = measure(
+        'clean_html', len(raw_descriptions),
+        lambda: [service.clean_html(text) for text in raw_descriptions],
+        track_memory,
+    )
+    results.append(cleaned)
+
+    normalized = measure(
+        'normalize', len(entries),
+        lambda: [
+            service.normalize_entry(
+                entry, 'Benchmark', 'general',
+                service.clean_title(entry.get('title', '')), entry_date(entry)
+            )
+            for entry in entries
+        ],
+        track_memory,
+    )
+    results.append(normalized)
+
+    results.append(measure(
+        'scoring', len(entries),
+        lambda: [service.calculate_quality_score(entry) for entry in normalized['result']],
+        track_memory,
+    ))
+
+    built = measure(
+        'parse_feed', len(entries),
+        lambda: [
+            article
+            for url, source, category, body in corpus
+            for article in service.parse_feed(FeedResponse(url, 200, body), source, category)
+        ],
+        track_memory,
+    )
+    results.append(built)
+    articles = built['result']
+
+    # Make URLs unique across repeated fixture copies, as distinct stories would be
+    for position, article in enumerate(articles):
+        article.url = f"{article.url}#{position}"
+
+    results.append(measure(
+        'curate_articles', len(articles),
+        lambda: service.curate_articles(articles),
+        track_memory,
+    ))
+    results.append(measure(
+        'remove_duplicates', len(articles),
+        lambda: service.remove_duplicates(articles),
+        track_memory,
+    ))
+
+    def insert_all():
+        insert_db = new_session()
+        insert_service = CurationService(insert_db)
+        digest = Digest(edition='morning', date=articles[0].published_date, is_published=True)
+        insert_db.add(digest)
+        insert_db.flush()
+        insert_service.save_articles(digest, {'Benchmark': articles})
+        insert_db.commit()
+        insert_db.close()
+
+    results.append(measure('db_insert', len(articles), insert_all, track_memory))
+    db.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1,10,100', help='comma separated volume multipliers')
+    parser.add_argument('--fixtures', help='replay recorded feeds from this directory instead of synthetic ones')
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc (faster, no peak memory)')
+    parser.add_argument('--json', help='write results to this file for regression comparisons')
+    args = parser.parse_args()
+
+    report = []
+    print(f"{'scale':>5}  {'stage':<18} {'items':>8} {'seconds':>9} {'items/s':>11} {'peak MiB':>9}")
+    for scale in [int(s) for s in args.scales.split(',')]:
+        if args.fixtures:
+            corpus = fixture_corpus(args.fixtures, scale)
+        else:
+            corpus = synthetic_corpus(scale)
+
+        for row in run_scale(corpus, track_memory=not args.no_memory):
+            row.pop('result')
+            row['scale'] = scale
+            report.append(row)
+            print(
+                f"{scale:>4}x  {row['stage']:<18} {row['items']:>8} {row['seconds']:>9.3f} "
+                f"{row['per_second']:>11.0f} {row['peak_mib']:>9.1f}"
+            )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'feeds_per_scale': len(feed_slots()), 'results': report}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark: hot read endpoints in sync vs async database mode at high concurrency
+
+Seeds a database, then for each mode starts the API in its own process
+(DB_ASYNC_MODE=false / true) and drives a mix of digest list, digest detail
+and saved-article reads from many concurrent clients for a fixed duration.
+Reports throughput, latency percentiles and errors per mode.
+
+The async mode pays off when requests spend their time waiting on the
+database, so point it at PostgreSQL for representative numbers; the SQLite
+default (aiosqlite, from requirements-dev.txt) only shows the overhead of
+each mode.
+
+Run from the backend directory:
+    python -m benchmarks.bench_db_modes --concurrency 128 --duration 15
+    python -m benchmarks.bench_db_modes --database-url postgresql://user:pw@localhost/bench
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import requests
+
+READ_PATHS = ['/digests/', '/digests/{digest_id}', '/articles/saved']
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def sync_engine(database_url: str):
+    from sqlalchemy import create_engine
+
+    # Requests may hop threads between dependency and endpoint, which SQLite refuses by default
+    if database_url.startswith('sqlite'):
+        return create_engine(database_url, connect_args={'check_same_thread': False})
+    return create_engine(database_url)
+
+
+def seed(database_url: str, digests: int, articles_per_digest: int, saved: int) -> int:
+    """Fresh schema with one reader; returns the newest digest id"""
+    from app.models.models import Article, Base, Digest, User, user_saved_articles
+    from sqlalchemy.orm import sessionmaker
+
+    engine = sync_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(email='reader@example.com', hashed_password='x'))
+    now = datetime.utcnow()
+    for d in range(digests):
+        digest = Digest(edition='morning', date=now - timedelta(hours=d), is_published=True)
+        db.add(digest)
+        db.flush()
+        db.bulk_insert_mappings(Article, [
+            {
+                'title': f'Article {d}-{a}', 'url': f'https://example.com/{d}/{a}',
+                'source': 'Example', 'category': f'Category {a % 5}', 'digest_id': digest.id,
+            }
+            for a in range(articles_per_digest)
+        ])
+    db.flush()
+    article_ids = [article_id for (article_id,) in db.query(Article.id).limit(saved).all()]
+    if article_ids:
+        db.execute(user_saved_articles.insert(), [
+            {'user_id': 1, 'article_id': article_id, 'saved_at': now} for article_id in article_ids
+        ])
+    db.commit()
+    latest_id = db.query(Digest.id).order_by(Digest.date.desc()).first()[0]
+    db.close()
+    engine.dispose()
+    return latest_id
+
+
+def serve(port: int) -> None:
+    """Server process: the app as configured by the environment"""
+    import uvicorn
+
+    from app.core.config import settings
+    from app.db.database import SessionLocal
+    from app.main import app
+
+    SessionLocal.configure(bind=sync_engine(settings.DATABASE_URL))
+    uvicorn.run(app, host='127.0.0.1', port=port, log_level='warning')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct), len(values) - 1)]
+
+
+def run_mode(async_mode: bool, args, latest_id: int) -> Dict:
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=args.database_url, DB_ASYNC_MODE=str(async_mode).lower(),
+               DB_SCHEMA_SETUP='none', SCHEDULER_ENABLED='false')
+    server = subprocess.Popen([sys.executable, '-m', 'benchmarks.bench_db_modes', '--serve', str(port)], env=env)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(200):
+            try:
+                requests.get(f"{base}/health", timeout=1)
+                break
+            except requests.ConnectionError:
+                time.sleep(0.1)
+
+        from app.core.security import create_access_token
+
+        headers = {'Authorization': f"Bearer {create_access_token({'sub': 'reader@example.com', 'uid': 1})}"}
+        urls = [f"{base}/api/v1{path.format(digest_id=latest_id)}" for path in READ_PATHS]
+        latencies: List[float] = []
+        errors = [0]
+        lock = threading.Lock()
+        deadline = time.perf_counter() + args.duration
+
+        def client(n: int):
+            session = requests.Session()
+            i = n
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    ok = session.get(urls[i % len(urls)], headers=headers, timeout=30).status_code == 200
+                except requests.RequestException:
+                    ok = False
+                elapsed = time.perf_counter() - started
+                with lock:
+                    if ok:
+                        latencies.append(elapsed)
+                    else:
+                        errors[0] += 1
+                i += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(client, range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        'mode': 'async' if async_mode else 'sync',
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50': percentile(latencies, 0.5),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'errors': errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', default='')
+    parser.add_argument('--concurrency', type=int, default=128, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=15, help='seconds per mode')
+    parser.add_argument('--digests', type=int, default=30)
+    parser.add_argument('--articles', type=int, default=40, help='articles per digest')
+    parser.add_argument('--saved', type=int, default=200)
+    parser.add_argument('--serve', type=int, metavar='PORT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve)
+        return
+
+    scratch = None
+    if not args.database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+    latest_id = seed(args.database_url, args.digests, args.articles, args.saved)
+
+    results = [run_mode(async_mode, args, latest_id) for async_mode in (False, True)]
+    print(f"{args.concurrency} clients, {args.duration:.0f}s per mode, {args.database_url.split(':')[0]}")
+    print(f"{'mode':>6} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for r in results:
+        print(f"{r['mode']:>6} {r['requests']:>9} {r['rps']:>8.1f} {r['p50'] * 1000:>8.1f} "
+              f"{r['p95'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} {r['errors']:>7}")
+    if scratch:
+        os.unlink(scratch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: MinHash/LSH near-duplicate removal vs the pairwise SequenceMatcher implementation
+
+Run from the backend directory:
+    python -m benchmarks.bench_dedup --sizes 1000,3000,10000
+"""
+import argparse
+import random
+import string
+import time
+from difflib import SequenceMatcher
+from typing import Dict, List, Tuple
+
+from app.services.curation import CurationService
+from app.services.entries import NormalizedEntry
+from benchmarks.synthetic import FILLER, OBJECTS, make_title
+
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def legacy_remove_duplicates(articles: List[NormalizedEntry], threshold: float = 0.7) -> List[NormalizedEntry]:
+    """The original O(n^2) implementation, kept here as the reference"""
+    unique = []
+    seen_titles = set()
+    seen_urls = set()
+    for article in articles:
+        if article.url in seen_urls:
+            continue
+        title = article.title.lower()
+        if any(SequenceMatcher(None, title, seen).ratio() > threshold for seen in seen_titles):
+            continue
+        unique.append(article)
+        seen_titles.add(title)
+        seen_urls.add(article.url)
+    return unique
+
+
+def make_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))).capitalize()
+
+
+def make_candidates(count: int, duplicate_rate: float = 0.3,
+                    seed: int = 3) -> Tuple[List[NormalizedEntry], Dict[str, int]]:
+    """
+    Stories plus reworded copies of earlier ones, as syndicated across outlets.
+    Also returns the story each article URL belongs to.
+    """
+    rng = random.Random(seed)
+    articles = []
+    story_of = {}
+    for i in range(count):
+        if articles and rng.random() < duplicate_rate:
+            original = rng.choice(articles)
+            words = original.title.split()
+            words[rng.randrange(len(words))] = rng.choice(OBJECTS).split()[-1]
+            title = ' '.join(words)
+            description = original.description
+            story = story_of[original.url]
+        else:
+            title = f"{make_title(rng)} as {make_word(rng)} {make_word(rng)} weighs in"
+            description = f"{make_word(rng)} {make_word(rng)} said on {rng.choice(DAYS)}. {FILLER}"
+            story = i
+        url = f"https://news.example.com/{i}"
+        articles.append(NormalizedEntry(
+            title=title, url=url, source='Benchmark', category='general', description=description
+        ))
+        story_of[url] = story
+    return articles, story_of
+
+
+def score(kept: List[NormalizedEntry], story_of: Dict[str, int], stories: int) -> str:
+    """Share of stories represented, and kept articles that repeat a story"""
+    covered = {story_of[a.url] for a in kept}
+    repeats = len(kept) - len(covered)
+    return f"{len(covered) / stories:>7.1%} {repeats:>7}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='1000,3000', help='comma separated candidate counts')
+    parser.add_argument('--skip-legacy-above', type=int, default=5000,
+                        help='do not run the quadratic reference above this size')
+    args = parser.parse_args()
+
+    service = CurationService(db=None)
+    print(
+        f"{'candidates':>10} {'stories':>8} | {'legacy s':>9} {'covered':>8} {'repeats':>7} | "
+        f"{'minhash s':>9} {'covered':>8} {'repeats':>7} | {'speedup':>8}"
+    )
+    for size in [int(s) for s in args.sizes.split(',')]:
+        articles, story_of = make_candidates(size)
+        stories = len(set(story_of.values()))
+
+        started = time.perf_counter()
+        fast = service.remove_duplicates(articles)
+        fast_time = time.perf_counter() - started
+
+        if size > args.skip_legacy_above:
+            print(
+                f"{size:>10} {stories:>8} | {'-':>9} {'-':>8} {'-':>7} | "
+                f"{fast_time:>9.3f} {score(fast, story_of, stories)} |"
+            )
+            continue
+
+        started = time.perf_counter()
+        legacy = legacy_remove_duplicates(articles)
+        legacy_time = time.perf_counter() - started
+
+        print(
+            f"{size:>10} {stories:>8} | {legacy_time:>9.3f} {score(legacy, story_of, stories)} | "
+            f"{fast_time:>9.3f} {score(fast, story_of, stories)} | {legacy_time / fast_time:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
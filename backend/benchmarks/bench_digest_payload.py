@@ -0,0 +1,108 @@
+"""
+Benchmark: v1 vs compact v2 digest payload size and serialization time
+
+Builds a synthetic cached digest body (realistic titles, descriptions and
+metadata), then renders the per-reader response the way each endpoint does:
+v1 copies every article into articles_by_category with an is_saved flag, v2
+lists each article once with categories as index lists. Reports raw, gzip
+and brotli sizes and the time to build and serialize one response.
+
+Run from the backend directory:
+    python -m benchmarks.bench_digest_payload
+    python -m benchmarks.bench_digest_payload --articles 120 --iterations 2000
+"""
+import argparse
+import gzip
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.services.digest_cache import V2_DEFAULT_FIELDS, compact, personalize
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORDS = ('market policy election climate energy research court budget health study league '
+         'technology inflation report council storm vaccine trade summit talks').split()
+CATEGORIES = ['Top Stories', 'Business', 'Technology', 'Science', 'Health', 'Sports', 'World', 'Politics']
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def synthetic_body(articles: int, seed: int = 7) -> Dict:
+    """A cached digest body shaped like digest_cache.render_digest output"""
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 1, 7)
+    rows: List[Dict] = []
+    categories: Dict[str, List[int]] = {}
+    for position in range(articles):
+        category = CATEGORIES[position % len(CATEGORIES)]
+        categories.setdefault(category, []).append(position)
+        rows.append({
+            'title': sentence(rng, 9),
+            'url': f'https://news.example.com/{category.lower().replace(" ", "-")}/{position}-{rng.randrange(10 ** 6)}',
+            'source': rng.choice(['Reuters', 'AP News', 'BBC News', 'The Guardian', 'NPR']),
+            'category': category,
+            'description': ' '.join(sentence(rng, 14) for _ in range(3)),
+            'published_date': (now - timedelta(minutes=rng.randrange(600))).isoformat(),
+            'metadata_json': {'relevance_score': round(rng.random() * 10, 2),
+                              'reasoning': sentence(rng, 20), 'tags': rng.sample(WORDS, 3)},
+            'id': position + 1,
+            'digest_id': 1,
+            'created_at': now.isoformat(),
+        })
+    return {'id': 1, 'edition': 'morning', 'date': now.isoformat(), 'is_published': True,
+            'articles': rows, 'categories': categories}
+
+
+def measure(build: Callable[[], Dict], iterations: int) -> Dict:
+    """Build and serialize one response the way the endpoints do (JSONResponse)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        payload = JSONResponse(content=build()).body
+    elapsed = (time.perf_counter() - started) / iterations
+    return {
+        'raw': len(payload),
+        'gzip': len(gzip.compress(payload, settings.GZIP_LEVEL)),
+        'br': len(brotli.compress(payload, quality=settings.BROTLI_QUALITY)) if brotli else None,
+        'ms': elapsed * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--articles', type=int, default=60, help='articles in the digest')
+    parser.add_argument('--saved', type=int, default=10, help='articles the reader has saved')
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args()
+
+    body = synthetic_body(args.articles)
+    saved_ids = set(range(1, args.saved + 1))
+    variants = [
+        ('v1', lambda: personalize(body, saved_ids)),
+        ('v2', lambda: compact(body, saved_ids)),
+        ('v2 +metadata', lambda: compact(body, saved_ids, V2_DEFAULT_FIELDS + ('metadata_json',))),
+        ('v2 list fields', lambda: compact(body, saved_ids, ('id', 'title', 'url', 'source', 'category'))),
+    ]
+
+    print(f"{args.articles} articles, {args.saved} saved, {args.iterations} iterations")
+    print(f"{'payload':>15} {'raw B':>9} {'gzip B':>8} {'br B':>8} {'ms/resp':>8} {'raw vs v1':>10}")
+    baseline = None
+    for name, build in variants:
+        r = measure(build, args.iterations)
+        baseline = baseline or r['raw']
+        br = str(r['br']) if r['br'] is not None else 'n/a'
+        print(f"{name:>15} {r['raw']:>9} {r['gzip']:>8} {br:>8} {r['ms']:>8.3f} "
+              f"{(r['raw'] - baseline) / baseline:>+10.0%}")
+
+
+if __name__ == '__main__':
+    main()
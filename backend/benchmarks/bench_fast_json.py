@@ -0,0 +1,145 @@
+"""
+Benchmark: read endpoints with and without the fast JSON path (FAST_JSON_RESPONSES)
+
+Seeds a database and starts the API twice, one uvicorn worker each, with
+FAST_JSON_RESPONSES=false and =true. First checks the contract: every read
+endpoint must return the same status, JSON and next-page cursor on both, and
+the fast output must validate against the endpoint's schema. Then drives
+each endpoint from concurrent clients and reports requests/sec per worker.
+
+Run from the backend directory:
+    python -m benchmarks.bench_fast_json
+    python -m benchmarks.bench_fast_json --database-url postgresql://user:pw@localhost/bench --duration 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import requests
+from pydantic import parse_obj_as
+
+from app.schemas.schemas import Article, DigestSummary, DigestWithArticles, SavedArticle
+from benchmarks.bench_db_modes import free_port, seed, serve
+
+# (path, schema), formatted with the seeded digest id
+READ_ENDPOINTS = [
+    ('/digests/?limit=20', List[DigestSummary]),
+    ('/digests/{digest_id}', DigestWithArticles),
+    ('/articles/saved?limit=50', List[SavedArticle]),
+    ('/articles/1', Article),
+]
+
+
+def start_server(fast: bool, database_url: str):
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=database_url, FAST_JSON_RESPONSES=str(fast).lower(),
+               DB_SCHEMA_SETUP='none', SCHEDULER_ENABLED='false')
+    server = subprocess.Popen([sys.executable, '-m', 'benchmarks.bench_fast_json', '--serve', str(port)], env=env)
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            requests.get(f"{base}/health", timeout=1)
+            break
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    return server, f"{base}/api/v1"
+
+
+def check_contract(standard: str, fast: str, paths: List[str], headers: Dict) -> List[str]:
+    """Differences between the two servers' responses, and schema violations of the fast one"""
+    problems = []
+    for path, (_, schema) in zip(paths, READ_ENDPOINTS):
+        expected = requests.get(standard + path, headers=headers)
+        actual = requests.get(fast + path, headers=headers)
+        if actual.status_code != expected.status_code or actual.status_code != 200:
+            problems.append(f"{path}: status {actual.status_code}, expected {expected.status_code}")
+            continue
+        if actual.json() != expected.json():
+            problems.append(f"{path}: body differs from the response_model path")
+        if actual.headers.get('X-Next-Cursor') != expected.headers.get('X-Next-Cursor'):
+            problems.append(f"{path}: X-Next-Cursor differs")
+        try:
+            parse_obj_as(schema, actual.json())
+        except ValueError as e:
+            problems.append(f"{path}: does not match its schema: {e}")
+    return problems
+
+
+def requests_per_second(url: str, headers: Dict, concurrency: int, duration: float) -> float:
+    done = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(_):
+        session = requests.Session()
+        count = 0
+        while time.perf_counter() < deadline:
+            if session.get(url, headers=headers, timeout=30).status_code == 200:
+                count += 1
+        with lock:
+            done[0] += count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client, range(concurrency)))
+    return done[0] / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', default='')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=5, help='seconds per endpoint and mode')
+    parser.add_argument('--digests', type=int, default=30)
+    parser.add_argument('--articles', type=int, default=40, help='articles per digest')
+    parser.add_argument('--saved', type=int, default=200)
+    parser.add_argument('--serve', type=int, metavar='PORT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve)
+        return
+
+    scratch = None
+    if not args.database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+    latest_id = seed(args.database_url, args.digests, args.articles, args.saved)
+
+    from app.core.security import create_access_token
+
+    headers = {'Authorization': f"Bearer {create_access_token({'sub': 'reader@example.com', 'uid': 1})}"}
+    paths = [path.format(digest_id=latest_id) for path, _ in READ_ENDPOINTS]
+    servers = [start_server(fast, args.database_url) for fast in (False, True)]
+    try:
+        (_, standard), (_, fast) = servers
+        problems = check_contract(standard, fast, paths, headers)
+        for problem in problems:
+            print(f"FAIL  {problem}")
+        if problems:
+            sys.exit(1)
+        print("OK: fast responses match the response_model path and the schemas")
+
+        print(f"{args.concurrency} clients, {args.duration:.0f}s per endpoint and mode, one worker each, "
+              f"{args.database_url.split(':')[0]}")
+        print(f"{'endpoint':>26} {'standard req/s':>15} {'fast req/s':>11} {'change':>8}")
+        for path in paths:
+            before = requests_per_second(standard + path, headers, args.concurrency, args.duration)
+            after = requests_per_second(fast + path, headers, args.concurrency, args.duration)
+            print(f"{path:>26} {before:>15.1f} {after:>11.1f} {(after - before) / before:>+8.0%}")
+    finally:
+        for server, _ in servers:
+            server.terminate()
+            server.wait()
+        if scratch:
+            os.unlink(scratch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: login throughput under concurrent load, and read latency beside it
+
+Starts the API with uvicorn on a scratch SQLite database, seeds users, then
+fires concurrent logins while a separate client keeps reading /digests/. Reports
+login throughput and latency, rejected (503) logins, read latency during the
+burst, and the hashing pool's own metrics.
+
+Run from the backend directory:
+    python -m benchmarks.bench_login --users 50 --concurrency 32 --logins 400
+    python -m benchmarks.bench_login --seed-rounds 10   # also exercise rehash-on-login
+"""
+import argparse
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# The app builds its engine at import time, so point it at a scratch database first
+_scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+os.environ['DATABASE_URL'] = f"sqlite:///{_scratch.name}"
+os.environ.setdefault('SCHEDULER_ENABLED', 'false')
+os.environ.setdefault('INTERNAL_API_TOKEN', 'bench')  # to read /internal/hashing
+
+import bcrypt  # noqa: E402
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db.database import SessionLocal  # noqa: E402
+from app.db.schema import setup_schema  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.models import User  # noqa: E402
+
+PASSWORD = 'correct horse battery staple'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def seed_users(count: int, rounds: int) -> List[str]:
+    hashed = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+    emails = [f"reader{i}@example.com" for i in range(count)]
+    db = SessionLocal()
+    db.bulk_insert_mappings(User, [
+        {'email': email, 'hashed_password': hashed, 'is_active': True} for email in emails
+    ])
+    db.commit()
+    db.close()
+    return emails
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=32, help='concurrent login clients')
+    parser.add_argument('--logins', type=int, default=400, help='total login requests')
+    parser.add_argument('--seed-rounds', type=int, default=settings.BCRYPT_ROUNDS,
+                        help='bcrypt cost of the seeded hashes (differs from BCRYPT_ROUNDS => rehash)')
+    args = parser.parse_args()
+
+    # Requests hop between threadpool threads, which SQLite refuses by default
+    SessionLocal.configure(bind=create_engine(os.environ['DATABASE_URL'],
+                                              connect_args={'check_same_thread': False}))
+    setup_schema()
+    emails = seed_users(args.users, args.seed_rounds)
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    base = f"http://127.0.0.1:{port}"
+    login_url = f"{base}{settings.API_V1_STR}/auth/login"
+
+    token = requests.post(login_url, data={'username': emails[0], 'password': PASSWORD}).json()['access_token']
+    read_headers = {'Authorization': f"Bearer {token}"}
+
+    # Reader: measures how /digests/ latency holds up while logins run
+    read_latencies: List[float] = []
+    stop = threading.Event()
+
+    def reader():
+        session = requests.Session()
+        while not stop.is_set():
+            started = time.perf_counter()
+            session.get(f"{base}{settings.API_V1_STR}/digests/", headers=read_headers)
+            read_latencies.append(time.perf_counter() - started)
+            time.sleep(0.01)
+
+    baseline: List[float] = []
+    session = requests.Session()
+    for _ in range(20):
+        started = time.perf_counter()
+        session.get(f"{base}{settings.API_V1_STR}/digests/", headers=read_headers)
+        baseline.append(time.perf_counter() - started)
+
+    results: Dict[int, int] = {}
+    login_latencies: List[float] = []
+    lock = threading.Lock()
+
+    def login(i: int):
+        started = time.perf_counter()
+        response = requests.post(login_url, data={'username': emails[i % len(emails)], 'password': PASSWORD})
+        elapsed = time.perf_counter() - started
+        with lock:
+            results[response.status_code] = results.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                login_latencies.append(elapsed)
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(login, range(args.logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    reader_thread.join()
+
+    stats = requests.get(f"{base}/internal/hashing", headers={'X-Internal-Token': settings.INTERNAL_API_TOKEN}).json()
+    server.should_exit = True
+
+    ok = results.get(200, 0)
+    print(f"bcrypt rounds: configured {settings.BCRYPT_ROUNDS}, seeded {args.seed_rounds}")
+    print(f"logins:  {args.logins} in {elapsed:.2f}s  -> {ok / elapsed:.1f} ok/s  status counts {results}")
+    print(f"         latency p50 {percentile(login_latencies, 0.5) * 1000:.0f} ms  "
+          f"p95 {percentile(login_latencies, 0.95) * 1000:.0f} ms")
+    print(f"reads:   idle p50 {statistics.median(baseline) * 1000:.1f} ms  |  during burst "
+          f"p50 {percentile(read_latencies, 0.5) * 1000:.1f} ms  p95 {percentile(read_latencies, 0.95) * 1000:.1f} ms  "
+          f"({len(read_latencies)} reads)")
+    print(f"hashing pool: {stats}")
+    os.unlink(_scratch.name)
+
+
+if __name__ == '__main__':
+    main()
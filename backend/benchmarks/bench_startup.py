@@ -0,0 +1,129 @@
+"""
+Benchmark: web worker startup - import time and time to first request
+
+Every measurement runs in a fresh interpreter:
+- import: `import app.main`, and which curation-stack modules it drags in
+  (the web tier should load none; curation runs in the worker process)
+- boot: starts uvicorn and times the first /health answer, then the first
+  200 from /ready (database reachable and schema set up)
+
+Point --database-url at a slow or unreachable database (e.g. an address that
+drops packets) to check that boot stays bounded by DB_STARTUP_TIMEOUT while
+/ready reports 503.
+
+Run from the backend directory:
+    python -m benchmarks.bench_startup --runs 5
+    DB_STARTUP_TIMEOUT=3 python -m benchmarks.bench_startup --database-url postgresql://u:p@10.255.255.1/x
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CURATION_MODULES = ['app.services.curation', 'feedparser', 'bs4', 'requests', 'difflib', 'numpy']
+IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+print(json.dumps({'seconds': time.perf_counter() - started, 'loaded': [m for m in sys.argv[1:] if m in sys.modules]}))
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(env: Dict) -> Dict:
+    output = subprocess.run([sys.executable, '-c', IMPORT_PROBE, *CURATION_MODULES], cwd=BACKEND_DIR, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def poll(url: str, deadline: float, want_ok: bool) -> Optional[float]:
+    """perf_counter time of the first answer (a 200, if want_ok), or None by the deadline"""
+    while time.perf_counter() < deadline:
+        try:
+            if requests.get(url, timeout=5).ok or not want_ok:
+                return time.perf_counter()
+        except requests.RequestException:
+            pass
+        time.sleep(0.02)
+    return None
+
+
+def measure_boot(env: Dict, wait: float) -> Dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, '-m', 'uvicorn', 'app.main:app', '--port', str(port),
+                               '--log-level', 'warning'], cwd=BACKEND_DIR, env=env)
+    try:
+        healthy = poll(f"{base}/health", started + wait, want_ok=False)
+        ready = poll(f"{base}/ready", started + wait, want_ok=True) if healthy else None
+        readiness = requests.get(f"{base}/ready", timeout=5).json() if healthy else None
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        'health': healthy - started if healthy else None,
+        'ready': ready - started if ready else None,
+        'readiness': readiness,
+    }
+
+
+def median(values: List[Optional[float]]) -> str:
+    values = [v for v in values if v is not None]
+    return f"{statistics.median(values) * 1000:.0f} ms" if values else 'never'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', default='', help='default: a scratch SQLite file, migrated first')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--wait', type=float, default=30, help='seconds to wait for /health and /ready per boot')
+    args = parser.parse_args()
+
+    scratch = None
+    if not args.database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+        args.database_url = f"sqlite:///{scratch}"
+    env = dict(os.environ, DATABASE_URL=args.database_url, SCHEDULER_ENABLED='false')
+    try:
+        if scratch:
+            # Boot against an up-to-date schema, as after the release phase
+            subprocess.run([sys.executable, '-m', 'app.db.schema'], cwd=BACKEND_DIR, env=env,
+                           check=True, capture_output=True)
+        imports = [measure_import(env) for _ in range(args.runs)]
+        boots = [measure_boot(env, args.wait) for _ in range(args.runs)]
+    finally:
+        if scratch:
+            os.unlink(scratch)
+
+    loaded = sorted({module for result in imports for module in result['loaded']})
+    print(f"{args.runs} runs, {args.database_url.split(':')[0]}, DB_STARTUP_TIMEOUT="
+          f"{env.get('DB_STARTUP_TIMEOUT', 'default')}")
+    print(f"  import app.main      {median([r['seconds'] for r in imports])}")
+    print(f"  first /health        {median([b['health'] for b in boots])}")
+    print(f"  first ready /ready   {median([b['ready'] for b in boots])}")
+    last = boots[-1]['readiness']
+    if last is not None:
+        print(f"  last /ready          {json.dumps(last)}")
+    if loaded:
+        print(f"FAIL: importing app.main loads the curation stack: {', '.join(loaded)}")
+        sys.exit(1)
+    print("OK: the web tier imports none of the curation stack")
+
+
+if __name__ == '__main__':
+    main()
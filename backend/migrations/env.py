@@ -0,0 +1,52 @@
+"""
+Alembic environment - runs migrations against settings.DATABASE_URL, or on
+the connection passed in by app.db.schema.migrate
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.core.config import settings
+from app.models.models import Base
+
+config = context.config
+# Run in-process (app.db.schema), the host application owns logging
+if config.config_file_name is not None and 'connection' not in config.attributes:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def database_url() -> str:
+    # An explicit -x url=... or sqlalchemy.url (set by scripts) wins over DATABASE_URL
+    return context.get_x_argument(as_dictionary=True).get('url') or \
+        config.get_main_option('sqlalchemy.url') or settings.DATABASE_URL
+
+
+def run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite can only change constraints by rebuilding the table
+        render_as_batch=connection.dialect.name == 'sqlite',
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        run_migrations(connection)
+        return
+
+    connectable = create_engine(database_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        run_migrations(connection)
+
+
+if context.is_offline_mode():
+    # Migrations inspect the live schema to stay idempotent, so there is no --sql mode
+    raise SystemExit("Offline (--sql) migrations are not supported; run against a database")
+run_migrations_online()
@@ -0,0 +1,147 @@
+"""Baseline schema, as previously created by Base.metadata.create_all
+
+Existing databases were built by create_all at startup, so every table and
+index here is only created when it is missing. Running this against such a
+database just records the revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def create_table_if_missing(name, *columns, indexes=()):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(name):
+        op.create_table(name, *columns)
+        existing = set()
+    else:
+        existing = {index['name'] for index in inspector.get_indexes(name)}
+    for index_name, index_columns, kwargs in indexes:
+        if index_name not in existing:
+            op.create_index(index_name, name, index_columns, **kwargs)
+
+
+def upgrade():
+    create_table_if_missing(
+        'users',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('full_name', sa.String()),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        indexes=[
+            ('ix_users_id', ['id'], {}),
+            ('ix_users_email', ['email'], {'unique': True}),
+        ],
+    )
+    create_table_if_missing(
+        'digests',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('edition', sa.String(), nullable=False),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('is_published', sa.Boolean()),
+        indexes=[('ix_digests_id', ['id'], {})],
+    )
+    create_table_if_missing(
+        'articles',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('url', sa.String(), nullable=False, unique=True),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('description', sa.Text()),
+        sa.Column('published_date', sa.DateTime()),
+        sa.Column('digest_id', sa.Integer(), sa.ForeignKey('digests.id')),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('metadata_json', sa.JSON()),
+        indexes=[('ix_articles_id', ['id'], {})],
+    )
+    create_table_if_missing(
+        'user_saved_articles',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id')),
+        sa.Column('article_id', sa.Integer(), sa.ForeignKey('articles.id')),
+        sa.Column('saved_at', sa.DateTime()),
+    )
+    create_table_if_missing(
+        'feed_states',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('url', sa.String(), nullable=False, unique=True),
+        sa.Column('etag', sa.String()),
+        sa.Column('last_modified', sa.String()),
+        sa.Column('body_hash', sa.String()),
+        sa.Column('last_fetched_at', sa.DateTime()),
+        sa.Column('last_status', sa.Integer()),
+        sa.Column('last_error', sa.Text()),
+        sa.Column('entries_json', sa.JSON()),
+        indexes=[('ix_feed_states_id', ['id'], {})],
+    )
+    create_table_if_missing(
+        'candidates',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('canonical_url', sa.String(), nullable=False, unique=True),
+        sa.Column('url', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('categories', sa.JSON()),
+        sa.Column('description', sa.Text()),
+        sa.Column('published_date', sa.DateTime()),
+        sa.Column('author', sa.String()),
+        sa.Column('image_url', sa.String()),
+        sa.Column('guid', sa.String()),
+        sa.Column('quality_score', sa.Float()),
+        sa.Column('first_seen_at', sa.DateTime()),
+        sa.Column('last_seen_at', sa.DateTime()),
+        indexes=[
+            ('ix_candidates_id', ['id'], {}),
+            ('ix_candidates_published_date', ['published_date'], {}),
+            ('ix_candidates_last_seen_at', ['last_seen_at'], {}),
+        ],
+    )
+    create_table_if_missing(
+        'seen_items',
+        sa.Column('key', sa.String(), primary_key=True),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('first_seen_at', sa.DateTime()),
+        indexes=[('ix_seen_items_first_seen_at', ['first_seen_at'], {})],
+    )
+    active = sa.text("status IN ('pending', 'running')")
+    create_table_if_missing(
+        'curation_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('edition', sa.String(), nullable=False),
+        sa.Column('run_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('run_after', sa.DateTime()),
+        sa.Column('error', sa.Text()),
+        sa.Column('digest_id', sa.Integer(), sa.ForeignKey('digests.id')),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('started_at', sa.DateTime()),
+        sa.Column('finished_at', sa.DateTime()),
+        indexes=[
+            ('ix_curation_jobs_id', ['id'], {}),
+            ('uq_curation_jobs_active', ['edition', 'run_date'],
+             {'unique': True, 'postgresql_where': active, 'sqlite_where': active}),
+            ('ix_curation_jobs_claim', ['status', 'run_after'], {}),
+        ],
+    )
+
+
+def downgrade():
+    for table in ('curation_jobs', 'seen_items', 'candidates', 'feed_states',
+                  'user_saved_articles', 'articles', 'digests', 'users'):
+        op.drop_table(table)
@@ -0,0 +1,91 @@
+"""Hot-path indexes: digest lookups, articles by digest, saved articles
+
+- digests (edition, is_published, date DESC): latest edition
+- digests (is_published, date DESC): digest list
+- articles (digest_id, id): a digest's articles in order, per-digest counts
+- user_saved_articles primary key (user_id, article_id): saved flags and
+  save/unsave lookups; duplicate and NULL rows are removed first
+- user_saved_articles (user_id, saved_at) INCLUDE (article_id): saved list
+
+On PostgreSQL the plain indexes are built CONCURRENTLY so large tables stay
+writable. Every step is skipped if it already exists, since databases
+created by create_all after this change already have them.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_digests_edition_published_date', 'digests', ['edition', 'is_published', sa.text('date DESC')], {}),
+    ('ix_digests_published_date', 'digests', ['is_published', sa.text('date DESC')], {}),
+    ('ix_articles_digest_id_id', 'articles', ['digest_id', 'id'], {}),
+    ('ix_user_saved_articles_user_saved_at', 'user_saved_articles', ['user_id', 'saved_at'],
+     {'postgresql_include': ['article_id']}),
+]
+SAVED_PK = 'user_saved_articles_pkey'
+
+
+def existing_indexes(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def add_saved_articles_primary_key():
+    bind = op.get_bind()
+    if sa.inspect(bind).get_pk_constraint('user_saved_articles')['constrained_columns']:
+        return
+
+    # The table never had a key, so the same save may be stored twice
+    op.execute("DELETE FROM user_saved_articles WHERE user_id IS NULL OR article_id IS NULL")
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            "DELETE FROM user_saved_articles a USING user_saved_articles b "
+            "WHERE a.user_id = b.user_id AND a.article_id = b.article_id AND a.ctid > b.ctid"
+        )
+    else:
+        op.execute(
+            "DELETE FROM user_saved_articles WHERE rowid NOT IN ("
+            "SELECT MIN(rowid) FROM user_saved_articles GROUP BY user_id, article_id)"
+        )
+
+    with op.batch_alter_table('user_saved_articles') as batch:
+        batch.alter_column('user_id', existing_type=sa.Integer(), nullable=False)
+        batch.alter_column('article_id', existing_type=sa.Integer(), nullable=False)
+        batch.create_primary_key(SAVED_PK, ['user_id', 'article_id'])
+
+
+def upgrade():
+    add_saved_articles_primary_key()
+
+    concurrently = op.get_bind().dialect.name == 'postgresql'
+    missing = [index for index in INDEXES if index[0] not in existing_indexes(index[1])]
+    if not missing:
+        return
+    if concurrently:
+        # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns, kwargs in missing:
+                op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+    else:
+        for name, table, columns, kwargs in missing:
+            op.create_index(name, table, columns, **kwargs)
+
+
+def downgrade():
+    for name, table, _, _ in reversed(INDEXES):
+        if name in existing_indexes(table):
+            op.drop_index(name, table_name=table)
+    with op.batch_alter_table('user_saved_articles') as batch:
+        batch.drop_constraint(SAVED_PK, type_='primary')
+        batch.alter_column('user_id', existing_type=sa.Integer(), nullable=True)
+        batch.alter_column('article_id', existing_type=sa.Integer(), nullable=True)
@@ -0,0 +1,74 @@
+"""Keyset pagination indexes for the digest list and saved articles
+
+Pages continue after a (date, id) / (saved_at, article_id) key, so the tie
+breaker joins the index key:
+
+- digests (is_published, date DESC, id DESC) replaces (is_published, date DESC)
+- user_saved_articles (user_id, saved_at, article_id) replaces
+  (user_id, saved_at) INCLUDE (article_id)
+
+saved_at becomes NOT NULL (rows without one sort as the oldest saves), since
+a NULL key could never be continued after.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# (new index, old index it replaces)
+REPLACEMENTS = [
+    (('ix_digests_published_date_id', 'digests', ['is_published', sa.text('date DESC'), sa.text('id DESC')], {}),
+     ('ix_digests_published_date', 'digests', ['is_published', sa.text('date DESC')], {})),
+    (('ix_user_saved_articles_user_saved_at_article', 'user_saved_articles', ['user_id', 'saved_at', 'article_id'], {}),
+     ('ix_user_saved_articles_user_saved_at', 'user_saved_articles', ['user_id', 'saved_at'],
+      {'postgresql_include': ['article_id']})),
+]
+
+
+def existing_indexes(table):
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def swap_indexes(pairs):
+    """Build each new index before dropping the one it replaces, concurrently on PostgreSQL"""
+    concurrently = op.get_bind().dialect.name == 'postgresql'
+    options = {'postgresql_concurrently': True} if concurrently else {}
+
+    def run():
+        for (name, table, columns, kwargs), (old_name, _, _, _) in pairs:
+            existing = existing_indexes(table)
+            if name not in existing:
+                op.create_index(name, table, columns, **options, **kwargs)
+            if old_name in existing:
+                op.drop_index(old_name, table_name=table, **options)
+
+    if concurrently:
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside the migration transaction
+        with op.get_context().autocommit_block():
+            run()
+    else:
+        run()
+
+
+def upgrade():
+    op.execute("UPDATE user_saved_articles SET saved_at = '1970-01-01 00:00:00' WHERE saved_at IS NULL")
+    with op.batch_alter_table('user_saved_articles') as batch:
+        batch.alter_column('saved_at', existing_type=sa.DateTime(), nullable=False)
+
+    swap_indexes(REPLACEMENTS)
+
+
+def downgrade():
+    swap_indexes([(old, new) for new, old in REPLACEMENTS])
+    with op.batch_alter_table('user_saved_articles') as batch:
+        batch.alter_column('saved_at', existing_type=sa.DateTime(), nullable=True)
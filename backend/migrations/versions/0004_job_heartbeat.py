@@ -0,0 +1,30 @@
+"""Curation job heartbeat
+
+Workers touch curation_jobs.heartbeat_at while a build runs, so the stale-job
+check can tell a slow build from a dead worker. Running jobs start from their
+started_at.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('curation_jobs', sa.Column('heartbeat_at', sa.DateTime()))
+    op.execute("UPDATE curation_jobs SET heartbeat_at = started_at WHERE status = 'running'")
+
+
+def downgrade():
+    with op.batch_alter_table('curation_jobs') as batch:
+        batch.drop_column('heartbeat_at')
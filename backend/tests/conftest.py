@@ -0,0 +1,57 @@
+"""
+Shared test setup. Settings are read from the environment when app modules
+are first imported, so the test environment is fixed here, before any test
+module imports the app.
+"""
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+_database = tempfile.NamedTemporaryFile(suffix='.db', delete=False).name
+os.environ['DATABASE_URL'] = f"sqlite:///{_database}"
+os.environ['SCHEDULER_ENABLED'] = 'false'
+os.environ['DIGEST_CACHE_BACKEND'] = 'fake'
+
+from app.models.models import Base  # noqa: E402
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if os.path.exists(_database):
+        os.unlink(_database)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A fresh SQLite file database with the full schema"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={'check_same_thread': False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def client(session_factory):
+    """API test client whose requests use the test database"""
+    from fastapi.testclient import TestClient
+
+    from app.db.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db)
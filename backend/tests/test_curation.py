@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+
+from app.models.models import Candidate, Digest
+from app.services.candidate_pool import load_candidate_pool
+from app.services.curation import CurationService, NothingToPublish
+from app.services.seen_index import SeenIndex
+
+
+class NoCrawlFetcher:
+    def fetch_many(self, requests):
+        raise AssertionError("crawled although the candidate pool was available")
+
+
+def add_candidate(db, url, published_date):
+    db.add(Candidate(
+        canonical_url=url, url=url, title=f"Story at {url}", source='Reuters',
+        categories=['business'], description='A ' * 60, published_date=published_date,
+        last_seen_at=datetime.utcnow(),
+    ))
+    db.commit()
+
+
+def test_pool_keeps_undated_candidates(session_factory):
+    db = session_factory()
+    add_candidate(db, 'https://example.com/undated', None)
+    add_candidate(db, 'https://example.com/old', datetime(2000, 1, 1))
+
+    assert [a.url for a in load_candidate_pool(db, max_age_hours=48)] == ['https://example.com/undated']
+
+
+def test_nothing_is_published_when_every_candidate_was_seen(session_factory):
+    db = session_factory()
+    add_candidate(db, 'https://example.com/a', datetime.utcnow())
+    service = CurationService(db, fetcher=NoCrawlFetcher())
+    service.seen_index = SeenIndex(1000)
+    service.seen_index.record_articles(db, load_candidate_pool(db, service.max_age_hours))
+    db.commit()
+
+    with pytest.raises(NothingToPublish):
+        service.create_digest('morning')
+    db.rollback()
+    assert db.query(Digest).count() == 0
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from app.models.models import Article, Digest
+from app.services.digest_cache import build_digest_cache, digest_key
+
+
+def published_digest(db) -> Digest:
+    digest = Digest(edition='morning', date=datetime(2026, 1, 1), is_published=True)
+    db.add(digest)
+    db.flush()
+    db.add(Article(title='A story', url='https://example.com/a', source='Example', category='World',
+                   digest_id=digest.id))
+    db.commit()
+    return digest
+
+
+def test_warm_shared_skips_the_in_process_tier(session_factory):
+    db = session_factory()
+    digest = published_digest(db)
+    cache = build_digest_cache('fake')
+    local, shared = cache.tiers
+
+    assert cache.warm_shared(db, digest)
+    assert local.get(digest_key(digest.id)) is None
+    assert shared.get(digest_key(digest.id))['articles'][0]['title'] == 'A story'
+
+
+def test_warm_shared_without_a_shared_tier_does_nothing(session_factory):
+    db = session_factory()
+    digest = published_digest(db)
+    cache = build_digest_cache('memory')
+
+    assert not cache.warm_shared(db, digest)
+    assert cache.get(digest.id) is None
@@ -0,0 +1,103 @@
+"""
+The fast JSON path (FAST_JSON_RESPONSES) must not change the read API
+
+Serves the same seeded database with the setting off and on, and compares
+status, JSON body and headers of every read endpoint; the fast output must
+also parse as the endpoint's response_model.
+"""
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from pydantic import parse_obj_as
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.models import Article, Digest, User, user_saved_articles
+from app.schemas import schemas
+from app.services.digest_cache import get_digest_cache
+
+DIGESTS, ARTICLES_PER_DIGEST, SAVED = 5, 6, 8
+
+# (path, response_model), formatted with the seeded ids; small limits also check the cursor pages
+READ_ENDPOINTS = [
+    ('/api/v1/digests/?limit=2', List[schemas.DigestSummary]),
+    ('/api/v1/digests/?limit=100', List[schemas.DigestSummary]),
+    ('/api/v1/digests/{latest_id}', schemas.DigestWithArticles),
+    ('/api/v1/articles/saved?limit=3', List[schemas.SavedArticle]),
+    ('/api/v1/articles/saved?limit=100', List[schemas.SavedArticle]),
+    ('/api/v1/articles/{article_id}', schemas.Article),
+]
+
+
+@pytest.fixture
+def seeded(session_factory):
+    db = session_factory()
+    user = User(email='reader@example.com', hashed_password='x', full_name='Leitora Ávida')
+    db.add(user)
+    now = datetime(2026, 3, 1, 6, 30, 15, 123456)
+    for d in range(DIGESTS):
+        digest = Digest(edition='morning' if d % 2 else 'evening', date=now - timedelta(hours=12 * d),
+                        is_published=True)
+        db.add(digest)
+        db.flush()
+        db.add_all([
+            Article(
+                title=f'Notícia {d}-{a} — “quoted”', url=f'https://example.com/{d}/{a}', source='Público',
+                category=f'Category {a % 3}', digest_id=digest.id,
+                description=None if a % 2 else f'Description {d}-{a}',
+                published_date=None if a % 3 == 0 else now - timedelta(minutes=a),
+                metadata_json={'score': a / 3, 'tags': ['pt', 'tech']},
+            )
+            for a in range(ARTICLES_PER_DIGEST)
+        ])
+    db.flush()
+    article_ids = [article_id for (article_id,) in db.query(Article.id).order_by(Article.id).limit(SAVED)]
+    db.execute(user_saved_articles.insert(), [
+        {'user_id': user.id, 'article_id': article_id, 'saved_at': now - timedelta(seconds=i // 2)}
+        for i, article_id in enumerate(article_ids)
+    ])
+    db.commit()
+    latest_id = db.query(Digest.id).order_by(Digest.date.desc()).first()[0]
+    token = create_access_token({'sub': user.email, 'uid': user.id})
+    db.close()
+    return {'latest_id': latest_id, 'article_id': article_ids[0], 'token': token}
+
+
+def fetch(client, monkeypatch, fast: bool, path: str, token: str):
+    monkeypatch.setattr(settings, 'FAST_JSON_RESPONSES', fast)
+    get_digest_cache().clear()  # render the digest body in this mode, too
+    responses = [client.get(path, headers={'Authorization': f'Bearer {token}'})]
+    # Walk the remaining pages by cursor, so cursors are compared as clients use them
+    while responses[-1].headers.get('X-Next-Cursor'):
+        cursor = responses[-1].headers['X-Next-Cursor']
+        responses.append(client.get(f'{path}&cursor={cursor}', headers={'Authorization': f'Bearer {token}'}))
+    return responses
+
+
+def comparable_headers(response) -> dict:
+    return {name: value for name, value in response.headers.items() if name != 'content-length'}
+
+
+@pytest.mark.parametrize('path, schema', READ_ENDPOINTS, ids=[path for path, _ in READ_ENDPOINTS])
+def test_fast_responses_match_the_response_model_path(client, seeded, monkeypatch, path, schema):
+    path = path.format(**seeded)
+    standard = fetch(client, monkeypatch, False, path, seeded['token'])
+    fast = fetch(client, monkeypatch, True, path, seeded['token'])
+
+    assert len(fast) == len(standard)
+    for expected, actual in zip(standard, fast):
+        assert expected.status_code == 200
+        assert actual.status_code == expected.status_code
+        assert actual.json() == expected.json()
+        assert comparable_headers(actual) == comparable_headers(expected)
+        parse_obj_as(schema, actual.json())
+
+
+def test_pagination_covers_every_row(client, seeded, monkeypatch):
+    digest_pages = fetch(client, monkeypatch, True, '/api/v1/digests/?limit=2', seeded['token'])
+    saved_pages = fetch(client, monkeypatch, True, '/api/v1/articles/saved?limit=3', seeded['token'])
+
+    assert len(digest_pages) > 1 and len(saved_pages) > 1
+    assert len({digest['id'] for page in digest_pages for digest in page.json()}) == DIGESTS
+    assert len({article['id'] for page in saved_pages for article in page.json()}) == SAVED
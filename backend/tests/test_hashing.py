@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.hashing import HashingExecutor, HashingOverloaded
+
+
+def test_cancelled_caller_keeps_its_slot_until_the_hash_finishes():
+    executor = HashingExecutor(max_workers=1, max_queue=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+        return 'hashed'
+
+    async def scenario():
+        request = asyncio.ensure_future(executor.run(slow_hash))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        request.cancel()  # client disconnected mid-hash
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+        with pytest.raises(HashingOverloaded):
+            await executor.run(str, 'next')
+
+        release.set()
+        for _ in range(500):
+            try:
+                assert await executor.run(str, 'next') == 'next'
+                return
+            except HashingOverloaded:
+                await asyncio.sleep(0.01)
+        pytest.fail("slot was never released after the hash finished")
+
+    asyncio.run(scenario())
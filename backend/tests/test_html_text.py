@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from app.services.curation import CurationService
+from app.services.html_text import html_to_text
+from benchmarks.synthetic import make_description, make_title
+
+SAMPLES = [
+    '<p>Plain <b>bold</b> text</p>',
+    '<p>Fish&nbsp;&amp;&nbsp;chips</p>',
+    '<p>Price:&nbsp;10&nbsp;EUR &nbsp; today</p>',
+    '<p>&nbsp;Leading and trailing&nbsp;</p>',
+    '<div>One</div>\n<div>Two</div>',
+    '<p>Quote &ldquo;here&rdquo; &mdash; and &#8217;apostrophe&#x27;s</p>',
+    '<script>var a = "<b>x</b>";</script><style>p { color: red; }</style><p>Visible</p>',
+    '<![CDATA[Inside CDATA]]> after',
+    '<p>A <a href="https://example.com">link</a>, then more.</p>',
+    'No markup at all',
+]
+
+
+@pytest.fixture(scope='module')
+def soup():
+    return CurationService(db=None).clean_html_soup
+
+
+@pytest.mark.parametrize('html', SAMPLES)
+def test_matches_beautifulsoup_on_samples(html, soup):
+    assert html_to_text(html) == soup(html)
+
+
+def test_matches_beautifulsoup_on_synthetic_descriptions(soup):
+    rng = random.Random(7)
+    for _ in range(200):
+        html = make_description(rng, make_title(rng))
+        assert html_to_text(html) == soup(html)
+
+
+def test_keeps_non_breaking_spaces():
+    assert html_to_text('<p>10&nbsp;EUR</p>') == '10\xa0EUR'
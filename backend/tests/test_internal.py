@@ -0,0 +1,40 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def internal_token(monkeypatch):
+    monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', 'operator-secret')
+    return 'operator-secret'
+
+
+def test_hashing_stats_are_disabled_without_a_configured_token(monkeypatch):
+    monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', '')
+    assert client.get('/internal/hashing').status_code == 404
+    assert client.get('/internal/hashing', headers={'X-Internal-Token': ''}).status_code == 404
+
+
+def test_hashing_stats_require_the_token(internal_token):
+    assert client.get('/internal/hashing').status_code == 401
+    assert client.get('/internal/hashing', headers={'X-Internal-Token': 'guess'}).status_code == 401
+
+    response = client.get('/internal/hashing', headers={'X-Internal-Token': internal_token})
+    assert response.status_code == 200
+    assert 'bcrypt_rounds' in response.json()
+
+
+def test_db_pool_stats_sit_behind_the_same_guard(monkeypatch, internal_token):
+    assert client.get('/internal/db-pool').status_code == 401
+    assert client.get('/internal/db-pool', headers={'X-Internal-Token': 'guess'}).status_code == 401
+
+    response = client.get('/internal/db-pool', headers={'X-Internal-Token': internal_token})
+    assert response.status_code == 200
+    assert set(response.json()) == {'sync', 'async'}
+
+    monkeypatch.setattr(settings, 'INTERNAL_API_TOKEN', '')
+    assert client.get('/internal/db-pool', headers={'X-Internal-Token': internal_token}).status_code == 404
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.models.models import CurationJob
+from app.services.jobs import claim_next_job, enqueue_curation, heartbeat, requeue_stale_jobs
+
+
+def stall(db, job):
+    """Make a running job look like its worker died"""
+    job.started_at = job.heartbeat_at = datetime.utcnow() - timedelta(seconds=settings.JOB_TIMEOUT_SECONDS + 1)
+    db.commit()
+
+
+def test_stale_job_is_requeued_with_backoff(session_factory):
+    db = session_factory()
+    job = enqueue_curation(db, 'morning')
+    claim_next_job(db)
+    stall(db, job)
+
+    assert requeue_stale_jobs(db) == 1
+    db.refresh(job)
+    assert job.status == 'pending'
+    assert job.error
+    assert job.run_after > datetime.utcnow() + timedelta(seconds=settings.CURATION_RETRY_BACKOFF_SECONDS / 2)
+
+
+def test_stale_job_fails_at_the_retry_cap(session_factory):
+    db = session_factory()
+    job = enqueue_curation(db, 'morning')
+    for attempt in range(settings.CURATION_MAX_ATTEMPTS):
+        job.run_after = datetime.utcnow() - timedelta(seconds=1)
+        db.commit()
+        assert claim_next_job(db).id == job.id
+        stall(db, job)
+        requeue_stale_jobs(db)
+        db.refresh(job)
+
+    assert job.status == 'failed'
+    assert job.attempts == settings.CURATION_MAX_ATTEMPTS
+    assert job.finished_at is not None
+    assert claim_next_job(db) is None
+    assert db.query(CurationJob).count() == 1
+
+
+def test_job_with_a_live_heartbeat_is_not_requeued(session_factory):
+    db = session_factory()
+    job = enqueue_curation(db, 'morning')
+    claim_next_job(db)
+    stall(db, job)
+    assert heartbeat(db, job.id)
+
+    assert requeue_stale_jobs(db) == 0
+    db.refresh(job)
+    assert job.status == 'running'
+    assert job.attempts == 1
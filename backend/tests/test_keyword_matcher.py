@@ -0,0 +1,58 @@
+import pytest
+
+from app.services.keyword_matcher import PAYWALL_TAG, KeywordMatcher, build_rules, exclude_tag
+from app.services.news_sources import CATEGORY_KEYWORDS, PAYWALL_INDICATORS
+
+
+def loop_matches_category(text, rule):
+    """The per-keyword loop matches_category_filter used before the single-pass matcher"""
+    combined = text.lower()
+    return (any(kw in combined for kw in rule['include'])
+            and not any(ex in combined for ex in rule.get('exclude', [])))
+
+
+def loop_is_paywalled(text):
+    return any(indicator in text.lower() for indicator in PAYWALL_INDICATORS)
+
+
+TEXTS = [
+    '',
+    'Lisbon unveils new housing plan',
+    'LISBON UNVEILS NEW HOUSING PLAN',
+    'Real Madrid beat Bayern in the Champions League',
+    'Chiefs win as the NFL draft nears',
+    'Premier League football: Arsenal top the table',  # football, excluded from US Football
+    'Machine learning on the iMac',  # 'mac' inside words, as the loop matched it
+    'Taxi strike in Porto',  # 'tax' and 'porto' as substrings
+    'Germans debate the Deutsche Bahn strike',
+    'Moving to España as a US citizen',
+    'ESPAÑA aprueba nuevas reglas',
+    'A subscriber-only Exclusive: sign up to read more',
+    'Register to continue reading',
+    'The pitcher threw a home-run ball in the ninth innings',
+    'Three-pointer at the buzzer sends the Celtics to the finals',
+    'Relocating remote workers: a workflow for expatriates',
+    'Ios-like widgets and macOS automation with Claude',
+    'Nothing relevant here at all',
+]
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return KeywordMatcher(build_rules())
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_matches_the_per_keyword_loop(text, matcher):
+    tags = matcher.scan(text)
+    for category, rule in CATEGORY_KEYWORDS.items():
+        matched = category in tags and exclude_tag(category) not in tags
+        assert matched == loop_matches_category(text, rule), category
+    assert (PAYWALL_TAG in tags) == loop_is_paywalled(text)
+
+
+def test_overlapping_keywords_report_every_tag():
+    # 'ab' is only found inside the longer 'abc' match at the same position
+    matcher = KeywordMatcher({'long': ['abc'], 'short': ['ab'], 'tail': ['c']})
+    assert matcher.scan('xABCx') == {'long', 'short', 'tail'}
+    assert matcher.scan('xabx') == {'short'}
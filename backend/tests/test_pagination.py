@@ -0,0 +1,91 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api import pagination
+from app.api.endpoints import articles
+from app.core.principal import principal_cache
+from app.core.security import create_access_token
+from app.models.models import Article, User, user_saved_articles
+
+SAVED = 55
+BASE = datetime(2026, 3, 1, 6, 30, 15, 123456)
+
+
+@pytest.fixture
+def reader(session_factory):
+    """A reader with SAVED saved articles; saves come in pairs sharing one saved_at"""
+    principal_cache.clear()
+    db = session_factory()
+    user = User(email='reader@example.com', hashed_password='x', is_active=True)
+    db.add(user)
+    db.add_all([
+        Article(title=f'Story {i}', url=f'https://example.com/{i}', source='Reuters', category='World')
+        for i in range(SAVED)
+    ])
+    db.flush()
+    article_ids = [article_id for (article_id,) in db.query(Article.id).order_by(Article.id)]
+    db.execute(user_saved_articles.insert(), [
+        {'user_id': user.id, 'article_id': article_id, 'saved_at': BASE - timedelta(seconds=i // 2)}
+        for i, article_id in enumerate(article_ids)
+    ])
+    db.commit()
+    # Newest save first, higher article id first among equal saved_at
+    expected = [article_id for _, article_id in sorted(
+        ((BASE - timedelta(seconds=i // 2), article_id) for i, article_id in enumerate(article_ids)),
+        reverse=True,
+    )]
+    token = create_access_token({'sub': user.email, 'uid': user.id})
+    db.close()
+    yield {'Authorization': f'Bearer {token}'}, expected
+    principal_cache.clear()
+
+
+def test_cursor_round_trip():
+    key = (BASE, 42)
+    assert pagination.decode_cursor(pagination.encode_cursor(key)) == key
+    assert pagination.decode_cursor(None) is None
+
+
+# not base64, no separator, a date without an id, an id that is not a number, neither part valid
+@pytest.mark.parametrize('cursor', ['not-a-cursor!', 'bm9wZQ', 'MjAyNi0wMy0wMQ', 'MjAyNi0wMy0wMXx4', 'eHx5'])
+def test_malformed_cursor_is_a_400(client, reader, cursor):
+    headers, _ = reader
+    response = client.get(f'/api/v1/articles/saved?cursor={cursor}', headers=headers)
+    assert response.status_code == 400
+    assert response.json()['detail'] == 'Invalid cursor'
+
+
+def test_default_page_size_is_50(client, reader):
+    headers, expected = reader
+    response = client.get('/api/v1/articles/saved', headers=headers)
+    assert [article['id'] for article in response.json()] == expected[:50]
+    assert pagination.NEXT_CURSOR_HEADER in response.headers
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, SAVED])
+def test_pages_break_saved_at_ties_by_id(client, reader, limit):
+    headers, expected = reader
+    seen, cursor, pages = [], '', 0
+    while True:
+        response = client.get(f'/api/v1/articles/saved?limit={limit}&cursor={cursor}', headers=headers)
+        assert response.status_code == 200
+        seen.extend(article['id'] for article in response.json())
+        pages += 1
+        cursor = response.headers.get(pagination.NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+
+    assert seen == expected
+    assert pages == -(-SAVED // limit)  # the last full page carries no cursor
+
+
+def test_export_streams_every_saved_article_in_order(client, reader, session_factory, monkeypatch):
+    headers, expected = reader
+    monkeypatch.setattr(articles, 'SessionLocal', session_factory)
+    monkeypatch.setattr(articles, 'EXPORT_BATCH_SIZE', 4)
+
+    response = client.get('/api/v1/articles/saved/export', headers=headers)
+    assert response.status_code == 200
+    assert [json.loads(line)['id'] for line in response.text.splitlines()] == expected
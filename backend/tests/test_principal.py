@@ -0,0 +1,55 @@
+import pytest
+
+from app.core.principal import principal_cache
+from app.core.security import create_access_token
+from app.models.models import User
+
+
+@pytest.fixture
+def user(session_factory):
+    principal_cache.clear()
+    db = session_factory()
+    user = User(email='reader@example.com', hashed_password='x', is_active=True)
+    db.add(user)
+    db.commit()
+    yield db, user
+    db.close()
+    principal_cache.clear()
+
+
+def me(client, token):
+    return client.get('/api/v1/auth/me', headers={'Authorization': f'Bearer {token}'})
+
+
+def test_deactivating_a_user_evicts_the_cached_principal(client, user):
+    db, user = user
+    token = create_access_token({'sub': user.email, 'uid': user.id})
+    assert me(client, token).status_code == 200
+    assert principal_cache.get(token) is not None
+
+    user.is_active = False
+    db.commit()
+
+    assert principal_cache.get(token) is None
+    assert me(client, token).status_code == 401
+    assert principal_cache.get(token) is None
+
+
+def test_deleting_a_user_evicts_the_cached_principal(client, user):
+    db, user = user
+    token = create_access_token({'sub': user.email, 'uid': user.id})
+    assert me(client, token).status_code == 200
+
+    db.delete(user)
+    db.commit()
+
+    assert principal_cache.get(token) is None
+    assert me(client, token).status_code == 401
+
+
+def test_inactive_users_are_rejected(client, user):
+    db, user = user
+    user.is_active = False
+    db.commit()
+
+    assert me(client, create_access_token({'sub': user.email, 'uid': user.id})).status_code == 401
@@ -0,0 +1,96 @@
+"""
+Digest read endpoints must issue a constant number of queries
+
+Seeds an in-memory database at several sizes (digests per page, articles per
+digest, saved articles per user) and counts the SQL statements each endpoint
+runs; the counts must not grow with the data.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import pytest
+from fastapi import Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api.endpoints.digests import get_digest, get_digests, get_latest_digest
+from app.models.models import Article, Base, Digest, User, user_saved_articles
+from app.services.digest_cache import get_digest_cache
+
+SIZES = [(2, 5, 0), (10, 30, 20), (40, 150, 500)]  # (digests, articles per digest, saved articles)
+
+
+@contextmanager
+def count_queries(engine, counter: List[int]):
+    def before_cursor_execute(*args):
+        counter[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def seed(db, digests: int, articles_per_digest: int, saved: int) -> User:
+    user = User(email='reader@example.com', hashed_password='x')
+    db.add(user)
+    now = datetime.utcnow()
+    for d in range(digests):
+        digest = Digest(edition='morning', date=now - timedelta(hours=d), is_published=True)
+        db.add(digest)
+        db.flush()
+        db.bulk_insert_mappings(Article, [
+            {
+                'title': f'Article {d}-{a}', 'url': f'https://example.com/{d}/{a}',
+                'source': 'Example', 'category': f'Category {a % 5}', 'digest_id': digest.id,
+            }
+            for a in range(articles_per_digest)
+        ])
+    db.flush()
+    article_ids = [article_id for (article_id,) in db.query(Article.id).limit(saved).all()]
+    if article_ids:
+        db.execute(user_saved_articles.insert(), [
+            {'user_id': user.id, 'article_id': article_id, 'saved_at': now} for article_id in article_ids
+        ])
+    db.commit()
+    return user
+
+
+def measure(digests: int, articles_per_digest: int, saved: int) -> Dict[str, int]:
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = seed(db, digests, articles_per_digest, saved)
+    latest_id = db.query(Digest.id).order_by(Digest.date.desc()).first()[0]
+    db.expire_all()
+
+    # Digest ids repeat across the fresh databases, so start each size with a cold cache
+    get_digest_cache().clear()
+    calls = {
+        'get_digests': lambda: get_digests(Response(), cursor=None, limit=digests, skip=0, current_user=user, db=db),
+        'get_latest_digest': lambda: get_latest_digest('morning', current_user=user, db=db),  # renders
+        'get_digest': lambda: get_digest(latest_id, current_user=user, db=db),  # cache hit
+    }
+    counts = {}
+    for name, call in calls.items():
+        user = db.query(User).first()  # authentication happens outside the count
+        counter = [0]
+        with count_queries(engine, counter):
+            call()
+        counts[name] = counter[0]
+        db.expire_all()
+    db.close()
+    return counts
+
+
+@pytest.fixture(scope='module')
+def counts_by_size() -> List[Dict[str, int]]:
+    return [measure(*size) for size in SIZES]
+
+
+@pytest.mark.parametrize('endpoint', ['get_digests', 'get_latest_digest', 'get_digest'])
+def test_query_count_is_constant(counts_by_size, endpoint):
+    counts = {size: by_endpoint[endpoint] for size, by_endpoint in zip(SIZES, counts_by_size)}
+    assert len(set(counts.values())) == 1, f"query count grows with data: {counts}"
@@ -0,0 +1,170 @@
+"""
+Endpoint queries must be served by indexes, not full scans
+
+Migrates a scratch database to head, seeds it with a large synthetic data set,
+then EXPLAINs the statements behind the hot endpoints: no plan may read one of
+the hot tables with a sequential (full) scan.
+
+PostgreSQL is what matters in production; by default a temp SQLite file
+checks the same indexes with its own planner. To check PostgreSQL, point
+QUERY_PLANS_DATABASE_URL at an empty scratch database (never one that holds
+real data):
+
+    QUERY_PLANS_DATABASE_URL=postgresql://user:pw@localhost/plans pytest tests/test_query_plans.py
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Connection
+
+from app.api.endpoints.articles import article_statement, is_saved_statement, saved_articles_statement
+from app.api.endpoints.auth import user_statement
+from app.api.endpoints.digests import (
+    article_counts_statement, digest_page_statement, latest_digest_statement,
+    published_digest_statement, saved_ids_statement,
+)
+from app.db.schema import migrate
+from app.models.models import Article, Digest, User, user_saved_articles
+from app.services.digest_cache import digest_articles_statement
+
+HOT_TABLES = {'users', 'digests', 'articles', 'user_saved_articles'}
+BATCH = 5000
+USERS, DIGESTS, ARTICLES_PER_DIGEST, SAVED_PER_USER = 5000, 1500, 60, 40
+
+pytestmark = pytest.mark.slow
+
+
+def insert_batches(conn: Connection, table, rows) -> None:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH:
+            conn.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        conn.execute(table.insert(), batch)
+
+
+def seed(conn: Connection, users: int, digests: int, articles_per_digest: int, saved_per_user: int) -> None:
+    now = datetime(2026, 1, 1)
+    insert_batches(conn, User.__table__, (
+        {'id': u + 1, 'email': f'reader{u}@example.com', 'hashed_password': 'x', 'is_active': True}
+        for u in range(users)
+    ))
+    insert_batches(conn, Digest.__table__, (
+        {'id': d + 1, 'edition': 'morning' if d % 2 else 'evening',
+         'date': now - timedelta(hours=12 * d), 'is_published': d % 20 != 0}
+        for d in range(digests)
+    ))
+    total_articles = digests * articles_per_digest
+    insert_batches(conn, Article.__table__, (
+        {'id': a + 1, 'title': f'Article {a}', 'url': f'https://example.com/{a}', 'source': 'Example',
+         'category': f'Category {a % 7}', 'digest_id': a // articles_per_digest + 1}
+        for a in range(total_articles)
+    ))
+    insert_batches(conn, user_saved_articles, (
+        {'user_id': u + 1, 'article_id': (u * 7919 + s * 104729) % total_articles + 1,
+         'saved_at': now - timedelta(minutes=s)}
+        for u in range(users) for s in range(saved_per_user)
+    ))
+
+
+def plan_parameters(conn: Connection) -> Dict:
+    """Realistic parameters for the endpoint statements, taken from the seeded data"""
+    user_id = conn.execute(select(func.max(User.id))).scalar() // 2
+    digest_id = conn.execute(select(func.max(Digest.id)).where(Digest.is_published == True)).scalar() // 2
+    page = conn.execute(digest_page_statement(10)).all()
+    saved_page = conn.execute(saved_articles_statement(user_id, 20)).all()
+    article_ids = conn.execute(
+        select(Article.id).where(Article.digest_id == digest_id).order_by(Article.id)
+    ).scalars().all()
+    return {
+        'user_id': user_id, 'digest_id': digest_id, 'page': page, 'saved_page': saved_page,
+        'article_ids': article_ids,
+    }
+
+
+# (name, statement built from plan_parameters): what each hot endpoint runs
+ENDPOINT_STATEMENTS = [
+    ('auth: user by id', lambda p: user_statement({'uid': p['user_id'], 'sub': 'reader@example.com'})),
+    ('auth: user by email', lambda p: user_statement({'sub': 'reader1@example.com'})),
+    ('digests: first page', lambda p: digest_page_statement(11)),
+    ('digests: next page', lambda p: digest_page_statement(11, (p['page'][-1].date, p['page'][-1].id))),
+    ('digests: article counts', lambda p: article_counts_statement([row.id for row in p['page']])),
+    ('digests: latest edition', lambda p: latest_digest_statement('morning')),
+    ('digests: by id', lambda p: published_digest_statement(p['digest_id'])),
+    ('digests: render articles', lambda p: digest_articles_statement(p['digest_id'])),
+    ('digests: saved flags', lambda p: saved_ids_statement(p['user_id'], p['article_ids'])),
+    ('articles: saved first page', lambda p: saved_articles_statement(p['user_id'], 51)),
+    ('articles: saved next page', lambda p: saved_articles_statement(
+        p['user_id'], 51, (p['saved_page'][-1].saved_at, p['saved_page'][-1].id))),
+    ('articles: by id', lambda p: article_statement(p['article_ids'][0])),
+    ('articles: is saved', lambda p: is_saved_statement(p['user_id'], p['article_ids'][0])),
+]
+
+
+def full_scans_postgresql(conn: Connection, sql: str) -> Tuple[List[str], str]:
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    scans, steps = [], []
+
+    def walk(node: Dict) -> None:
+        relation = node.get('Relation Name')
+        index = node.get('Index Name')
+        steps.append(node['Node Type'] + (f" on {relation}" if relation else '') + (f" using {index}" if index else ''))
+        if node['Node Type'] == 'Seq Scan' and relation in HOT_TABLES:
+            scans.append(relation)
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan[0]['Plan'])
+    return scans, '; '.join(steps)
+
+
+def full_scans_sqlite(conn: Connection, sql: str) -> Tuple[List[str], str]:
+    rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    scans, steps = [], []
+    for row in rows:
+        detail = row[-1]
+        steps.append(detail)
+        words = detail.split()
+        # "SCAN t" reads the whole table; "SCAN t USING INDEX ..." walks an index in order
+        if words[0] == 'SCAN' and 'USING' not in words and words[1] in HOT_TABLES:
+            scans.append(words[1])
+    return scans, '; '.join(steps)
+
+
+@pytest.fixture(scope='module')
+def seeded_engine(tmp_path_factory):
+    database_url = os.getenv('QUERY_PLANS_DATABASE_URL') or \
+        f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}"
+    engine = create_engine(database_url)
+    migrate(engine)
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(Digest)).scalar():
+            pytest.fail("Refusing to seed: the database already has digests. Use a scratch database.")
+        seed(conn, USERS, DIGESTS, ARTICLES_PER_DIGEST, SAVED_PER_USER)
+    with engine.begin() as conn:
+        conn.execute(text('ANALYZE'))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope='module')
+def parameters(seeded_engine) -> Dict:
+    with seeded_engine.connect() as conn:
+        return plan_parameters(conn)
+
+
+@pytest.mark.parametrize('name, build', ENDPOINT_STATEMENTS, ids=[name for name, _ in ENDPOINT_STATEMENTS])
+def test_endpoint_query_is_index_backed(seeded_engine, parameters, name, build):
+    dialect = seeded_engine.dialect
+    full_scans = full_scans_postgresql if dialect.name == 'postgresql' else full_scans_sqlite
+    sql = str(build(parameters).compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    with seeded_engine.connect() as conn:
+        scans, plan = full_scans(conn, sql)
+    assert not scans, f"{name}: full scan of {', '.join(scans)}; plan: {plan}"
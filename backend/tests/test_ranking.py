@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from app.services.ranking import RankingEngine
+
+
+def reference_top_k(scores, candidates, k):
+    positions = sorted(range(len(candidates)), key=lambda p: (-scores[candidates[p]], p))
+    return [candidates[p] for p in positions[:k]]
+
+
+@pytest.mark.parametrize('k', [0, 1, 100, 199, 200, 250])
+@pytest.mark.parametrize('candidates', [list(range(200)), list(range(199, -1, -1)),
+                                        np.random.default_rng(3).permutation(200).tolist()],
+                         ids=['ascending', 'descending', 'shuffled'])
+def test_top_k_ties_keep_input_order(k, candidates):
+    scores = np.ones(200)
+    assert RankingEngine.top_k(scores, candidates, k) == candidates[:k]
+
+
+def test_top_k_matches_a_stable_sort():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        scores = rng.integers(0, 5, size=60).astype(np.float64)  # many ties
+        candidates = rng.permutation(60)[:rng.integers(1, 60)].tolist()
+        k = int(rng.integers(0, 70))
+        assert RankingEngine.top_k(scores, candidates, k) == reference_top_k(scores, candidates, k)
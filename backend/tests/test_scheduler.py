@@ -0,0 +1,54 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.core.config import settings
+from app.models.models import CurationJob
+from app.services.jobs import enqueue_curation
+from app.services.scheduler import EditionScheduler, LeaderLock, edition_at, edition_date
+
+# 19:30 on 16 October in edition time (UTC-5), already 17 October in UTC
+AFTER_UTC_MIDNIGHT = datetime(2026, 10, 17, 0, 30)
+
+
+@pytest.fixture(autouse=True)
+def edition_time(monkeypatch):
+    monkeypatch.setattr(settings, 'EDITION_UTC_OFFSET_HOURS', -5.0)
+    monkeypatch.setattr(settings, 'MORNING_CURATION_HOUR', 6)
+    monkeypatch.setattr(settings, 'EVENING_CURATION_HOUR', 18)
+
+
+@pytest.mark.parametrize('now, edition, day', [
+    (datetime(2026, 10, 16, 10, 59), 'evening', date(2026, 10, 16)),  # 05:59 local, yesterday's evening
+    (datetime(2026, 10, 16, 11, 0), 'morning', date(2026, 10, 16)),
+    (datetime(2026, 10, 16, 22, 59), 'morning', date(2026, 10, 16)),
+    (datetime(2026, 10, 16, 23, 0), 'evening', date(2026, 10, 16)),
+    (AFTER_UTC_MIDNIGHT, 'evening', date(2026, 10, 16)),
+    (datetime(2026, 10, 17, 4, 59), 'evening', date(2026, 10, 16)),
+    (datetime(2026, 10, 17, 5, 0), 'evening', date(2026, 10, 17)),
+])
+def test_edition_and_date_follow_edition_time(now, edition, day):
+    assert edition_at(now) == edition
+    assert edition_date(now) == day
+
+
+def test_publish_time_is_the_edition_time_hour_in_utc(engine):
+    scheduler = EditionScheduler(lock=LeaderLock(engine))
+    assert scheduler.publish_time('morning', AFTER_UTC_MIDNIGHT) == datetime(2026, 10, 16, 11, 0)
+    assert scheduler.publish_time('evening', AFTER_UTC_MIDNIGHT) == datetime(2026, 10, 16, 23, 0)
+
+
+def test_scheduled_and_on_demand_builds_share_one_job(engine, session_factory):
+    scheduler = EditionScheduler(session_factory, lock=LeaderLock(engine), now=lambda: AFTER_UTC_MIDNIGHT)
+    scheduler.run_pending()
+
+    db = session_factory()
+    scheduled = db.query(CurationJob).filter(CurationJob.edition == 'evening').one()
+    assert scheduled.run_date == date(2026, 10, 16)
+    assert enqueue_curation(db, 'evening', edition_date(AFTER_UTC_MIDNIGHT)).id == scheduled.id
+
+
+def test_on_demand_builds_default_to_the_edition_date(session_factory):
+    db = session_factory()
+    job = enqueue_curation(db, 'morning')
+    assert job.run_date == edition_date()
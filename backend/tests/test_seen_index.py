@@ -0,0 +1,26 @@
+from app.models.models import SeenItem
+from app.services.seen_index import SeenIndex
+
+
+def test_known_keys_include_keys_recorded_by_another_process(session_factory):
+    publisher, reader = SeenIndex(1000), SeenIndex(1000)
+    publisher_db, reader_db = session_factory(), session_factory()
+    assert reader.known_keys(reader_db, ['u:a']) == set()  # reader's filter is loaded, and empty
+
+    publisher.record(publisher_db, [('u:a', 'url'), ('t:b', 'title')])
+    publisher_db.commit()
+
+    assert reader.known_keys(reader_db, ['u:a', 't:b', 'u:c']) == {'u:a', 't:b'}
+
+
+def test_record_skips_keys_already_stored_by_another_process(session_factory):
+    publisher, stale = SeenIndex(1000), SeenIndex(1000)
+    publisher_db, stale_db = session_factory(), session_factory()
+    stale.known_keys(stale_db, ['u:a'])
+
+    assert publisher.record(publisher_db, [('u:a', 'url')]) == 1
+    publisher_db.commit()
+    assert stale.record(stale_db, [('u:a', 'url'), ('u:c', 'url'), ('u:c', 'url')]) == 1
+    stale_db.commit()
+
+    assert sorted(key for (key,) in session_factory().query(SeenItem.key)) == ['u:a', 'u:c']
@@ -46,8 +46,9 @@ export const authAPI = {
 
 // Digests API
 export const digestsAPI = {
-  getDigests: (limit = 10, skip = 0) => 
-    api.get(`/digests/?limit=${limit}&skip=${skip}`),
+  // Pages are keyset-paginated: pass the previous response's x-next-cursor header
+  getDigests: (limit = 10, cursor = null) => 
+    api.get('/digests/', { params: { limit, ...(cursor && { cursor }) } }),
   getDigest: (id) => api.get(`/digests/${id}`),
   getLatestDigest: (edition) => api.get(`/digests/latest/${edition}`),
   getTodaysDigest: () => api.get(`/digests/today`),
@@ -60,7 +61,21 @@ export const articlesAPI = {
     api.post('/articles/save', { article_id: articleId }),
   unsaveArticle: (articleId) => 
     api.delete(`/articles/save/${articleId}`),
-  getSavedArticles: () => api.get('/articles/saved'),
+  getSavedArticlesPage: (cursor = null, limit = 100) => 
+    api.get('/articles/saved', { params: { limit, ...(cursor && { cursor }) } }),
+  // Follows the pagination cursor to return the whole list as { data }
+  getSavedArticles: async () => {
+    const data = [];
+    let cursor = null;
+    do {
+      const response = await articlesAPI.getSavedArticlesPage(cursor);
+      data.push(...response.data);
+      cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return { data };
+  },
+  exportSavedArticles: () => 
+    api.get('/articles/saved/export', { responseType: 'blob' }),
   getArticle: (id) => api.get(`/articles/${id}`),
 };
 